@@ -13,15 +13,60 @@ Production Deployment:
     Use gunicorn or waitress for production serving:
     pip install gunicorn
     gunicorn -w 4 -b 0.0.0.0:5000 error_server:app
+
+Database access:
+    Each worker process (and thread) keeps one persistent SQLite connection in WAL
+    mode, so readers never block the writer and workers don't reopen the database
+    per request. Writes run in short BEGIN IMMEDIATE transactions that are retried
+    if another worker holds the write lock. Measure with load_test.py.
+
+    error_reports holds summary columns only. Report payloads (widget trees, console
+    buffers, ...) are stored per top-level section, gzip-compressed, in
+    report_payloads and decoded only when a detail view asks for that section.
+
+Ingestion:
+    POST /api/report validates, queues and answers 202 with an ingest_id (the row's
+    report_id is available from /api/reports/ingest/<ingest_id> once written). A writer
+    thread per worker inserts reports in batched transactions. A full queue
+    answers 503 + Retry-After; see /api/ingest/stats.
+
+    Uploads are streamed to disk and hashed while the request body is parsed, then
+    stored once per distinct content under uploads/objects/ with a reference count.
+
+Error signatures:
+    Each report is fingerprinted at ingest from its exception type and top stack
+    frames (line numbers, paths and volatile tokens stripped). signature_rollups
+    keeps hourly counts per (version bucket, signature), so /api/errors/top and the
+    dashboard never scan error_reports.
+
+Performance telemetry:
+    Clients aggregate timings into log-bucket histograms (lib/metrics.py) and send
+    them in batches to /api/telemetry/batch. Buckets are merged per hour, model and
+    version bucket, so /api/metrics/percentiles reads bucket rows, not raw samples.
 """
 
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, Request, Response, request, jsonify, render_template_string, send_file, stream_with_context
 from flask_cors import CORS
 import sqlite3
 import json
 import os
-from datetime import datetime
+import atexit
+import collections
+import hashlib
+import shutil
+import tempfile
+import random
+import threading
+import time
+import uuid
+import base64
+import binascii
+import gzip
+import re
+import zlib
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for cross-origin requests
@@ -30,17 +75,38 @@ CORS(app)  # Enable CORS for cross-origin requests
 DB_PATH = Path(__file__).parent / 'error_reports.db'
 UPLOAD_FOLDER = Path(__file__).parent / 'uploads'
 UPLOAD_FOLDER.mkdir(exist_ok=True)
+UPLOAD_OBJECTS_FOLDER = UPLOAD_FOLDER / 'objects'   # Content-addressed: objects/<sha[:2]>/<sha>
+UPLOAD_TMP_FOLDER = UPLOAD_FOLDER / 'tmp'           # Uploads stream here first (same filesystem)
 
 # Maximum upload size (10MB)
 app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024
 
+# SQLite tuning
+BUSY_TIMEOUT_MS = 5000       # Wait this long for a lock inside SQLite before raising "busy"
+WRITE_RETRIES = 5            # Extra attempts for a write that still hit a busy database
+WRITE_RETRY_BASE_DELAY = 0.02
+STATEMENT_CACHE_SIZE = 256   # Prepared statements kept per connection
 
-def init_database():
-    """Initialize SQLite database with schema"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",           # Readers don't block the writer (persists in the db file)
+    "PRAGMA synchronous=NORMAL",         # Safe with WAL; fsync only at checkpoints
+    f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}",
+    "PRAGMA cache_size=-16000",          # 16 MB page cache per connection
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=134217728",        # 128 MB memory-mapped reads
+)
 
-    cursor.execute('''
+
+# ============================================================================
+# DATABASE CONNECTION LAYER
+# ============================================================================
+
+# Schema migrations, applied in order; PRAGMA user_version records the last one applied.
+# Each entry is (version, statements). Statements in OPTIONAL_MIGRATION_STEPS may fail
+# on SQLite builds without the feature (e.g. FTS5) - the server then falls back.
+MIGRATIONS = [
+    (1, [
+        '''
         CREATE TABLE IF NOT EXISTS error_reports (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             timestamp TEXT NOT NULL,
@@ -53,10 +119,1176 @@ def init_database():
             answer_display_path TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
-    ''')
+        ''',
+    ]),
+    (2, [
+        # Listing order + filters (id breaks created_at ties for keyset pagination)
+        'CREATE INDEX IF NOT EXISTS idx_reports_created ON error_reports (created_at, id)',
+        'CREATE INDEX IF NOT EXISTS idx_reports_version ON error_reports (version, created_at, id)',
+        'CREATE INDEX IF NOT EXISTS idx_reports_os ON error_reports (os_info, created_at, id)',
+
+        # Row count maintained by triggers, so listing never runs COUNT(*) over the table
+        '''
+        CREATE TABLE IF NOT EXISTS report_stats (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        )
+        ''',
+        "INSERT OR REPLACE INTO report_stats (key, value) VALUES ('total', (SELECT COUNT(*) FROM error_reports))",
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_reports_count_insert AFTER INSERT ON error_reports BEGIN
+            UPDATE report_stats SET value = value + 1 WHERE key = 'total';
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_reports_count_delete AFTER DELETE ON error_reports BEGIN
+            UPDATE report_stats SET value = value - 1 WHERE key = 'total';
+        END
+        ''',
+
+        # Substring search over error messages (trigram tokenizer = any 3+ char substring)
+        '''
+        CREATE VIRTUAL TABLE IF NOT EXISTS error_reports_fts USING fts5(
+            error_message, content='error_reports', content_rowid='id', tokenize='trigram'
+        )
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_reports_fts_insert AFTER INSERT ON error_reports BEGIN
+            INSERT INTO error_reports_fts (rowid, error_message) VALUES (new.id, new.error_message);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_reports_fts_delete AFTER DELETE ON error_reports BEGIN
+            INSERT INTO error_reports_fts (error_reports_fts, rowid, error_message)
+            VALUES ('delete', old.id, old.error_message);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_reports_fts_update AFTER UPDATE OF error_message ON error_reports BEGIN
+            INSERT INTO error_reports_fts (error_reports_fts, rowid, error_message)
+            VALUES ('delete', old.id, old.error_message);
+            INSERT INTO error_reports_fts (rowid, error_message) VALUES (new.id, new.error_message);
+        END
+        ''',
+        "INSERT INTO error_reports_fts (error_reports_fts) VALUES ('rebuild')",
+    ]),
+    (3, [
+        # Report payloads (widget trees, HTML exports, console buffers...) live outside
+        # the hot table, one compressed row per top-level section
+        '''
+        CREATE TABLE IF NOT EXISTS report_payloads (
+            report_id INTEGER NOT NULL,
+            section TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            encoding TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            data BLOB NOT NULL,
+            PRIMARY KEY (report_id, section)
+        ) WITHOUT ROWID
+        ''',
+        # Sections go with their report (they hold most of the stored bytes)
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_reports_payload_delete AFTER DELETE ON error_reports BEGIN
+            DELETE FROM report_payloads WHERE report_id = old.id;
+        END
+        ''',
+        lambda conn: migrate_full_reports(conn),
+    ]),
+    (4, [
+        # Reports are acknowledged before they are inserted; clients get this id instead
+        'ALTER TABLE error_reports ADD COLUMN ingest_id TEXT',
+        'CREATE UNIQUE INDEX IF NOT EXISTS idx_reports_ingest ON error_reports (ingest_id)',
+    ]),
+    (5, [
+        # Deduplicated uploads: one file per distinct content, shared by every report using it
+        '''
+        CREATE TABLE IF NOT EXISTS upload_objects (
+            sha256 TEXT PRIMARY KEY,
+            path TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            content_type TEXT,
+            refcount INTEGER NOT NULL DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        # One reference per upload column (both screenshots may share one object)
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_reports_upload_release AFTER DELETE ON error_reports BEGIN
+            UPDATE upload_objects SET refcount = refcount - 1 WHERE path = old.screenshot_path;
+            UPDATE upload_objects SET refcount = refcount - 1 WHERE path = old.answer_display_path;
+        END
+        ''',
+    ]),
+    (6, [
+        # Error grouping: normalized signature per report + rollups maintained on ingest
+        'ALTER TABLE error_reports ADD COLUMN signature TEXT',
+        'CREATE INDEX IF NOT EXISTS idx_reports_signature ON error_reports (signature, created_at, id)',
+        '''
+        CREATE TABLE IF NOT EXISTS error_signatures (
+            signature TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            first_seen TEXT NOT NULL,
+            last_seen TEXT NOT NULL,
+            total_count INTEGER NOT NULL DEFAULT 0,
+            last_report_id INTEGER
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_signatures_total ON error_signatures (total_count DESC)',
+        # Count per signature per version bucket per hour; keyed hour-first so a time
+        # window is one range scan whose size depends on distinct errors, not reports
+        '''
+        CREATE TABLE IF NOT EXISTS signature_rollups (
+            hour TEXT NOT NULL,
+            version TEXT NOT NULL,
+            signature TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (hour, version, signature)
+        ) WITHOUT ROWID
+        ''',
+        lambda conn: backfill_error_signatures(conn),
+    ]),
+    (7, [
+        # Client performance histograms, merged per hour on arrival (see PERFORMANCE TELEMETRY)
+        '''
+        CREATE TABLE IF NOT EXISTS perf_buckets (
+            metric TEXT NOT NULL,
+            model TEXT NOT NULL,
+            version TEXT NOT NULL,
+            hour TEXT NOT NULL,
+            le REAL NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (metric, hour, model, version, le)
+        ) WITHOUT ROWID
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS perf_series (
+            metric TEXT NOT NULL,
+            model TEXT NOT NULL,
+            version TEXT NOT NULL,
+            hour TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            total REAL NOT NULL DEFAULT 0,
+            min REAL,
+            max REAL,
+            PRIMARY KEY (metric, hour, model, version)
+        ) WITHOUT ROWID
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS perf_counters (
+            name TEXT NOT NULL,
+            model TEXT NOT NULL,
+            version TEXT NOT NULL,
+            hour TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (hour, name, model, version)
+        ) WITHOUT ROWID
+        ''',
+        # Idempotency keys of accepted batches (a retried batch is not counted twice)
+        '''
+        CREATE TABLE IF NOT EXISTS telemetry_batches (
+            batch_key TEXT PRIMARY KEY,
+            client_id TEXT,
+            received_at TEXT NOT NULL
+        ) WITHOUT ROWID
+        ''',
+    ]),
+]
+
+# Statements that need optional SQLite features (matched by substring)
+OPTIONAL_MIGRATION_STEPS = ('error_reports_fts',)
+
+# SQL is kept in constants so every call reuses the connection's prepared statement
+SQL_INSERT_REPORT = '''
+    INSERT OR IGNORE INTO error_reports (
+        ingest_id, timestamp, version, os_info, python_version,
+        error_message, screenshot_path, answer_display_path, created_at, signature
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+SQL_RECORD_SIGNATURE = '''
+    INSERT INTO error_signatures (signature, title, first_seen, last_seen, total_count, last_report_id)
+    VALUES (?, ?, ?, ?, 1, ?)
+    ON CONFLICT (signature) DO UPDATE SET
+        last_seen = max(last_seen, excluded.last_seen),
+        total_count = total_count + 1,
+        last_report_id = excluded.last_report_id
+'''
+
+SQL_RECORD_ROLLUP = '''
+    INSERT INTO signature_rollups (hour, version, signature, count) VALUES (?, ?, ?, 1)
+    ON CONFLICT (hour, version, signature) DO UPDATE SET count = count + 1
+'''
+
+SQL_FIND_BY_INGEST_ID = 'SELECT id FROM error_reports WHERE ingest_id = ?'
+
+SQL_RECORD_BATCH = 'INSERT OR IGNORE INTO telemetry_batches (batch_key, client_id, received_at) VALUES (?, ?, ?)'
+
+SQL_MERGE_BUCKET = '''
+    INSERT INTO perf_buckets (metric, hour, model, version, le, count) VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (metric, hour, model, version, le) DO UPDATE SET count = count + excluded.count
+'''
+
+SQL_MERGE_SERIES = '''
+    INSERT INTO perf_series (metric, hour, model, version, count, total, min, max) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (metric, hour, model, version) DO UPDATE SET
+        count = count + excluded.count,
+        total = total + excluded.total,
+        min = COALESCE(MIN(min, excluded.min), min, excluded.min),
+        max = COALESCE(MAX(max, excluded.max), max, excluded.max)
+'''
+
+SQL_MERGE_COUNTER = '''
+    INSERT INTO perf_counters (hour, name, model, version, count) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (hour, name, model, version) DO UPDATE SET count = count + excluded.count
+'''
+
+SQL_ACQUIRE_UPLOAD = '''
+    INSERT INTO upload_objects (sha256, path, size, content_type, refcount) VALUES (?, ?, ?, ?, 1)
+    ON CONFLICT (sha256) DO UPDATE SET refcount = refcount + 1
+'''
+
+SQL_GET_UPLOAD = 'SELECT path, size, content_type FROM upload_objects WHERE sha256 = ?'
+
+SQL_INSERT_PAYLOAD_SECTION = '''
+    INSERT OR REPLACE INTO report_payloads (report_id, section, position, encoding, size, data)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+SQL_LIST_PAYLOAD_SECTIONS = '''
+    SELECT section, encoding, size, length(data) AS stored_size
+    FROM report_payloads WHERE report_id = ? ORDER BY position
+'''
+
+SQL_GET_PAYLOAD_SECTIONS = '''
+    SELECT section, encoding, data FROM report_payloads WHERE report_id = ? ORDER BY position
+'''
+
+SQL_GET_PAYLOAD_SECTION = '''
+    SELECT encoding, data FROM report_payloads WHERE report_id = ? AND section = ?
+'''
+
+SQL_LIST_COLUMNS = '''
+    SELECT id, timestamp, version, os_info, python_version,
+           error_message, created_at, screenshot_path, answer_display_path
+    FROM error_reports
+'''
+
+SQL_TOTAL_REPORTS = "SELECT value FROM report_stats WHERE key = 'total'"
+
+SQL_GET_REPORT = '''
+    SELECT id, timestamp, version, os_info, python_version, error_message,
+           full_report, created_at, screenshot_path, answer_display_path
+    FROM error_reports WHERE id = ?
+'''
+
+_db_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready_pid = None
+
+
+def _open_connection() -> sqlite3.Connection:
+    """Open a tuned connection (autocommit; transactions are explicit)"""
+    conn = sqlite3.connect(
+        DB_PATH,
+        timeout=BUSY_TIMEOUT_MS / 1000,
+        isolation_level=None,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def get_db() -> sqlite3.Connection:
+    """
+    Get this worker's persistent connection, opening it on first use
+
+    Connections are per process and per thread: gunicorn workers are forked, and
+    a SQLite connection must never be shared across a fork.
+    """
+    conn = getattr(_db_local, 'conn', None)
+    if conn is not None and _db_local.pid == os.getpid():
+        return conn
+
+    init_database()
+    conn = _open_connection()
+    _db_local.conn = conn
+    _db_local.pid = os.getpid()
+    return conn
+
+
+def _is_busy_error(error: sqlite3.OperationalError) -> bool:
+    message = str(error).lower()
+    return 'locked' in message or 'busy' in message
+
+
+def run_write(work):
+    """
+    Run `work(conn)` in a write transaction, retrying if the database is busy
+
+    BEGIN IMMEDIATE takes the write lock up front, so a transaction never fails
+    halfway through on a lock upgrade; busy_timeout covers most contention and
+    the retry loop (with jittered backoff) covers the rest.
+
+    Returns:
+        Whatever `work` returns
+    """
+    conn = get_db()
+    for attempt in range(WRITE_RETRIES + 1):
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+        except sqlite3.OperationalError as e:
+            if not _is_busy_error(e) or attempt == WRITE_RETRIES:
+                raise
+            time.sleep(WRITE_RETRY_BASE_DELAY * (2 ** attempt) * (0.5 + random.random()))
+            continue
+
+        try:
+            result = work(conn)
+            conn.execute('COMMIT')
+            return result
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            raise
+
+
+def init_database():
+    """Initialize SQLite database with schema and apply pending migrations (once per process)"""
+    global _schema_ready_pid, FTS_AVAILABLE
+    with _schema_lock:
+        if _schema_ready_pid == os.getpid():
+            return
+
+        conn = _open_connection()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                current = conn.execute('PRAGMA user_version').fetchone()[0]
+                for version, statements in MIGRATIONS:
+                    if version <= current:
+                        continue
+                    for statement in statements:
+                        try:
+                            if callable(statement):
+                                statement(conn)  # Data migration
+                            else:
+                                conn.execute(statement)
+                        except sqlite3.OperationalError as e:
+                            if callable(statement) or not any(step in statement for step in OPTIONAL_MIGRATION_STEPS):
+                                raise
+                            print(f"⚠️ Optional schema step skipped ({e}) - using fallback")
+                    conn.execute(f'PRAGMA user_version = {version}')
+                    print(f"✓ Database migrated to schema v{version}")
+                conn.execute('COMMIT')
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute('ROLLBACK')
+                raise
+
+            FTS_AVAILABLE = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'error_reports_fts'"
+            ).fetchone() is not None
+        finally:
+            conn.close()
+        _schema_ready_pid = os.getpid()
+
+
+# ============================================================================
+# REPORT QUERIES
+# ============================================================================
+
+FTS_AVAILABLE = False        # Set by init_database (trigram FTS5 index present)
+FTS_MIN_QUERY_LENGTH = 3     # Trigram index needs 3+ characters; shorter uses LIKE
+MAX_PAGE_SIZE = 200
+FILTERED_COUNT_TTL = 30      # Seconds a filtered total is reused (per worker)
+
+_filtered_counts: Dict[tuple, Tuple[float, int]] = {}
+_filtered_counts_lock = threading.Lock()
+
+
+def _normalize_timestamp(value: str) -> str:
+    """Accept ISO 8601 ('2025-01-31T12:00:00Z') for comparison with created_at ('2025-01-31 12:00:00')"""
+    return value.strip().replace('T', ' ').rstrip('Z')
+
+
+def _encode_cursor(created_at: str, report_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{created_at}|{report_id}".encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Raises:
+        ValueError: Malformed cursor
+    """
+    try:
+        created_at, report_id = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').rsplit('|', 1)
+        return created_at, int(report_id)
+    except (UnicodeError, binascii.Error) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+def build_report_filters(args) -> Tuple[List[str], list]:
+    """
+    Build WHERE clauses for the report filters in a request's query string
+
+    Filters: version (exact), os (exact os_info), signature (error group),
+    since / until (created_at, UTC), q (error message substring - FTS5 trigram
+    index, LIKE for short queries)
+
+    Returns:
+        (clauses, params)
+    """
+    clauses = []
+    params = []
+
+    if args.get('version'):
+        clauses.append('version = ?')
+        params.append(args['version'])
+    if args.get('os'):
+        clauses.append('os_info = ?')
+        params.append(args['os'])
+    if args.get('signature'):
+        clauses.append('signature = ?')
+        params.append(args['signature'])
+    if args.get('since'):
+        clauses.append('created_at >= ?')
+        params.append(_normalize_timestamp(args['since']))
+    if args.get('until'):
+        clauses.append('created_at < ?')
+        params.append(_normalize_timestamp(args['until']))
+
+    query = (args.get('q') or '').strip()
+    if query:
+        if FTS_AVAILABLE and len(query) >= FTS_MIN_QUERY_LENGTH:
+            clauses.append('id IN (SELECT rowid FROM error_reports_fts WHERE error_reports_fts MATCH ?)')
+            params.append('"' + query.replace('"', '""') + '"')
+        else:
+            clauses.append("error_message LIKE ? ESCAPE '\\'")
+            escaped = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            params.append(f"%{escaped}%")
+
+    return clauses, params
+
+
+def count_reports(conn: sqlite3.Connection, clauses: List[str], params: list) -> int:
+    """
+    Total reports matching the filters
+
+    The unfiltered total is a trigger-maintained counter; filtered totals are
+    counted with the indexes and reused for FILTERED_COUNT_TTL seconds.
+    """
+    if not clauses:
+        row = conn.execute(SQL_TOTAL_REPORTS).fetchone()
+        return row[0] if row else 0
+
+    key = (tuple(clauses), tuple(params))
+    now = time.monotonic()
+    with _filtered_counts_lock:
+        cached = _filtered_counts.get(key)
+    if cached and now - cached[0] < FILTERED_COUNT_TTL:
+        return cached[1]
+
+    total = conn.execute(
+        'SELECT COUNT(*) FROM error_reports WHERE ' + ' AND '.join(clauses), params
+    ).fetchone()[0]
+    with _filtered_counts_lock:
+        if len(_filtered_counts) > 256:
+            _filtered_counts.clear()
+        _filtered_counts[key] = (now, total)
+    return total
+
+
+# ============================================================================
+# REPORT PAYLOADS
+# ============================================================================
+
+PAYLOAD_COMPRESS_MIN_BYTES = 256   # Smaller sections are stored as-is (gzip would grow them)
+PAYLOAD_COMPRESS_LEVEL = 6
+MIGRATION_BATCH_SIZE = 500
+
+
+def encode_report_sections(report_data: dict) -> List[Tuple[int, str, str, int, bytes]]:
+    """
+    Split a report into per-section payload rows (one per top-level key)
+
+    Each section is serialized once here; reads never need to parse or
+    re-serialize it (see stream_report_detail).
+
+    Returns:
+        List of (position, section, encoding, size, data) - encoding is 'gzip' or 'identity'
+    """
+    sections = []
+    for position, (name, value) in enumerate(report_data.items()):
+        raw = json.dumps(value, default=str, ensure_ascii=False).encode('utf-8')
+        if len(raw) >= PAYLOAD_COMPRESS_MIN_BYTES:
+            sections.append((position, str(name), 'gzip', len(raw), gzip.compress(raw, PAYLOAD_COMPRESS_LEVEL, mtime=0)))
+        else:
+            sections.append((position, str(name), 'identity', len(raw), raw))
+    return sections
+
+
+def store_report_sections(conn: sqlite3.Connection, report_id: int, sections: list):
+    """Insert encoded sections for a report (caller owns the transaction)"""
+    conn.executemany(SQL_INSERT_PAYLOAD_SECTION, [
+        (report_id, name, position, encoding, size, data)
+        for position, name, encoding, size, data in sections
+    ])
+
+
+def decode_section(encoding: str, data: bytes) -> bytes:
+    """Stored section -> its JSON text (bytes)"""
+    if encoding == 'gzip':
+        return gzip.decompress(data)
+    return bytes(data)
+
+
+def migrate_full_reports(conn: sqlite3.Connection):
+    """Schema v3 data migration: move full_report JSON of existing rows into report_payloads"""
+    moved = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            'SELECT id, full_report FROM error_reports WHERE id > ? AND full_report IS NOT NULL ORDER BY id LIMIT ?',
+            (last_id, MIGRATION_BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        for row in rows:
+            last_id = row['id']
+            try:
+                report_data = json.loads(row['full_report'])
+            except ValueError:
+                report_data = None
+            if not isinstance(report_data, dict):
+                report_data = {'_raw': row['full_report']}
+            store_report_sections(conn, row['id'], encode_report_sections(report_data))
+        conn.execute('UPDATE error_reports SET full_report = NULL WHERE id <= ? AND full_report IS NOT NULL', (last_id,))
+        moved += len(rows)
+    if moved:
+        print(f"✓ Moved {moved} report payloads out of error_reports (run VACUUM to reclaim space)")
+
+
+def stream_report_detail(conn: sqlite3.Connection, summary: dict, report_id: int,
+                         wanted: Optional[set] = None) -> Iterator[str]:
+    """
+    Stream a report detail response, decoding payload sections one at a time
+
+    Section JSON is copied through as stored - never parsed - so a large widget
+    tree costs one decompress, not a json.loads + json.dumps round trip.
+
+    Args:
+        summary: Summary fields (everything except full_report)
+        wanted: Section names to include (None = all)
+    """
+    yield '{"status": "success", "report": '
+    yield json.dumps(summary)[:-1]  # Re-open the object to append full_report
+    yield ', "full_report": {'
+    first = True
+    for row in conn.execute(SQL_GET_PAYLOAD_SECTIONS, (report_id,)):
+        if wanted is not None and row['section'] not in wanted:
+            continue
+        yield ('' if first else ', ') + json.dumps(row['section']) + ': '
+        yield decode_section(row['encoding'], row['data']).decode('utf-8')
+        first = False
+    yield '}}}'
+
+
+# ============================================================================
+# ERROR SIGNATURES
+# ============================================================================
+
+SIGNATURE_FRAMES = 5          # Innermost traceback frames that identify an error
+SIGNATURE_TITLE_LENGTH = 200
+TOP_ERRORS_DEFAULT_HOURS = 24
+TOP_ERRORS_MAX_HOURS = 24 * 90
+
+# Report fields that may carry a Python traceback, in order of preference
+TRACEBACK_FIELDS = ('traceback', 'stack_trace', 'exception_traceback')
+
+_FRAME_RE = re.compile(r'File "([^"]+)", line \d+, in (\S+)')
+_PATH_SEP_RE = re.compile(r'[\\/]')
+_NORMALIZE_RULES = [
+    (re.compile(r'(?:[A-Za-z]:)?(?:[\\/][\w.\- ]+)+[\\/]([\w.\-]+)'), r'\1'),   # Paths -> file name
+    (re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', re.I), '<uuid>'),
+    (re.compile(r'\b0x[0-9a-f]+\b', re.I), '<addr>'),
+    (re.compile(r"'[^']*'|\"[^\"]*\""), "'<str>'"),                         # Quoted values (keys, ids)
+    (re.compile(r'\b\d+(?:\.\d+)*\b'), '<n>'),
+    (re.compile(r'\s+'), ' '),
+]
+_VERSION_RE = re.compile(r'^v?(\d+)\.(\d+)(?:\.(\d+))?')
+
+
+def normalize_error_message(message: str) -> str:
+    """Strip the parts of an error message that vary between occurrences (paths, ids, numbers)"""
+    text = str(message or '').strip()
+    for pattern, replacement in _NORMALIZE_RULES:
+        text = pattern.sub(replacement, text)
+    return text.strip()
+
+
+def version_bucket(version) -> str:
+    """Bucket a reported version string ('v1.0.68-dev' -> '1.0.68'; junk -> 'other')"""
+    match = _VERSION_RE.match(str(version or '').strip())
+    if not match:
+        return 'other'
+    major, minor, patch = match.groups()
+    return f"{major}.{minor}.{patch or 0}"
+
+
+def compute_error_signature(report_data: dict, error_message: str) -> Tuple[str, str]:
+    """
+    Compute a report's error signature
+
+    The signature covers the innermost traceback frames (file name + function,
+    line numbers stripped) and the normalized exception line; if the report has
+    no traceback, the normalized error message alone. The version is not part of
+    it - the same bug in two releases is one group (rollups split by version).
+
+    Returns:
+        (signature, title) - 16 hex chars, and a readable normalized message
+    """
+    trace = next((report_data.get(field) for field in TRACEBACK_FIELDS
+                  if isinstance(report_data.get(field), str) and report_data.get(field).strip()), '')
+
+    frames = []
+    message = error_message
+    if trace:
+        frames = [_PATH_SEP_RE.split(path)[-1] + ':' + func for path, func in _FRAME_RE.findall(trace)]
+        frames = frames[-SIGNATURE_FRAMES:]
+        lines = [line for line in trace.strip().splitlines() if line.strip()]
+        if lines:
+            message = lines[-1]  # "KeyError: 'answer_3'"
+
+    title = normalize_error_message(message)[:SIGNATURE_TITLE_LENGTH] or 'No error message'
+    key = '\n'.join(frames + [title])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16], title
+
+
+def record_error_signature(conn: sqlite3.Connection, report_id: int, signature: str, title: str,
+                           version: str, created_at: str):
+    """Update the signature and hourly rollup tables for one new report (caller owns the transaction)"""
+    conn.execute(SQL_RECORD_SIGNATURE, (signature, title, created_at, created_at, report_id))
+    conn.execute(SQL_RECORD_ROLLUP, (created_at[:13] + ':00', version_bucket(version), signature))
+
+
+def backfill_error_signatures(conn: sqlite3.Connection):
+    """Schema v6 data migration: sign existing reports and build their rollups"""
+    signed = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            'SELECT id, version, error_message, created_at FROM error_reports WHERE id > ? ORDER BY id LIMIT ?',
+            (last_id, MIGRATION_BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        for row in rows:
+            last_id = row['id']
+            trace_fields = {}
+            for field in TRACEBACK_FIELDS:
+                section = conn.execute(SQL_GET_PAYLOAD_SECTION, (row['id'], field)).fetchone()
+                if section:
+                    trace_fields[field] = json.loads(decode_section(section['encoding'], section['data']))
+            signature, title = compute_error_signature(trace_fields, row['error_message'])
+            conn.execute('UPDATE error_reports SET signature = ? WHERE id = ?', (signature, row['id']))
+            record_error_signature(conn, row['id'], signature, title, row['version'],
+                                   row['created_at'] or datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S'))
+        signed += len(rows)
+    if signed:
+        print(f"✓ Computed error signatures for {signed} existing reports")
+
+
+# ============================================================================
+# PERFORMANCE TELEMETRY
+# ============================================================================
+
+# Clients (lib/metrics.py) aggregate timings into log-spaced histograms and send one
+# batch every few minutes. Batches are merged into hourly buckets per (metric, model,
+# version bucket), so a fleet-wide percentile reads a few hundred bucket rows no
+# matter how many requests were measured.
+
+TELEMETRY_MAX_BODY = 256 * 1024             # Compressed batch
+TELEMETRY_MAX_DECODED = 2 * 1024 * 1024     # Decompressed batch
+TELEMETRY_MAX_SERIES = 500                  # Histograms + counters per batch
+TELEMETRY_MAX_BUCKETS = 300                 # Buckets per histogram
+TELEMETRY_MAX_COUNT = 10 ** 6               # Per bucket / counter, per batch
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+
+_METRIC_NAME_RE = re.compile(r'^[a-z][a-z0-9_.]{0,63}$')
+
+
+class TelemetryError(ValueError):
+    """Malformed telemetry batch (answered with 400)"""
+    pass
+
+
+def decode_telemetry_body(raw: bytes, content_encoding: str) -> dict:
+    """Decode a (possibly deflate/gzip-compressed) JSON batch, refusing decompression bombs"""
+    encoding = (content_encoding or '').strip().lower()
+    if encoding in ('deflate', 'gzip'):
+        # wbits: zlib header for deflate, gzip header for gzip
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | (16 if encoding == 'gzip' else 0))
+        try:
+            raw = decompressor.decompress(raw, TELEMETRY_MAX_DECODED + 1)
+        except zlib.error as e:
+            raise TelemetryError(f'Corrupt {encoding} body: {e}')
+        if len(raw) > TELEMETRY_MAX_DECODED or decompressor.unconsumed_tail:
+            raise TelemetryError('Decompressed batch too large')
+    elif encoding not in ('', 'identity'):
+        raise TelemetryError(f'Unsupported Content-Encoding: {encoding}')
+
+    try:
+        batch = json.loads(raw)
+    except ValueError as e:
+        raise TelemetryError(f'Invalid JSON: {e}')
+    if not isinstance(batch, dict):
+        raise TelemetryError('Batch must be a JSON object')
+    return batch
+
+
+def _series_label(entry: dict, field: str) -> str:
+    value = entry.get(field)
+    if not isinstance(value, str) or not _METRIC_NAME_RE.match(value):
+        raise TelemetryError(f'Invalid {field}: {value!r}')
+    return value
+
+
+def _count_value(value) -> int:
+    if not isinstance(value, int) or isinstance(value, bool) or not 0 < value <= TELEMETRY_MAX_COUNT:
+        raise TelemetryError(f'Invalid count: {value!r}')
+    return value
+
+
+def parse_telemetry_batch(batch: dict) -> Tuple[list, list, list]:
+    """
+    Validate a batch and flatten it into rows for the merge statements
+
+    Returns:
+        (buckets, series, counters) - rows without the hour/version columns:
+        (metric, model, le, count), (metric, model, count, total, min, max), (name, model, count)
+    """
+    histograms = batch.get('histograms') or []
+    counters = batch.get('counters') or []
+    if not isinstance(histograms, list) or not isinstance(counters, list):
+        raise TelemetryError('histograms and counters must be lists')
+    if len(histograms) + len(counters) > TELEMETRY_MAX_SERIES:
+        raise TelemetryError('Too many series in one batch')
+
+    bucket_rows, series_rows, counter_rows = [], [], []
+    for entry in histograms:
+        if not isinstance(entry, dict):
+            raise TelemetryError('Histogram must be an object')
+        metric = _series_label(entry, 'metric')
+        model = str(entry.get('model') or '')[:100]
+        buckets = entry.get('buckets') or []
+        if not isinstance(buckets, list) or len(buckets) > TELEMETRY_MAX_BUCKETS:
+            raise TelemetryError(f'Invalid buckets for {metric}')
+
+        total_count = 0
+        for bucket in buckets:
+            if not isinstance(bucket, (list, tuple)) or len(bucket) != 2:
+                raise TelemetryError(f'Invalid bucket for {metric}: {bucket!r}')
+            le, count = bucket
+            if not isinstance(le, (int, float)) or not 0 < le < 1e9:
+                raise TelemetryError(f'Invalid bucket bound for {metric}: {le!r}')
+            count = _count_value(count)
+            bucket_rows.append((metric, model, round(float(le), 3), count))
+            total_count += count
+
+        if total_count:
+            total = entry.get('sum')
+            low, high = entry.get('min'), entry.get('max')
+            numbers = [v for v in (total, low, high) if isinstance(v, (int, float))]
+            if len(numbers) != 3:
+                total, low, high = 0.0, None, None
+            series_rows.append((metric, model, total_count, float(total), low, high))
+
+    for entry in counters:
+        if not isinstance(entry, dict):
+            raise TelemetryError('Counter must be an object')
+        counter_rows.append((_series_label(entry, 'name'), str(entry.get('model') or '')[:100],
+                             _count_value(entry.get('count'))))
+
+    return bucket_rows, series_rows, counter_rows
+
+
+def store_telemetry_batch(batch_key: str, client_id: str, version: str,
+                          rows: Tuple[list, list, list]) -> bool:
+    """
+    Merge a parsed batch into the hourly tables (one transaction)
+
+    Returns:
+        False if this batch key was already stored (retried delivery)
+    """
+    bucket_rows, series_rows, counter_rows = rows
+    received_at = datetime.utcnow()
+    hour = received_at.strftime('%Y-%m-%d %H:00')
+    version = version_bucket(version)
+
+    def work(conn):
+        if batch_key and not conn.execute(SQL_RECORD_BATCH, (
+                batch_key, client_id, received_at.strftime('%Y-%m-%d %H:%M:%S'))).rowcount:
+            return False
+        conn.executemany(SQL_MERGE_BUCKET, [
+            (metric, hour, model, version, le, count) for metric, model, le, count in bucket_rows])
+        conn.executemany(SQL_MERGE_SERIES, [
+            (metric, hour, model, version, count, total, low, high)
+            for metric, model, count, total, low, high in series_rows])
+        conn.executemany(SQL_MERGE_COUNTER, [
+            (hour, name, model, version, count) for name, model, count in counter_rows])
+        return True
+
+    return run_write(work)
+
+
+def bucket_percentiles(buckets: List[Tuple[float, int]], percentiles) -> Dict[str, float]:
+    """Percentiles from merged (upper bound, count) buckets - each is a bucket upper bound"""
+    buckets = sorted(buckets)
+    total = sum(count for _, count in buckets)
+    result = {}
+    for pct in percentiles:
+        rank = pct / 100 * total
+        seen = 0
+        value = buckets[-1][0] if buckets else 0.0
+        for le, count in buckets:
+            seen += count
+            if seen >= rank:
+                value = le
+                break
+        result[f"p{pct:g}"] = value
+    return result
+
+
+# ============================================================================
+# CONTENT-ADDRESSED UPLOADS
+# ============================================================================
+
+UPLOAD_HASH_PREFIX = 2        # objects/<first 2 hex chars>/<sha256>
+ORPHAN_GRACE_SECONDS = 3600   # Unreferenced files younger than this may belong to queued reports
+
+# Multipart field names: the desktop client sends question_/answer_screenshot,
+# older clients screenshot/answer_display
+UPLOAD_FIELDS = (
+    ('screenshot', ('screenshot', 'question_screenshot')),
+    ('answer_display', ('answer_display', 'answer_screenshot')),
+)
+
+
+class HashingUploadFile:
+    """
+    Multipart file part streamed straight to disk and hashed as it arrives
+
+    werkzeug's form parser writes each chunk here as it reads the request body, so
+    an upload is never buffered in memory and its SHA256 is ready when parsing ends.
+    The temp file is deleted on close unless claimed by store_upload_object.
+    """
+
+    def __init__(self):
+        UPLOAD_TMP_FOLDER.mkdir(parents=True, exist_ok=True)
+        fd, path = tempfile.mkstemp(dir=UPLOAD_TMP_FOLDER, suffix='.part')
+        self._file = os.fdopen(fd, 'w+b')
+        self.path = Path(path)
+        self.size = 0
+        self.claimed = False
+        self._sha256 = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self._sha256.update(data)
+        self.size += len(data)
+        return self._file.write(data)
+
+    def hexdigest(self) -> str:
+        return self._sha256.hexdigest()
+
+    def close(self):
+        self._file.close()
+        if not self.claimed:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+
+class UploadRequest(Request):
+    """Request that streams file uploads into HashingUploadFile parts"""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return HashingUploadFile()
+
+
+app.request_class = UploadRequest
+
+
+def store_upload_object(upload) -> Dict[str, object]:
+    """
+    Move an uploaded file into the content-addressed store
+
+    Identical content is stored once: if the object already exists the new copy
+    is simply dropped. The reference is counted when the report is written.
+
+    Returns:
+        {'sha256', 'path' (relative to UPLOAD_FOLDER), 'size', 'content_type'}
+    """
+    stream = upload.stream
+    if not isinstance(stream, HashingUploadFile):
+        # Not parsed by UploadRequest (e.g. a wrapped stream) - copy it through one
+        copy = HashingUploadFile()
+        shutil.copyfileobj(stream, copy)
+        stream = copy
+
+    stream.flush()
+    digest = stream.hexdigest()
+    rel_path = f"objects/{digest[:UPLOAD_HASH_PREFIX]}/{digest}"
+    destination = UPLOAD_FOLDER / rel_path
+
+    stream.claimed = True
+    stream.close()
+    if destination.exists():
+        stream.path.unlink()  # Duplicate - already stored
+    else:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(stream.path, destination)
+
+    return {
+        'sha256': digest,
+        'path': rel_path,
+        'size': stream.size,
+        'content_type': upload.mimetype or 'application/octet-stream',
+    }
 
-    conn.commit()
-    conn.close()
+
+def sweep_upload_objects():
+    """
+    Delete unreferenced upload objects and abandoned temp files
+
+    Objects whose refcount dropped to zero are removed; files with no row at all
+    are removed once older than ORPHAN_GRACE_SECONDS (their report may still be
+    queued, or was rejected).
+    """
+    removed = 0
+
+    def remove(path: Path):
+        nonlocal removed
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+
+    def release(conn):
+        rows = conn.execute('SELECT sha256, path FROM upload_objects WHERE refcount <= 0').fetchall()
+        conn.execute('DELETE FROM upload_objects WHERE refcount <= 0')
+        return rows
+
+    for row in run_write(release):
+        remove(UPLOAD_FOLDER / row['path'])
+
+    cutoff = time.time() - ORPHAN_GRACE_SECONDS
+    known = {row['sha256'] for row in get_db().execute('SELECT sha256 FROM upload_objects')}
+    for folder, pattern in ((UPLOAD_OBJECTS_FOLDER, '*/*'), (UPLOAD_TMP_FOLDER, '*.part')):
+        if not folder.is_dir():
+            continue
+        for path in folder.glob(pattern):
+            try:
+                stale = path.stat().st_mtime < cutoff
+            except OSError:
+                continue
+            if stale and path.name not in known:
+                remove(path)
+
+    if removed:
+        print(f"🧹 Removed {removed} unreferenced upload file(s)")
+
+
+# ============================================================================
+# REPORT INGESTION QUEUE
+# ============================================================================
+
+INGEST_QUEUE_MAX_ITEMS = 2000            # Reports waiting to be written (per worker)
+INGEST_BATCH_SIZE = 100                  # Reports per insert transaction
+INGEST_BATCH_MAX_WAIT = 0.05             # Seconds to wait for a batch to fill
+INGEST_SHUTDOWN_TIMEOUT = 10             # Seconds to flush the queue on worker exit
+INGEST_RETRY_AFTER = 5                   # Retry-After (seconds) sent when the queue is full
+
+_IDEMPOTENCY_KEY_RE = re.compile(r'^[0-9a-f]{32}$')
+
+
+def idempotency_key(value: Optional[str]) -> Optional[str]:
+    """Client-chosen ingest id from X-Idempotency-Key (the desktop outbox retries with the same key)"""
+    value = (value or '').strip().lower()
+    return value if _IDEMPOTENCY_KEY_RE.match(value) else None
+
+
+class IngestJob:
+    """A validated report waiting to be written"""
+
+    def __init__(self, report_data: dict, summary: tuple, uploads: List[Dict[str, object]],
+                 ingest_id: Optional[str] = None):
+        self.ingest_id = ingest_id or uuid.uuid4().hex  # Client key: a retried report is stored once
+        self.report_data = report_data
+        self.summary = summary      # (timestamp, version, os_info, python_version, error_message, screenshot_path, answer_display_path)
+        self.uploads = uploads      # Stored upload objects (store_upload_object) - referenced on insert
+        self.received_at = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')  # created_at format
+        self.enqueued = time.monotonic()
+
+
+class IngestQueue:
+    """
+    Bounded in-memory queue with a background writer (one per worker process)
+
+    Requests only validate and enqueue (uploads are already streamed into the
+    object store); the writer inserts reports in batched transactions. When the
+    queue is full submit() refuses new work so request latency stays flat and
+    clients back off instead of piling up on the SQLite write lock.
+
+    Accepted reports that are still queued when a worker is killed (not a
+    graceful shutdown) are lost; clients treat reporting as best effort.
+    """
+
+    def __init__(self):
+        self._queue: collections.deque = collections.deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self.stats = {
+            'accepted': 0,
+            'rejected': 0,
+            'written': 0,
+            'failed': 0,
+            'batches': 0,
+            'last_batch_size': 0,
+            'last_batch_ms': 0.0,
+            'max_depth': 0,
+        }
+        self._writer = threading.Thread(target=self._run, daemon=True, name="IngestWriter")
+        self._writer.start()
+
+    def submit(self, job: IngestJob) -> bool:
+        """Enqueue a report; False if the queue is full (caller should return 503)"""
+        with self._cond:
+            if self._closed or len(self._queue) >= INGEST_QUEUE_MAX_ITEMS:
+                self.stats['rejected'] += 1
+                return False
+            self._queue.append(job)
+            self.stats['accepted'] += 1
+            self.stats['max_depth'] = max(self.stats['max_depth'], len(self._queue))
+            self._cond.notify()
+        return True
+
+    def snapshot(self) -> dict:
+        """Backpressure metrics for this worker"""
+        with self._cond:
+            oldest = self._queue[0].enqueued if self._queue else None
+            return dict(
+                self.stats,
+                pid=os.getpid(),
+                depth=len(self._queue),
+                capacity=INGEST_QUEUE_MAX_ITEMS,
+                oldest_age_ms=round((time.monotonic() - oldest) * 1000, 1) if oldest else 0.0,
+            )
+
+    def close(self, timeout: float = INGEST_SHUTDOWN_TIMEOUT):
+        """Stop accepting work and flush what is queued"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._writer.join(timeout)
+
+    def _take_batch(self) -> List[IngestJob]:
+        with self._cond:
+            while not self._queue and not self._closed:
+                self._cond.wait()
+            # Give a burst a moment to fill the batch - one transaction instead of many
+            deadline = time.monotonic() + INGEST_BATCH_MAX_WAIT
+            while len(self._queue) < INGEST_BATCH_SIZE and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch = []
+            while self._queue and len(batch) < INGEST_BATCH_SIZE:
+                batch.append(self._queue.popleft())
+            return batch
+
+    def _run(self):
+        try:
+            sweep_upload_objects()
+        except Exception as e:
+            print(f"⚠️ Upload sweep failed: {e}")
+
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return  # Closed and drained
+            started = time.perf_counter()
+            written = self._write_batch(batch)
+            with self._cond:
+                self.stats['written'] += written
+                self.stats['failed'] += len(batch) - written
+                self.stats['batches'] += 1
+                self.stats['last_batch_size'] = len(batch)
+                self.stats['last_batch_ms'] = round((time.perf_counter() - started) * 1000, 1)
+
+    def _write_batch(self, batch: List[IngestJob]) -> int:
+        """Insert the batch in one transaction (reports + upload references); returns reports written"""
+        prepared = []
+        for job in batch:
+            try:
+                signature, title = compute_error_signature(job.report_data, job.summary[4])
+                prepared.append((job, encode_report_sections(job.report_data), signature, title))
+            except Exception as e:
+                print(f"✗ Could not prepare report {job.ingest_id}: {e}")
+
+        def insert_all(conn, items):
+            for job, sections, signature, title in items:
+                cursor = conn.execute(SQL_INSERT_REPORT, (job.ingest_id,) + job.summary + (job.received_at, signature))
+                if cursor.rowcount:  # 0 = already stored (ingest_id is unique)
+                    store_report_sections(conn, cursor.lastrowid, sections)
+                    record_error_signature(conn, cursor.lastrowid, signature, title, job.summary[1], job.received_at)
+                    for upload in job.uploads:
+                        conn.execute(SQL_ACQUIRE_UPLOAD, (
+                            upload['sha256'], upload['path'], upload['size'], upload['content_type']
+                        ))
+            return len(items)
+
+        try:
+            written = run_write(lambda conn: insert_all(conn, prepared))
+        except Exception as e:
+            # Isolate the bad report(s) instead of dropping the whole batch
+            print(f"⚠️ Batch insert failed ({e}) - retrying reports individually")
+            written = 0
+            for item in prepared:
+                try:
+                    written += run_write(lambda conn: insert_all(conn, [item]))
+                except Exception as item_error:
+                    print(f"✗ Error storing report {item[0].ingest_id}: {item_error}")
+
+        if written:
+            print(f"✓ Stored {written} error report(s) in one batch")
+        return written
+
+
+_ingest_queue: Optional[IngestQueue] = None
+_ingest_queue_pid = None
+_ingest_queue_lock = threading.Lock()
+
+
+def get_ingest_queue() -> IngestQueue:
+    """This worker's ingestion queue (created after fork, on first use)"""
+    global _ingest_queue, _ingest_queue_pid
+    with _ingest_queue_lock:
+        if _ingest_queue is None or _ingest_queue_pid != os.getpid():
+            get_db()  # Migrate before the writer's first insert
+            _ingest_queue = IngestQueue()
+            _ingest_queue_pid = os.getpid()
+            atexit.register(_ingest_queue.close)
+        return _ingest_queue
 
 
 @app.route('/api/report', methods=['POST'])
@@ -64,71 +1296,83 @@ def receive_report():
     """
     Receive error report from client
 
-    Expects JSON payload with error details and optional file uploads
+    Expects JSON payload with error details and optional file uploads.
+    The report is validated and queued; it is written by the ingestion writer
+    shortly after the 202 response (see IngestQueue). The response carries the
+    ingest_id; report_id (the database row id) is only included once the row
+    exists - for a retried report that was already stored.
     """
     try:
         # Parse JSON data
         if request.is_json:
-            report_data = request.json
+            report_data = request.get_json(silent=True)
         else:
             # Try to get from form data
             report_json = request.form.get('report_data')
             if report_json:
-                report_data = json.loads(report_json)
+                try:
+                    report_data = json.loads(report_json)
+                except ValueError as e:
+                    return jsonify({'status': 'error', 'message': f'Invalid report_data JSON: {e}'}), 400
             else:
                 return jsonify({'status': 'error', 'message': 'No JSON data provided'}), 400
 
+        if not isinstance(report_data, dict):
+            return jsonify({'status': 'error', 'message': 'Report must be a JSON object'}), 400
+
         # Extract key fields
         timestamp = report_data.get('timestamp', datetime.utcnow().isoformat())
         version = report_data.get('version', 'Unknown')
         system_info = report_data.get('system', {})
-        os_info = system_info.get('os', 'Unknown')
-        python_version = system_info.get('python_version', 'Unknown')
-        error_message = report_data.get('last_error', 'No error message')
-
-        # Handle file uploads
-        screenshot_path = None
-        answer_display_path = None
-
-        if 'screenshot' in request.files:
-            screenshot = request.files['screenshot']
-            if screenshot.filename:
-                screenshot_path = UPLOAD_FOLDER / f"screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{screenshot.filename}"
-                screenshot.save(screenshot_path)
-
-        if 'answer_display' in request.files:
-            answer_display = request.files['answer_display']
-            if answer_display.filename:
-                answer_display_path = UPLOAD_FOLDER / f"answer_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{answer_display.filename}"
-                answer_display.save(answer_display_path)
-
-        # Store in database
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO error_reports (
-                timestamp, version, os_info, python_version,
-                error_message, full_report, screenshot_path, answer_display_path
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            timestamp, version, os_info, python_version,
-            error_message, json.dumps(report_data),
-            str(screenshot_path) if screenshot_path else None,
-            str(answer_display_path) if answer_display_path else None
-        ))
-
-        conn.commit()
-        report_id = cursor.lastrowid
-        conn.close()
-
-        print(f"✓ Received error report #{report_id} from v{version} ({os_info})")
+        if not isinstance(system_info, dict):
+            system_info = {}
+        # The desktop client (lib/api.py) sends flat os / python_version / error_message
+        os_info = system_info.get('os') or report_data.get('os') or 'Unknown'
+        python_version = system_info.get('python_version') or report_data.get('python_version') or 'Unknown'
+        error_message = report_data.get('last_error') or report_data.get('error_message') or 'No error message'
+
+        # Handle file uploads (already streamed to disk and hashed while parsing;
+        # identical screenshots from many reports share one stored object)
+        uploads = []
+        upload_paths = {}
+        for column, field_names in UPLOAD_FIELDS:
+            upload = next((request.files[name] for name in field_names if name in request.files), None)
+            if upload and upload.filename:
+                stored = store_upload_object(upload)
+                uploads.append(stored)
+                upload_paths[column] = stored['path']
+
+        job = IngestJob(report_data, (
+            timestamp, version, os_info, python_version, error_message,
+            upload_paths.get('screenshot'), upload_paths.get('answer_display')
+        ), uploads, ingest_id=idempotency_key(request.headers.get('X-Idempotency-Key')))
+
+        # A retry of a report that was already written: answer with its row id, don't queue it again
+        stored = get_db().execute(SQL_FIND_BY_INGEST_ID, (job.ingest_id,)).fetchone()
+        if stored:
+            return jsonify({
+                'status': 'success',
+                'message': 'Error report already stored',
+                'ingest_id': job.ingest_id,
+                'report_id': stored['id'],
+                'queued': False
+            }), 200
+
+        if not get_ingest_queue().submit(job):
+            print(f"⚠️ Ingest queue full - rejected report from v{version}")
+            response = jsonify({
+                'status': 'error',
+                'message': 'Server busy, please retry later'
+            })
+            response.headers['Retry-After'] = str(INGEST_RETRY_AFTER)
+            return response, 503
 
         return jsonify({
             'status': 'success',
-            'message': 'Error report received',
-            'report_id': report_id
-        }), 200
+            'message': 'Error report queued',
+            'ingest_id': job.ingest_id,
+            'queued': True
+        }), 202
 
     except Exception as e:
         print(f"✗ Error processing report: {e}")
@@ -138,33 +1382,318 @@ def receive_report():
         }), 500
 
 
+@app.route('/api/errors/top', methods=['GET'])
+def top_errors():
+    """
+    Most frequent error signatures (answered from rollups, independent of report count)
+
+    Query parameters:
+        - hours: Window size (default 24, max 2160); 0 = all time
+        - version: Version bucket to restrict to (e.g. 1.0.68)
+        - limit: Number of signatures (default 20, max 200)
+    """
+    try:
+        hours = max(0, min(int(request.args.get('hours', TOP_ERRORS_DEFAULT_HOURS)), TOP_ERRORS_MAX_HOURS))
+        limit = max(1, min(int(request.args.get('limit', 20)), MAX_PAGE_SIZE))
+        version = request.args.get('version')
+        conn = get_db()
+
+        if hours == 0 and not version:
+            rows = conn.execute('''
+                SELECT signature, title, total_count AS count, first_seen, last_seen, last_report_id
+                FROM error_signatures ORDER BY total_count DESC LIMIT ?
+            ''', (limit,)).fetchall()
+        else:
+            clauses = []
+            params = []
+            if hours:
+                since = datetime.utcnow() - timedelta(hours=hours - 1)
+                clauses.append('r.hour >= ?')
+                params.append(since.strftime('%Y-%m-%d %H:00'))
+            if version:
+                clauses.append('r.version = ?')
+                params.append(version_bucket(version))
+            rows = conn.execute(f'''
+                SELECT r.signature, s.title, SUM(r.count) AS count, s.first_seen, s.last_seen, s.last_report_id
+                FROM signature_rollups r JOIN error_signatures s ON s.signature = r.signature
+                WHERE {' AND '.join(clauses)}
+                GROUP BY r.signature ORDER BY count DESC LIMIT ?
+            ''', params + [limit]).fetchall()
+
+        return jsonify({
+            'status': 'success',
+            'hours': hours,
+            'version': version,
+            'errors': [dict(row) for row in rows]
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@app.route('/api/errors/<signature>', methods=['GET'])
+def error_signature_detail(signature):
+    """Hourly counts per version for one signature (use /api/reports?signature= for its reports)"""
+    try:
+        hours = max(1, min(int(request.args.get('hours', TOP_ERRORS_DEFAULT_HOURS * 7)), TOP_ERRORS_MAX_HOURS))
+        conn = get_db()
+        info = conn.execute('SELECT * FROM error_signatures WHERE signature = ?', (signature,)).fetchone()
+        if not info:
+            return jsonify({'status': 'error', 'message': 'Signature not found'}), 404
+
+        since = (datetime.utcnow() - timedelta(hours=hours - 1)).strftime('%Y-%m-%d %H:00')
+        series = conn.execute('''
+            SELECT hour, version, count FROM signature_rollups
+            WHERE hour >= ? AND signature = ? ORDER BY hour
+        ''', (since, signature)).fetchall()
+
+        return jsonify({
+            'status': 'success',
+            'signature': dict(info),
+            'hourly': [dict(row) for row in series]
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@app.route('/api/telemetry/batch', methods=['POST'])
+def receive_telemetry_batch():
+    """
+    Receive a batch of aggregated client performance histograms
+
+    Body: JSON from lib/metrics.py (histograms + counters), optionally sent with
+    Content-Encoding: deflate or gzip. X-Idempotency-Key makes retries safe.
+    """
+    try:
+        if request.content_length and request.content_length > TELEMETRY_MAX_BODY:
+            return jsonify({'status': 'error', 'message': 'Batch too large'}), 413
+        raw = request.get_data(cache=False)
+        if len(raw) > TELEMETRY_MAX_BODY:
+            return jsonify({'status': 'error', 'message': 'Batch too large'}), 413
+
+        batch = decode_telemetry_body(raw, request.headers.get('Content-Encoding'))
+        rows = parse_telemetry_batch(batch)
+        stored = store_telemetry_batch(
+            idempotency_key(request.headers.get('X-Idempotency-Key')),
+            str(batch.get('client_id') or '')[:64],
+            batch.get('version'),
+            rows
+        )
+
+        return jsonify({
+            'status': 'success',
+            'duplicate': not stored,
+            'histograms': len(rows[1]),
+            'counters': len(rows[2])
+        }), 200
+
+    except TelemetryError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    except Exception as e:
+        print(f"✗ Error storing telemetry batch: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@app.route('/api/metrics/percentiles', methods=['GET'])
+def metric_percentiles():
+    """
+    Fleet-wide percentiles for one client metric, per model and version bucket
+
+    Query parameters:
+        - metric: Metric name (e.g. ttft_ms, stream_ms, render_ms) - required
+        - hours: Window size (default 24, max 2160)
+        - model, version: Restrict to one model / version bucket
+        - p: Comma-separated percentiles (default 50,90,95,99)
+    """
+    try:
+        metric = request.args.get('metric', '')
+        if not _METRIC_NAME_RE.match(metric):
+            return jsonify({'status': 'error', 'message': 'metric is required'}), 400
+        hours = max(1, min(int(request.args.get('hours', TOP_ERRORS_DEFAULT_HOURS)), TOP_ERRORS_MAX_HOURS))
+        percentiles = [float(p) for p in request.args.get('p', '').split(',') if p.strip()] or DEFAULT_PERCENTILES
+        if any(not 0 < p <= 100 for p in percentiles):
+            return jsonify({'status': 'error', 'message': 'Percentiles must be in (0, 100]'}), 400
+
+        clauses = ['metric = ?', 'hour >= ?']
+        params = [metric, (datetime.utcnow() - timedelta(hours=hours - 1)).strftime('%Y-%m-%d %H:00')]
+        if request.args.get('model') is not None:
+            clauses.append('model = ?')
+            params.append(request.args['model'])
+        if request.args.get('version'):
+            clauses.append('version = ?')
+            params.append(version_bucket(request.args['version']))
+        where = ' AND '.join(clauses)
+
+        conn = get_db()
+        groups: Dict[Tuple[str, str], List[Tuple[float, int]]] = collections.defaultdict(list)
+        for row in conn.execute(f'''
+            SELECT model, version, le, SUM(count) AS count FROM perf_buckets
+            WHERE {where} GROUP BY model, version, le
+        ''', params):
+            groups[(row['model'], row['version'])].append((row['le'], row['count']))
+
+        totals = {
+            (row['model'], row['version']): row
+            for row in conn.execute(f'''
+                SELECT model, version, SUM(count) AS count, SUM(total) AS total, MIN(min) AS min, MAX(max) AS max
+                FROM perf_series WHERE {where} GROUP BY model, version
+            ''', params)
+        }
+
+        series = []
+        for (model, version), buckets in groups.items():
+            total = totals.get((model, version))
+            entry = {
+                'model': model,
+                'version': version,
+                'count': sum(count for _, count in buckets),
+                'mean': round(total['total'] / total['count'], 1) if total and total['count'] else None,
+                'min': total['min'] if total else None,
+                'max': total['max'] if total else None,
+            }
+            entry.update(bucket_percentiles(buckets, percentiles))
+            series.append(entry)
+        series.sort(key=lambda entry: entry['count'], reverse=True)
+
+        return jsonify({
+            'status': 'success',
+            'metric': metric,
+            'hours': hours,
+            'series': series
+        }), 200
+
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': f'Invalid parameter: {e}'}), 400
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@app.route('/api/metrics/counters', methods=['GET'])
+def metric_counters():
+    """
+    Client counters (AI requests, model errors by kind) per model over a window
+
+    Query parameters:
+        - hours: Window size (default 24, max 2160)
+        - prefix: Only counters whose name starts with this (e.g. model_error.)
+        - version: Restrict to one version bucket
+    """
+    try:
+        hours = max(1, min(int(request.args.get('hours', TOP_ERRORS_DEFAULT_HOURS)), TOP_ERRORS_MAX_HOURS))
+        clauses = ['hour >= ?']
+        params = [(datetime.utcnow() - timedelta(hours=hours - 1)).strftime('%Y-%m-%d %H:00')]
+        prefix = request.args.get('prefix')
+        if prefix:
+            clauses.append("name LIKE ? ESCAPE '\\'")
+            params.append(prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%')
+        if request.args.get('version'):
+            clauses.append('version = ?')
+            params.append(version_bucket(request.args['version']))
+
+        rows = get_db().execute(f'''
+            SELECT name, model, SUM(count) AS count FROM perf_counters
+            WHERE {' AND '.join(clauses)} GROUP BY name, model ORDER BY count DESC
+        ''', params).fetchall()
+
+        return jsonify({
+            'status': 'success',
+            'hours': hours,
+            'counters': [dict(row) for row in rows]
+        }), 200
+
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': f'Invalid parameter: {e}'}), 400
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@app.route('/api/reports/ingest/<ingest_id>', methods=['GET'])
+def get_ingest_status(ingest_id):
+    """Look up a queued report by the id returned from POST /api/report"""
+    row = get_db().execute(SQL_FIND_BY_INGEST_ID, (ingest_id,)).fetchone()
+    if row:
+        return jsonify({'status': 'success', 'state': 'stored', 'report_id': row['id']}), 200
+    # Not written yet (or rejected/failed on another worker - queues are per worker)
+    return jsonify({'status': 'success', 'state': 'pending'}), 200
+
+
+@app.route('/api/uploads/<sha256>', methods=['GET'])
+def get_upload(sha256):
+    """Serve a stored upload by content hash (immutable, so cacheable forever)"""
+    row = get_db().execute(SQL_GET_UPLOAD, (sha256,)).fetchone()
+    if not row:
+        return jsonify({'status': 'error', 'message': 'Upload not found'}), 404
+    response = send_file(UPLOAD_FOLDER / row['path'], mimetype=row['content_type'], conditional=True, etag=sha256)
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
+
+@app.route('/api/ingest/stats', methods=['GET'])
+def ingest_stats():
+    """Backpressure metrics for the worker that serves this request"""
+    return jsonify({'status': 'success', 'ingest': get_ingest_queue().snapshot()}), 200
+
+
 @app.route('/api/reports', methods=['GET'])
 def list_reports():
     """
-    List all error reports (admin endpoint)
+    List all error reports (admin endpoint), newest first
 
     Query parameters:
-        - limit: Number of reports to return (default 50)
-        - offset: Pagination offset (default 0)
+        - limit: Number of reports to return (default 50, max 200)
+        - cursor: Opaque position from a previous page's next_cursor (keyset pagination)
+        - offset: Pagination offset (default 0) - legacy; ignored when cursor is given
+        - version, os, since, until, q: Filters (see build_report_filters)
     """
     try:
-        limit = int(request.args.get('limit', 50))
+        limit = max(1, min(int(request.args.get('limit', 50)), MAX_PAGE_SIZE))
         offset = int(request.args.get('offset', 0))
+        cursor = request.args.get('cursor')
+
+        conn = get_db()  # Applies migrations first, which decides FTS vs LIKE filtering
+        clauses, params = build_report_filters(request.args)
 
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        page_clauses = list(clauses)
+        page_params = list(params)
+        if cursor:
+            try:
+                cursor_created_at, cursor_id = _decode_cursor(cursor)
+            except ValueError as e:
+                return jsonify({'status': 'error', 'message': str(e)}), 400
+            # Seeks straight to the position via idx_reports_created - cost doesn't grow with page number
+            page_clauses.append('(created_at, id) < (?, ?)')
+            page_params.extend([cursor_created_at, cursor_id])
+            offset = 0
 
-        cursor.execute('''
-            SELECT id, timestamp, version, os_info, python_version,
-                   error_message, created_at, screenshot_path, answer_display_path
-            FROM error_reports
-            ORDER BY created_at DESC
-            LIMIT ? OFFSET ?
-        ''', (limit, offset))
+        sql = SQL_LIST_COLUMNS
+        if page_clauses:
+            sql += ' WHERE ' + ' AND '.join(page_clauses)
+        sql += ' ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?'
+        rows = conn.execute(sql, page_params + [limit + 1, offset]).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(rows[-1]['created_at'], rows[-1]['id'])
 
         reports = []
-        for row in cursor.fetchall():
+        for row in rows:
             reports.append({
                 'id': row['id'],
                 'timestamp': row['timestamp'],
@@ -177,18 +1706,16 @@ def list_reports():
                 'has_answer_display': row['answer_display_path'] is not None
             })
 
-        # Get total count
-        cursor.execute('SELECT COUNT(*) FROM error_reports')
-        total_count = cursor.fetchone()[0]
-
-        conn.close()
+        # Get total count (cached - see count_reports)
+        total_count = count_reports(conn, clauses, params)
 
         return jsonify({
             'status': 'success',
             'reports': reports,
             'total': total_count,
             'limit': limit,
-            'offset': offset
+            'offset': offset,
+            'next_cursor': next_cursor
         }), 200
 
     except Exception as e:
@@ -200,18 +1727,18 @@ def list_reports():
 
 @app.route('/api/reports/<int:report_id>', methods=['GET'])
 def get_report_detail(report_id):
-    """Get full details for a specific error report"""
-    try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+    """
+    Get full details for a specific error report
 
-        cursor.execute('''
-            SELECT * FROM error_reports WHERE id = ?
-        ''', (report_id,))
+    The response is streamed; payload sections are decompressed one at a time.
 
-        row = cursor.fetchone()
-        conn.close()
+    Query parameters:
+        - sections: Comma-separated payload sections to include in full_report
+          (default all; empty = summary and section list only)
+    """
+    try:
+        conn = get_db()
+        row = conn.execute(SQL_GET_REPORT, (report_id,)).fetchone()
 
         if not row:
             return jsonify({
@@ -226,16 +1753,59 @@ def get_report_detail(report_id):
             'os_info': row['os_info'],
             'python_version': row['python_version'],
             'error_message': row['error_message'],
-            'full_report': json.loads(row['full_report']) if row['full_report'] else None,
             'created_at': row['created_at'],
             'screenshot_path': row['screenshot_path'],
-            'answer_display_path': row['answer_display_path']
+            'answer_display_path': row['answer_display_path'],
+            'sections': [
+                {'name': s['section'], 'size': s['size'], 'stored_size': s['stored_size']}
+                for s in conn.execute(SQL_LIST_PAYLOAD_SECTIONS, (report_id,))
+            ]
         }
 
+        # Rows written before schema v3 that the migration could not move
+        if row['full_report'] is not None:
+            report['full_report'] = json.loads(row['full_report'])
+            return jsonify({'status': 'success', 'report': report}), 200
+
+        wanted = None
+        if 'sections' in request.args:
+            wanted = {name.strip() for name in request.args['sections'].split(',') if name.strip()}
+
+        return Response(
+            stream_with_context(stream_report_detail(conn, report, report_id, wanted)),
+            mimetype='application/json'
+        )
+
+    except Exception as e:
         return jsonify({
-            'status': 'success',
-            'report': report
-        }), 200
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@app.route('/api/reports/<int:report_id>/sections/<section>', methods=['GET'])
+def get_report_section(report_id, section):
+    """
+    Get one payload section of a report as JSON
+
+    Compressed sections are sent as stored (Content-Encoding: gzip) to clients
+    that accept gzip, so the server never decompresses them.
+    """
+    try:
+        row = get_db().execute(SQL_GET_PAYLOAD_SECTION, (report_id, section)).fetchone()
+        if not row:
+            return jsonify({
+                'status': 'error',
+                'message': 'Section not found'
+            }), 404
+
+        if row['encoding'] == 'gzip' and 'gzip' in request.headers.get('Accept-Encoding', ''):
+            response = Response(bytes(row['data']), mimetype='application/json')
+            response.headers['Content-Encoding'] = 'gzip'
+            response.headers['Vary'] = 'Accept-Encoding'
+            return response
+
+        return Response(decode_section(row['encoding'], row['data']), mimetype='application/json')
 
     except Exception as e:
         return jsonify({
@@ -262,14 +1832,46 @@ def admin_dashboard():
             .report-header { font-weight: bold; color: #d63031; }
             .report-meta { color: #636e72; font-size: 14px; margin-top: 5px; }
             .error-preview { background: #f8f9fa; padding: 10px; border-radius: 4px; margin-top: 10px; font-family: monospace; font-size: 12px; }
+            .top-errors { margin-bottom: 20px; }
+            .error-count { float: right; font-weight: bold; color: #2d3436; }
         </style>
     </head>
     <body>
         <h1>🚨 Error Reports Dashboard</h1>
         <div class="stats" id="stats">Loading statistics...</div>
+        <div class="report-list top-errors" id="top-errors">Loading top errors...</div>
         <div class="report-list" id="reports">Loading reports...</div>
 
         <script>
+            const esc = text => String(text ?? '').replace(/[&<>"']/g, c => `&#${c.charCodeAt(0)};`);
+
+            // Top error groups over the last 24 hours (precomputed rollups)
+            fetch('/api/errors/top?hours=24&limit=10')
+                .then(res => res.json())
+                .then(data => {
+                    const topDiv = document.getElementById('top-errors');
+                    if (!data.errors || data.errors.length === 0) {
+                        topDiv.innerHTML = '<h2>Top Errors (24h)</h2><p>No errors in the last 24 hours.</p>';
+                        return;
+                    }
+                    let html = '<h2>Top Errors (24h)</h2>';
+                    data.errors.forEach(error => {
+                        html += `
+                            <div class="report-item">
+                                <span class="error-count">${error.count}×</span>
+                                <div class="report-header">${esc(error.title)}</div>
+                                <div class="report-meta">
+                                    Signature ${esc(error.signature)} | first seen ${esc(error.first_seen)} | last seen ${esc(error.last_seen)}
+                                </div>
+                            </div>
+                        `;
+                    });
+                    topDiv.innerHTML = html;
+                })
+                .catch(err => {
+                    document.getElementById('top-errors').innerHTML = '<p>Error loading top errors: ' + err + '</p>';
+                });
+
             // Fetch and display reports
             fetch('/api/reports?limit=20')
                 .then(res => res.json())
@@ -330,9 +1932,18 @@ if __name__ == '__main__':
     print(f"Database: {DB_PATH}")
     print(f"Uploads: {UPLOAD_FOLDER}")
     print("\nEndpoints:")
-    print("  POST /api/report          - Receive error reports")
-    print("  GET  /api/reports         - List all reports")
-    print("  GET  /api/reports/<id>    - Get report details")
+    print("  POST /api/report          - Receive error reports (queued, 202)")
+    print("  GET  /api/reports/ingest/<id> - Queued report status")
+    print("  GET  /api/ingest/stats    - Ingestion queue metrics")
+    print("  GET  /api/uploads/<sha256> - Stored screenshot")
+    print("  GET  /api/errors/top      - Top error signatures (hours, version)")
+    print("  GET  /api/errors/<sig>    - Hourly counts for one signature")
+    print("  POST /api/telemetry/batch - Submit client performance histograms")
+    print("  GET  /api/metrics/percentiles - Latency percentiles per model/version")
+    print("  GET  /api/metrics/counters - Client counters (requests, model errors)")
+    print("  GET  /api/reports         - List reports (cursor, version, os, since, until, q)")
+    print("  GET  /api/reports/<id>    - Get report details (?sections=a,b)")
+    print("  GET  /api/reports/<id>/sections/<name> - One payload section")
     print("  GET  /                    - Admin dashboard")
     print("  GET  /health              - Health check")
     print("\nStarting server on http://0.0.0.0:5000")
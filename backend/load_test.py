@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Error Server Load Test
+======================
+Hammers a local error_server instance with a mix of report submissions and admin
+reads, then prints throughput and latency percentiles. Stdlib only.
+
+Usage:
+    gunicorn -w 4 -b 127.0.0.1:5000 error_server:app
+    python load_test.py                                  # 2000 requests, 16 clients
+    python load_test.py --requests 5000 --concurrency 32 --write-ratio 0.8
+    python load_test.py --write-ratio 1 --upload-kb 300   # report storm: same screenshot every time
+"""
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+
+
+def make_report(i: int) -> bytes:
+    """Build a report payload roughly the size of a real client report"""
+    return json.dumps({
+        'timestamp': datetime.utcnow().isoformat(),
+        'version': random.choice(['1.0.66', '1.0.67', '1.0.68']),
+        'system': {'os': random.choice(['Windows 11', 'macOS 14', 'Linux']), 'python_version': '3.11.7'},
+        'last_error': f"Load test error #{i}: " + "x" * random.randint(50, 400),
+        'session': {'events': [{'type': 'click', 'n': n} for n in range(40)]},
+    }).encode('utf-8')
+
+
+def make_multipart(report: bytes, screenshot: bytes) -> tuple:
+    """Encode a report + screenshot the way the desktop client sends them"""
+    boundary = f"----hwhelper{random.getrandbits(64):016x}"
+    body = (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="report_data"\r\n\r\n'.encode('utf-8')
+        + report
+        + f'\r\n--{boundary}\r\nContent-Disposition: form-data; name="question_screenshot"; '
+          f'filename="question.png"\r\nContent-Type: image/png\r\n\r\n'.encode('utf-8')
+        + screenshot
+        + f'\r\n--{boundary}--\r\n'.encode('utf-8')
+    )
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the error reporting server")
+    parser.add_argument("--url", default="http://127.0.0.1:5000", help="Server base URL")
+    parser.add_argument("--requests", type=int, default=2000, help="Total requests")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--write-ratio", type=float, default=0.7, help="Fraction of requests that submit a report")
+    parser.add_argument("--upload-kb", type=int, default=0,
+                        help="Attach a screenshot of this size to every report (identical bytes, like a report storm)")
+    args = parser.parse_args()
+
+    screenshot = os.urandom(args.upload_kb * 1024) if args.upload_kb else None
+
+    base_url = args.url.rstrip('/')
+    counter = [0]
+    lock = threading.Lock()
+    latencies = {'write': [], 'read': []}
+    errors = []
+
+    def next_index():
+        with lock:
+            if counter[0] >= args.requests:
+                return None
+            counter[0] += 1
+            return counter[0]
+
+    def client():
+        while True:
+            i = next_index()
+            if i is None:
+                return
+
+            if random.random() < args.write_ratio:
+                kind = 'write'
+                if screenshot:
+                    body, content_type = make_multipart(make_report(i), screenshot)
+                else:
+                    body, content_type = make_report(i), 'application/json'
+                req = urllib.request.Request(
+                    f"{base_url}/api/report",
+                    data=body,
+                    headers={'Content-Type': content_type},
+                    method='POST',
+                )
+            else:
+                kind = 'read'
+                if random.random() < 0.5:
+                    url = f"{base_url}/api/reports?limit=20&offset={random.randint(0, 200)}"
+                else:
+                    url = f"{base_url}/api/reports/{random.randint(1, max(1, i))}"
+                req = urllib.request.Request(url)
+
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(req, timeout=30) as response:
+                    response.read()
+            except urllib.error.HTTPError as e:
+                if e.code != 404:  # Detail lookups may race ahead of inserts
+                    with lock:
+                        errors.append(f"{kind}: HTTP {e.code}")
+                    continue
+            except Exception as e:
+                with lock:
+                    errors.append(f"{kind}: {e}")
+                continue
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with lock:
+                latencies[kind].append(elapsed_ms)
+
+    upload_note = f", {args.upload_kb} KB screenshot" if screenshot else ""
+    print(f"🔥 {args.requests} requests, {args.concurrency} clients, {args.write_ratio:.0%} writes{upload_note} -> {base_url}")
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client, daemon=True) for _ in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    completed = sum(len(v) for v in latencies.values())
+    print(f"\n✅ {completed} ok, {len(errors)} failed in {elapsed:.2f}s -> {completed / elapsed:.0f} req/s")
+    for kind, values in latencies.items():
+        values.sort()
+        if values:
+            print(f"   {kind:5}: n={len(values):5}  p50={percentile(values, 50):6.1f} ms  "
+                  f"p95={percentile(values, 95):6.1f} ms  p99={percentile(values, 99):6.1f} ms")
+    for error in errors[:5]:
+        print(f"   ✗ {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Image Pipeline Benchmark
+========================
+Times the screenshot pipeline against the reference captures in test_screenshots/
+and compares the results with a stored baseline.
+
+Steps measured (each step runs in its own process so peak RSS is isolated). Every
+step calls the app's own functions, so the numbers track the code that ships:
+- display:      Image.open + draft_for_display + DisplayImageCache.get on a cold
+                cache (fast_downscale - what the screenshot area shows first)
+- refine:       DisplayImageCache.render_refined (the idle LANCZOS pass)
+- crop:         CropStack.push + materialize (crop + PNG encode for the AI request)
+- base64:       encode_image_base64 (request body for the AI call)
+- ocr:          detect_hotspot_locations with AI regions (EasyOCR, skipped if not installed)
+- grid_boxes:   DragToImageRenderer._extract_grid_boxes
+- overlay:      create_visual_answer_overlay
+
+Usage:
+    python benchmark_screenshots.py                    # run and compare with baseline
+    python benchmark_screenshots.py --save-baseline    # run and store as new baseline
+    python benchmark_screenshots.py --steps open_resize,base64 --rounds 10
+    python benchmark_screenshots.py --max-time-regression 0.25 --max-rss-regression 0.10
+
+Exit code is 1 when any step regresses wall time or peak RSS by more than the
+configured margin, so the script can gate CI or a pre-release check. The same check
+runs under pytest (tests/test_benchmark_screenshots.py) once a baseline is saved.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT_DIR = Path(__file__).parent
+CORPUS_DIR = ROOT_DIR / "test_screenshots"
+BASELINE_FILE = CORPUS_DIR / "benchmark_baseline.json"
+
+# Display container size used by _screenshot_fit_size before the window is laid out
+DEFAULT_CONTAINER_SIZE = (600, 450)
+
+# Crop the benchmark sends: the middle of the screenshot (fractions of width/height)
+CROP_FRACTIONS = (0.1, 0.1, 0.9, 0.9)
+
+DEFAULT_MAX_TIME_REGRESSION = 0.20
+DEFAULT_MAX_RSS_REGRESSION = 0.15
+
+# Hot spot labels and AI-style coordinates for the OCR step (only images with known labels are OCR'd)
+OCR_CORPUS = {
+    "01_hot_spot.png": [
+        {"text_content": "penguin", "hotspot_data": {"x_percent": 26.0, "y_percent": 24.0, "width_percent": 14.0, "height_percent": 28.0}},
+        {"text_content": "krill", "hotspot_data": {"x_percent": 48.0, "y_percent": 49.0, "width_percent": 12.0, "height_percent": 14.0}},
+        {"text_content": "cod", "hotspot_data": {"x_percent": 66.0, "y_percent": 48.0, "width_percent": 20.0, "height_percent": 16.0}},
+    ],
+}
+
+# Matching answers for the overlay step (same shape as AI matching_pair answers)
+OVERLAY_ANSWERS = [
+    {"content_type": "matching_pair", "pair_data": {"term": f"Visual {i}", "match": f"Description {i}"}, "confidence": 0.9}
+    for i in range(1, 7)
+]
+
+STEPS = ["display", "refine", "crop", "base64", "ocr", "grid_boxes", "overlay"]
+PIL_STEPS = ["display", "refine", "crop", "base64"]   # Need only Pillow (run by the pytest check)
+
+
+# ============================================================================
+# MEASUREMENT HELPERS
+# ============================================================================
+
+def _peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of the current process in KB (None if unavailable)"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS reports bytes, Linux reports kilobytes
+        return int(peak / 1024) if sys.platform == "darwin" else int(peak)
+    except ImportError:
+        pass
+
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        peak = getattr(info, "peak_wset", None) or info.rss
+        return int(peak / 1024)
+    except ImportError:
+        return None
+
+
+def _fit_size(img_w: int, img_h: int, container_w: int, container_h: int) -> tuple:
+    """Aspect-fit computation used by _screenshot_fit_size"""
+    aspect = img_w / img_h
+    disp_w = container_w
+    disp_h = int(disp_w / aspect)
+    if disp_h > container_h:
+        disp_h = container_h
+        disp_w = int(disp_h * aspect)
+    return max(1, int(disp_w)), max(1, int(disp_h))
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    """pytest-benchmark style statistics (milliseconds)"""
+    return {
+        "rounds": len(samples),
+        "min_ms": round(min(samples) * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3),
+        "mean_ms": round(statistics.mean(samples) * 1000, 3),
+        "median_ms": round(statistics.median(samples) * 1000, 3),
+        "stddev_ms": round(statistics.stdev(samples) * 1000, 3) if len(samples) > 1 else 0.0,
+    }
+
+
+# ============================================================================
+# BENCHMARK STEPS (run inside a child process)
+# ============================================================================
+
+def _step_display(image_paths: List[Path], rounds: int) -> List[float]:
+    from PIL import Image
+    from lib.display_cache import DisplayImageCache, draft_for_display
+
+    samples = []
+    for _ in range(rounds):
+        cache = DisplayImageCache(lambda img: img)   # Cold cache: every get() downscales
+        start = time.perf_counter()
+        for path in image_paths:
+            img = Image.open(path)
+            size = _fit_size(*img.size, *DEFAULT_CONTAINER_SIZE)
+            draft_for_display(img, size)
+            cache.get(img, size, "Dark", key=str(path))
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _step_refine(image_paths: List[Path], rounds: int) -> List[float]:
+    from PIL import Image
+    from lib.display_cache import DisplayImageCache
+
+    images = []
+    for path in image_paths:
+        img = Image.open(path)
+        img.load()
+        images.append((img, _fit_size(*img.size, *DEFAULT_CONTAINER_SIZE)))
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for img, size in images:
+            DisplayImageCache.render_refined(img, size)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _step_crop(image_paths: List[Path], rounds: int) -> List[float]:
+    from PIL import Image
+    from lib.crop_model import CropStack
+
+    images = []
+    for path in image_paths:
+        img = Image.open(path)
+        img.load()
+        images.append((img, str(path)))
+    samples = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for round_index in range(rounds):
+            round_dir = Path(tmp_dir) / str(round_index)   # Fresh directory: no materialized reuse
+            start = time.perf_counter()
+            for img, path in images:
+                stack = CropStack(img, path)
+                width, height = img.size
+                stack.push((int(width * CROP_FRACTIONS[0]), int(height * CROP_FRACTIONS[1]),
+                            int(width * CROP_FRACTIONS[2]), int(height * CROP_FRACTIONS[3])))
+                stack.materialize(directory=round_dir)
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _step_base64(image_paths: List[Path], rounds: int) -> List[float]:
+    from lib.crop_model import encode_image_base64
+
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for path in image_paths:
+            encode_image_base64(str(path))
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _step_ocr(image_paths: List[Path], rounds: int) -> Optional[List[float]]:
+    import lib.edmentum as edmentum
+
+    targets = [p for p in image_paths if p.name in OCR_CORPUS]
+    if not targets:
+        return None
+
+    # Worker warm-up is excluded from timing (the app pre-warms it at startup)
+    edmentum.initialize_easyocr()
+    if edmentum.get_easyocr_reader() is None:
+        return None
+
+    samples = []
+    for _ in range(rounds):
+        # Measure cold ROI OCR, not the per-image result cache
+        edmentum.clear_ocr_cache()
+        start = time.perf_counter()
+        for path in targets:
+            answers = OCR_CORPUS[path.name]
+            labels = [a["text_content"] for a in answers]
+            regions = {a["text_content"]: a["hotspot_data"] for a in answers}
+            edmentum.detect_hotspot_locations(str(path), labels, regions=regions)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _step_grid_boxes(image_paths: List[Path], rounds: int) -> List[float]:
+    from lib.edmentum import DragToImageRenderer
+
+    renderers = [DragToImageRenderer(None, str(path)) for path in image_paths]
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for renderer in renderers:
+            renderer._extract_grid_boxes(2, 3)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _step_overlay(image_paths: List[Path], rounds: int) -> List[float]:
+    from lib.edmentum import create_visual_answer_overlay
+
+    samples = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = os.path.join(tmp_dir, "overlay.png")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for path in image_paths:
+                create_visual_answer_overlay(str(path), OVERLAY_ANSWERS, output_path=output_path)
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+STEP_FUNCTIONS = {
+    "display": _step_display,
+    "refine": _step_refine,
+    "crop": _step_crop,
+    "base64": _step_base64,
+    "ocr": _step_ocr,
+    "grid_boxes": _step_grid_boxes,
+    "overlay": _step_overlay,
+}
+
+
+def _run_step_in_child(step: str, image_paths: List[str], rounds: int, warmup: int) -> Dict:
+    """Entry point for the per-step child process"""
+    # Keep the step's console chatter (lib.edmentum prints per box) out of the report
+    sys.stdout = open(os.devnull, "w", encoding="utf-8")
+    sys.path.insert(0, str(ROOT_DIR))
+
+    paths = [Path(p) for p in image_paths]
+    func = STEP_FUNCTIONS[step]
+    try:
+        if warmup:
+            func(paths, warmup)
+        samples = func(paths, rounds)
+    except ImportError as e:
+        return {"step": step, "skipped": f"missing dependency: {e}"}
+
+    if not samples:
+        return {"step": step, "skipped": "no applicable images or backend unavailable"}
+
+    result = {"step": step, "images": len(paths)}
+    result.update(_summarize(samples))
+    result["peak_rss_kb"] = _peak_rss_kb()
+    return result
+
+
+def corpus_paths() -> List[str]:
+    return sorted(str(p) for p in CORPUS_DIR.glob("*.png"))
+
+
+def run_benchmark(steps: List[str], image_paths: List[str], rounds: int = 5, warmup: int = 1,
+                  progress=None) -> Dict[str, Dict]:
+    """Run each step in a fresh spawned process (so peak RSS reflects only that step)"""
+    results = {}
+    ctx = get_context("spawn")
+    for step in steps:
+        if progress:
+            progress(step)
+        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as executor:
+            results[step] = executor.submit(_run_step_in_child, step, image_paths, rounds, warmup).result()
+    return results
+
+
+# ============================================================================
+# BASELINE COMPARISON
+# ============================================================================
+
+def _machine_info() -> Dict[str, str]:
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def load_baseline(path: Path) -> Optional[Dict]:
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path: Path, results: Dict[str, Dict]):
+    data = {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "machine": _machine_info(),
+        "steps": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def compare_with_baseline(results: Dict[str, Dict], baseline: Dict,
+                          max_time_regression: float, max_rss_regression: Optional[float]) -> List[str]:
+    """Return a list of regression messages (empty list = pass); max_rss_regression=None skips RSS"""
+    regressions = []
+    baseline_steps = baseline.get("steps", {})
+
+    for step, current in results.items():
+        previous = baseline_steps.get(step)
+        if not previous or "skipped" in current or "skipped" in previous:
+            continue
+
+        time_limit = previous["median_ms"] * (1 + max_time_regression)
+        if current["median_ms"] > time_limit:
+            regressions.append(
+                f"{step}: median {current['median_ms']:.1f}ms > {time_limit:.1f}ms "
+                f"(baseline {previous['median_ms']:.1f}ms +{max_time_regression:.0%})"
+            )
+
+        if max_rss_regression is not None and current.get("peak_rss_kb") and previous.get("peak_rss_kb"):
+            rss_limit = previous["peak_rss_kb"] * (1 + max_rss_regression)
+            if current["peak_rss_kb"] > rss_limit:
+                regressions.append(
+                    f"{step}: peak RSS {current['peak_rss_kb'] / 1024:.1f}MB > {rss_limit / 1024:.1f}MB "
+                    f"(baseline {previous['peak_rss_kb'] / 1024:.1f}MB +{max_rss_regression:.0%})"
+                )
+
+    return regressions
+
+
+def print_results(results: Dict[str, Dict], baseline: Optional[Dict]):
+    baseline_steps = baseline.get("steps", {}) if baseline else {}
+    print(f"\n{'step':<12} {'median':>10} {'min':>10} {'stddev':>10} {'peak RSS':>10} {'vs base':>9}")
+    print("-" * 66)
+    for step, r in results.items():
+        if "skipped" in r:
+            print(f"{step:<12} skipped ({r['skipped']})")
+            continue
+        rss = f"{r['peak_rss_kb'] / 1024:.1f}MB" if r.get("peak_rss_kb") else "n/a"
+        delta = ""
+        previous = baseline_steps.get(step)
+        if previous and "median_ms" in previous and previous["median_ms"] > 0:
+            delta = f"{(r['median_ms'] / previous['median_ms'] - 1) * 100:+.1f}%"
+        print(f"{step:<12} {r['median_ms']:>8.1f}ms {r['min_ms']:>8.1f}ms {r['stddev_ms']:>8.1f}ms {rss:>10} {delta:>9}")
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the image pipeline against test_screenshots/")
+    parser.add_argument("--steps", default=",".join(STEPS), help=f"Comma-separated steps ({', '.join(STEPS)})")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per step (default 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed warm-up rounds per step (default 1)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="Store results as the new baseline")
+    parser.add_argument("--max-time-regression", type=float, default=DEFAULT_MAX_TIME_REGRESSION,
+                        help=f"Allowed median wall time regression as a fraction (default {DEFAULT_MAX_TIME_REGRESSION})")
+    parser.add_argument("--max-rss-regression", type=float, default=DEFAULT_MAX_RSS_REGRESSION,
+                        help=f"Allowed peak RSS regression as a fraction (default {DEFAULT_MAX_RSS_REGRESSION})")
+    args = parser.parse_args()
+
+    steps = [s.strip() for s in args.steps.split(",") if s.strip()]
+    unknown = [s for s in steps if s not in STEP_FUNCTIONS]
+    if unknown:
+        parser.error(f"Unknown step(s): {', '.join(unknown)}")
+
+    image_paths = corpus_paths()
+    if not image_paths:
+        print(f"❌ No screenshots found in {CORPUS_DIR}")
+        return 1
+
+    print(f"📊 Benchmarking {len(steps)} step(s) over {len(image_paths)} screenshots "
+          f"({args.rounds} rounds, {args.warmup} warm-up)")
+
+    results = run_benchmark(steps, image_paths, args.rounds, args.warmup,
+                            progress=lambda step: print(f"  ⏳ {step}..."))
+
+    baseline = load_baseline(args.baseline)
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"\n💾 Saved baseline: {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"\nℹ️ No baseline at {args.baseline} - run with --save-baseline to create one")
+        return 0
+
+    if baseline.get("machine") != _machine_info():
+        print("\n⚠️ Baseline was recorded on a different machine/interpreter - comparisons may be noisy")
+
+    regressions = compare_with_baseline(results, baseline, args.max_time_regression, args.max_rss_regression)
+    if regressions:
+        print("\n❌ Performance regressions detected:")
+        for message in regressions:
+            print(f"  • {message}")
+        return 1
+
+    print("\n✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Build binary deltas from previous releases for version.json
+
+Run after regenerate_hashes.py when preparing a release:
+
+    python regenerate_hashes.py
+    python build_deltas.py              # deltas from the last 3 releases
+    python build_deltas.py --releases 5
+
+Previous releases are found in the git history of version.json. For every file
+that changed, a delta (lib/delta.py) is written to deltas/<version>/<path>/<old hash>.delta
+and indexed in version.json under "deltas", keyed by the old file hash. Clients that
+have one of those old files download the delta instead of the whole file.
+"""
+
+import argparse
+import hashlib
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from lib.delta import create_delta, apply_delta
+from lib.updater import write_version_pointer
+
+DELTAS_DIR = "deltas"
+MAX_DELTA_RATIO = 0.5  # Skip deltas that aren't at least 2x smaller than the file
+
+
+def git(root_dir: Path, *args) -> bytes:
+    """Run a git command and return its stdout"""
+    return subprocess.check_output(["git", *args], cwd=root_dir, stderr=subprocess.DEVNULL)
+
+
+def find_previous_releases(root_dir: Path, current_version: str, limit: int) -> list:
+    """
+    Find previous releases from the git history of version.json
+
+    Returns:
+        List of (commit, version, file_hashes), newest first
+    """
+    releases = []
+    seen = {current_version}
+    commits = git(root_dir, "log", "--format=%H", "--", "version.json").decode().split()
+
+    for commit in commits:
+        try:
+            data = json.loads(git(root_dir, "show", f"{commit}:version.json").decode("utf-8"))
+        except (subprocess.CalledProcessError, ValueError):
+            continue
+        version = data.get("version")
+        if not version or version in seen or not data.get("file_hashes"):
+            continue
+        seen.add(version)
+        releases.append((commit, version, data["file_hashes"]))
+        if len(releases) >= limit:
+            break
+
+    return releases
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build update deltas from previous releases")
+    parser.add_argument("--releases", type=int, default=3, help="Number of previous releases to diff against")
+    args = parser.parse_args()
+
+    root_dir = Path(__file__).parent
+    version_file = root_dir / "version.json"
+
+    print("📖 Loading version.json...")
+    with open(version_file, 'r', encoding='utf-8') as f:
+        version_data = json.load(f)
+
+    version = version_data['version']
+    file_hashes = version_data.get('file_hashes', {})
+    if not file_hashes:
+        print("❌ version.json has no file_hashes - run regenerate_hashes.py first")
+        sys.exit(1)
+
+    try:
+        releases = find_previous_releases(root_dir, version, args.releases)
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        print(f"❌ Could not read git history: {e}")
+        sys.exit(1)
+
+    print(f"🔍 Building deltas for v{version} from: {', '.join('v' + r[1] for r in releases) or 'none'}")
+
+    # Only keep deltas for the version being released
+    deltas_root = root_dir / DELTAS_DIR
+    if deltas_root.exists():
+        shutil.rmtree(deltas_root)
+
+    deltas = {}
+    full_bytes = 0
+    delta_bytes = 0
+
+    for rel_path, new_hash in sorted(file_hashes.items()):
+        new_path = root_dir / rel_path
+        if not new_path.exists():
+            continue
+        new_data = new_path.read_bytes()
+
+        for commit, old_version, old_hashes in releases:
+            old_hash = old_hashes.get(rel_path)
+            if not old_hash or old_hash == new_hash or old_hash in deltas.get(rel_path, {}):
+                continue
+
+            try:
+                old_data = git(root_dir, "show", f"{commit}:{rel_path}")
+            except subprocess.CalledProcessError:
+                continue
+            if hashlib.sha256(old_data).hexdigest() != old_hash:
+                print(f"  ⚠️ {rel_path} @ v{old_version}: git contents don't match recorded hash, skipping")
+                continue
+
+            delta = create_delta(old_data, new_data)
+            if len(delta) > len(new_data) * MAX_DELTA_RATIO:
+                print(f"  - {rel_path} from v{old_version}: delta not worth it ({len(delta)} / {len(new_data)} bytes)")
+                continue
+            # Sanity check before publishing
+            apply_delta(old_data, delta)
+
+            delta_rel = f"{DELTAS_DIR}/{version}/{rel_path}/{old_hash[:16]}.delta"
+            delta_path = root_dir / delta_rel
+            delta_path.parent.mkdir(parents=True, exist_ok=True)
+            delta_path.write_bytes(delta)
+
+            deltas.setdefault(rel_path, {})[old_hash] = {
+                "path": delta_rel,
+                "size": len(delta),
+                "sha256": hashlib.sha256(delta).hexdigest(),
+            }
+            full_bytes += len(new_data)
+            delta_bytes += len(delta)
+            print(f"  ✓ {rel_path} from v{old_version}: {len(delta)} bytes (full file {len(new_data)} bytes)")
+
+    version_data['deltas'] = deltas
+
+    print("💾 Saving updated version.json...")
+    with open(version_file, 'w', encoding='utf-8') as f:
+        json.dump(version_data, f, indent=2, ensure_ascii=False)
+
+    # version.json changed - refresh the pointer's manifest hash
+    write_version_pointer(root_dir)
+    print("📌 Updated latest.json")
+
+    count = sum(len(v) for v in deltas.values())
+    print(f"\n✅ Built {count} deltas for {len(deltas)} files")
+    if full_bytes:
+        print(f"📊 Delta payload: {delta_bytes} bytes vs {full_bytes} bytes full ({full_bytes / max(delta_bytes, 1):.0f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,20 @@ Consolidated utility modules for the HW Helper application.
 Modules:
 - edmentum: UI components for Edmentum question types + OCR + enhanced display
 - capture: Screenshot capture logic + ChromeDriver auto-installation
-- api: slckr.xyz API client for error reporting and telemetry
+- api: slckr.xyz API client for error reporting and telemetry (persistent outbox + background sender)
 - updater: Auto-updater with hash-based differential updates
 - utils: Utilities (validator, JSON parser, widget export, visual detector)
+- lazy: Deferred imports + startup import-time report
+- scheduler: Startup task scheduler (priority, dependencies, resource classes)
+- ocr: EasyOCR worker process (IPC queue, shared-memory images, timeouts, restart)
+- delta: Binary file deltas for updates (rolling-hash block diff)
+- manifest: Persisted file hash cache (size/mtime validated) for updates + release tooling
+- render_model: Structural record of the rendered answers (error reports serialize it off-thread)
+- metrics: Local performance histograms (TTFT, stream/parse/render/capture/OCR time) shipped in batches
+- answer_history: Session history of answered questions (memory-budgeted LRU, instant back/forward)
+- answer_store: Persistent answer store (SQLite + FTS5 search, image/perceptual hash lookup, batched async writes)
+- display_cache: Display-sized screenshot cache (fast reduce/draft downscale, idle LANCZOS refinement)
+- crop_model: Non-destructive crop stack with undo/redo; crops encoded lazily off the UI thread, cached per rectangle
 """
 
 __version__ = "1.0.52"
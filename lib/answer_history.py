@@ -0,0 +1,197 @@
+"""
+HW Helper Answer History
+========================
+Bounded in-memory history of answered questions for the current session, so the
+user can step back and forth between questions without calling the AI again.
+
+Each entry keeps what is needed to redraw a question instantly: a display-sized
+thumbnail of the screenshot, the validated response and the render model snapshot.
+Entries stay in the order they were answered (that is the back/forward order);
+when the memory budget or entry cap is exceeded, the least recently viewed entries
+are evicted first. The entry being viewed is never evicted.
+
+Usage:
+    history = AnswerHistory()
+    entry = history.record(image_key, thumbnail, thumbnail_bytes, response, snapshot)
+    previous = history.back()       # None at the oldest entry
+    following = history.forward()   # None at the newest entry
+    index, count = history.position()
+
+This module must stay dependency-free (stdlib only) - thumbnails are opaque objects
+whose size the caller reports.
+"""
+
+import itertools
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+HISTORY_BUDGET_BYTES = 64 * 1024 * 1024   # Approximate memory for all entries
+HISTORY_MAX_ENTRIES = 50
+OBJECT_OVERHEAD_FACTOR = 4                 # Python objects vs their JSON size (rough)
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate in-memory size of JSON-like data (bytes)"""
+    try:
+        return len(json.dumps(value, default=str)) * OBJECT_OVERHEAD_FACTOR
+    except (TypeError, ValueError):
+        return 0
+
+
+class HistoryEntry:
+    """One answered question"""
+
+    __slots__ = ("entry_id", "image_key", "image_path", "thumbnail", "thumbnail_bytes",
+                 "response", "render_snapshot", "dropdown_data", "model_name",
+                 "created_at", "last_viewed", "size_bytes")
+
+    def __init__(self, entry_id: int, image_key: str, image_path: Optional[str], thumbnail: Any,
+                 thumbnail_bytes: int, response: Dict, render_snapshot: Dict,
+                 dropdown_data: Optional[List], model_name: Optional[str]):
+        self.entry_id = entry_id
+        self.image_key = image_key
+        self.image_path = image_path
+        self.thumbnail = thumbnail
+        self.thumbnail_bytes = thumbnail_bytes
+        self.response = response
+        self.render_snapshot = render_snapshot
+        self.dropdown_data = dropdown_data or []
+        self.model_name = model_name
+        self.created_at = time.time()
+        self.last_viewed = time.monotonic()
+        self.size_bytes = (thumbnail_bytes + estimate_size(response)
+                           + estimate_size(render_snapshot) + estimate_size(self.dropdown_data))
+
+    @property
+    def question(self) -> str:
+        return str(self.response.get("identified_question") or self.render_snapshot.get("question") or "")
+
+
+class AnswerHistory:
+    """
+    Session history of answered questions with a cursor for back/forward.
+
+    Thread-safe; the UI records and navigates from the Tk thread.
+    """
+
+    def __init__(self, budget_bytes: int = HISTORY_BUDGET_BYTES, max_entries: int = HISTORY_MAX_ENTRIES):
+        self.budget_bytes = budget_bytes
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: List[HistoryEntry] = []   # Answer order (oldest first)
+        self._cursor: Optional[int] = None       # Index of the entry being viewed, None = live view
+        self._ids = itertools.count(1)
+        self._total_bytes = 0
+        self.evicted = 0
+
+    def record(self, image_key: str, thumbnail: Any, thumbnail_bytes: int, response: Dict,
+               render_snapshot: Dict, image_path: Optional[str] = None,
+               dropdown_data: Optional[List] = None, model_name: Optional[str] = None) -> HistoryEntry:
+        """
+        Add an answered question and make it the viewed entry
+
+        Re-answering the same image (same image_key) replaces its old entry and moves
+        it to the end, so retries with another model don't fill the history.
+        """
+        with self._lock:
+            entry = HistoryEntry(next(self._ids), image_key, image_path, thumbnail, thumbnail_bytes,
+                                 response, render_snapshot, dropdown_data, model_name)
+            for index, existing in enumerate(self._entries):
+                if existing.image_key == image_key:
+                    self._remove(index)
+                    break
+            self._entries.append(entry)
+            self._total_bytes += entry.size_bytes
+            self._cursor = len(self._entries) - 1
+            self._evict()
+            return entry
+
+    def _remove(self, index: int) -> HistoryEntry:
+        """Remove an entry, keeping the cursor on the same entry (caller holds the lock)"""
+        entry = self._entries.pop(index)
+        self._total_bytes -= entry.size_bytes
+        if self._cursor is not None:
+            if index == self._cursor:
+                self._cursor = None
+            elif index < self._cursor:
+                self._cursor -= 1
+        return entry
+
+    def _evict(self):
+        """Drop least recently viewed entries until within budget (caller holds the lock)"""
+        while len(self._entries) > 1 and (self._total_bytes > self.budget_bytes
+                                          or len(self._entries) > self.max_entries):
+            candidates = [i for i in range(len(self._entries)) if i != self._cursor]
+            if not candidates:
+                return
+            victim = min(candidates, key=lambda i: self._entries[i].last_viewed)
+            self._remove(victim)
+            self.evicted += 1
+
+    def _move_to(self, index: int) -> Optional[HistoryEntry]:
+        if not 0 <= index < len(self._entries):
+            return None
+        self._cursor = index
+        entry = self._entries[index]
+        entry.last_viewed = time.monotonic()
+        return entry
+
+    def back(self) -> Optional[HistoryEntry]:
+        """Step to the previous (older) entry; from the live view, to the newest"""
+        with self._lock:
+            if self._cursor is None:
+                return self._move_to(len(self._entries) - 1)
+            return self._move_to(self._cursor - 1)
+
+    def forward(self) -> Optional[HistoryEntry]:
+        """Step to the next (newer) entry"""
+        with self._lock:
+            if self._cursor is None:
+                return None
+            return self._move_to(self._cursor + 1)
+
+    def leave(self):
+        """A new screenshot replaced the viewed entry (live view until it is answered)"""
+        with self._lock:
+            self._cursor = None
+
+    def current(self) -> Optional[HistoryEntry]:
+        with self._lock:
+            return self._entries[self._cursor] if self._cursor is not None else None
+
+    def can_go_back(self) -> bool:
+        with self._lock:
+            return bool(self._entries) and (self._cursor is None or self._cursor > 0)
+
+    def can_go_forward(self) -> bool:
+        with self._lock:
+            return self._cursor is not None and self._cursor < len(self._entries) - 1
+
+    def position(self) -> Tuple[Optional[int], int]:
+        """(1-based index of the viewed entry or None for the live view, entry count)"""
+        with self._lock:
+            return (self._cursor + 1 if self._cursor is not None else None), len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "budget_bytes": self.budget_bytes,
+                "evicted": self.evicted,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+__all__ = [
+    'AnswerHistory',
+    'HistoryEntry',
+    'estimate_size',
+    'HISTORY_BUDGET_BYTES',
+    'HISTORY_MAX_ENTRIES',
+]
@@ -0,0 +1,412 @@
+"""
+HW Helper Answer Store
+======================
+Persistent store of answered questions (~/.hwhelper/answers.db) with full-text
+search, so earlier answers can be found and reused across sessions without
+another model call.
+
+Each answer is keyed by the SHA-256 of its screenshot file and also carries a
+64-bit perceptual hash (dHash) of the image, so a re-capture of the same question
+(different bytes, same picture) is still recognized. The identified question,
+answer texts and explanations are indexed with SQLite FTS5 (plain LIKE matching if
+the SQLite build has no FTS5).
+
+Writes never run on the caller's thread: save_async() only queues the response;
+a writer thread hashes the image, compresses the response and commits queued
+answers in batches (one transaction per batch).
+
+Usage:
+    from lib.answer_store import get_answer_store
+    store = get_answer_store()
+    store.save_async(response, image_path=path, image=pil_thumbnail, model="google/gemini-2.5-flash")
+    results = store.search("photosynthesis light reaction")   # newest first if query is empty
+    response = store.get_response(results[0]["id"])
+    match = store.find_image(*image_fingerprint(path, pil_image))
+
+This module must stay dependency-free (stdlib only) - images are used through
+the PIL Image methods convert/resize/getdata/tobytes, PIL itself is not imported.
+"""
+
+import hashlib
+import json
+import queue
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+ANSWER_STORE_DIR = Path.home() / ".hwhelper"
+ANSWER_STORE_MAX_ROWS = 20000          # Oldest, least used answers are pruned beyond this
+WRITE_BATCH_SIZE = 32                  # Answers committed per transaction (at most)
+WRITE_LINGER_SECONDS = 0.5             # Wait this long for more answers before committing
+SEARCH_LIMIT = 25
+PHASH_MAX_DISTANCE = 6                 # dHash bits that may differ for "same picture"
+SNIPPET_TOKENS = 12
+
+_SCHEMA_VERSION = 1
+_SHUTDOWN = object()
+
+
+def _signed64(value: int) -> int:
+    """Unsigned 64-bit hash -> SQLite INTEGER range"""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def image_fingerprint(image_path: Optional[str] = None, image: Any = None) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Exact and perceptual hash of a screenshot
+
+    Args:
+        image_path: Screenshot file (its bytes give the exact hash)
+        image: PIL image of the same screenshot (any size) for the perceptual hash;
+            also used for the exact hash if there is no file
+
+    Returns:
+        (sha256 hex or None, signed 64-bit dHash or None)
+    """
+    digest = None
+    if image_path:
+        try:
+            sha256 = hashlib.sha256()
+            with open(image_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    sha256.update(chunk)
+            digest = sha256.hexdigest()
+        except OSError:
+            digest = None
+    if digest is None and image is not None:
+        digest = hashlib.sha256(image.tobytes()).hexdigest()
+
+    phash = None
+    if image is not None:
+        try:
+            # dHash: 9x8 grayscale, one bit per horizontally adjacent pixel pair
+            pixels = list(image.convert('L').resize((9, 8)).getdata())
+            bits = 0
+            for row in range(8):
+                for col in range(8):
+                    bits = (bits << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+            phash = _signed64(bits)
+        except Exception:
+            phash = None
+    return digest, phash
+
+
+def extract_search_text(response: Dict) -> Tuple[str, str, str]:
+    """(question, answer texts, explanations) of a validated response, for indexing"""
+    answers, explanations = [], []
+    for item in response.get('answers') or []:
+        if not isinstance(item, dict):
+            continue
+        pair = item.get('pair_data') or {}
+        text = item.get('text_content') or ''
+        if pair:
+            text = f"{pair.get('term', '')} → {pair.get('match', '')}"
+        if text:
+            answers.append(str(text))
+        if item.get('explanation'):
+            explanations.append(str(item['explanation']))
+    return str(response.get('identified_question') or ''), "\n".join(answers), "\n".join(explanations)
+
+
+def _fts_query(text: str) -> str:
+    """User search text -> FTS5 query (every word must match, as a prefix)"""
+    words = re.findall(r'\w+', text.lower())
+    return " ".join(f'"{word}"*' for word in words[:16])
+
+
+class AnswerStore:
+    """
+    SQLite answer store: readers use one shared connection, a writer thread owns
+    its own connection (WAL, so searches never wait for a write batch).
+    """
+
+    def __init__(self, directory: Path = ANSWER_STORE_DIR):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.directory / "answers.db"
+
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self.fts_enabled = self._create_schema()
+        # answer id -> perceptual hash, for near-duplicate lookups without a table scan
+        self._phashes: Dict[int, int] = {
+            row['id']: row['phash']
+            for row in self._conn.execute('SELECT id, phash FROM answers WHERE phash IS NOT NULL')
+        }
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="AnswerStoreWriter", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def _create_schema(self) -> bool:
+        """Create tables (and the FTS index if available); returns whether FTS5 is used"""
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS answers (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                image_sha256 TEXT NOT NULL UNIQUE,
+                phash INTEGER,
+                question TEXT NOT NULL,
+                answers_text TEXT NOT NULL,
+                explanations TEXT NOT NULL,
+                response BLOB NOT NULL,
+                model TEXT,
+                image_path TEXT,
+                created_at REAL NOT NULL,
+                used_count INTEGER NOT NULL DEFAULT 0,
+                last_used REAL
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_answers_created ON answers (created_at)')
+        try:
+            self._conn.executescript('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS answers_fts USING fts5(
+                    question, answers_text, explanations,
+                    content='answers', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+                );
+                CREATE TRIGGER IF NOT EXISTS answers_fts_insert AFTER INSERT ON answers BEGIN
+                    INSERT INTO answers_fts (rowid, question, answers_text, explanations)
+                    VALUES (new.id, new.question, new.answers_text, new.explanations);
+                END;
+                CREATE TRIGGER IF NOT EXISTS answers_fts_delete AFTER DELETE ON answers BEGIN
+                    INSERT INTO answers_fts (answers_fts, rowid, question, answers_text, explanations)
+                    VALUES ('delete', old.id, old.question, old.answers_text, old.explanations);
+                END;
+                CREATE TRIGGER IF NOT EXISTS answers_fts_update AFTER UPDATE OF question, answers_text, explanations ON answers BEGIN
+                    INSERT INTO answers_fts (answers_fts, rowid, question, answers_text, explanations)
+                    VALUES ('delete', old.id, old.question, old.answers_text, old.explanations);
+                    INSERT INTO answers_fts (rowid, question, answers_text, explanations)
+                    VALUES (new.id, new.question, new.answers_text, new.explanations);
+                END;
+            ''')
+            fts_enabled = True
+        except sqlite3.OperationalError as e:
+            print(f"⚠️ SQLite FTS5 not available, answer search uses plain matching: {e}")
+            fts_enabled = False
+        self._conn.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+        return fts_enabled
+
+    # ---- writing (writer thread) ----
+
+    def save_async(self, response: Dict, image_path: Optional[str] = None, image: Any = None,
+                   model: Optional[str] = None):
+        """
+        Queue a validated response for storage (returns immediately)
+
+        Args:
+            response: Validated AI response (identified_question, answers, ...)
+            image_path: Screenshot the response answers
+            image: PIL image of the screenshot (a thumbnail is enough)
+            model: Model that produced the response
+        """
+        self._queue.put((response, image_path, image, model, time.time()))
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + WRITE_LINGER_SECONDS
+            while len(batch) < WRITE_BATCH_SIZE and batch[-1] is not _SHUTDOWN:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            rows = []
+            for item in batch:
+                if item is _SHUTDOWN:
+                    continue
+                try:
+                    rows.append(self._prepare_row(*item))
+                except Exception as e:
+                    print(f"⚠️ Could not prepare answer for storage: {e}")
+            if rows:
+                try:
+                    self._commit_rows(conn, rows)
+                except sqlite3.Error as e:
+                    print(f"⚠️ Could not save {len(rows)} answer(s): {e}")
+            for _ in batch:
+                self._queue.task_done()
+            if batch[-1] is _SHUTDOWN:
+                conn.close()
+                return
+
+    def _prepare_row(self, response: Dict, image_path: Optional[str], image: Any,
+                     model: Optional[str], created_at: float) -> Tuple:
+        digest, phash = image_fingerprint(image_path, image)
+        if digest is None:
+            # No image at all: key by content so re-saving the same response is a no-op
+            digest = hashlib.sha256(json.dumps(response, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+        question, answers_text, explanations = extract_search_text(response)
+        body = zlib.compress(json.dumps(response, default=str).encode('utf-8'), 6)
+        return (digest, phash, question, answers_text, explanations, body, model, image_path, created_at)
+
+    def _commit_rows(self, conn: sqlite3.Connection, rows: List[Tuple]):
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany('''
+                INSERT INTO answers (image_sha256, phash, question, answers_text, explanations,
+                                     response, model, image_path, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (image_sha256) DO UPDATE SET
+                    phash = excluded.phash, question = excluded.question,
+                    answers_text = excluded.answers_text, explanations = excluded.explanations,
+                    response = excluded.response, model = excluded.model,
+                    image_path = excluded.image_path, created_at = excluded.created_at
+            ''', rows)
+            stored = conn.execute(
+                f"SELECT id, phash FROM answers WHERE image_sha256 IN ({','.join('?' * len(rows))})",
+                [row[0] for row in rows]).fetchall()
+            pruned = self._prune(conn)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+        with self._lock:
+            for answer_id in pruned:
+                self._phashes.pop(answer_id, None)
+            for row in stored:
+                if row['phash'] is not None:
+                    self._phashes[row['id']] = row['phash']
+        print(f"💾 Saved {len(rows)} answer(s) to the answer store")
+
+    def _prune(self, conn: sqlite3.Connection) -> List[int]:
+        """Delete the oldest, least used answers beyond the row cap (inside the write transaction)"""
+        count = conn.execute('SELECT COUNT(*) FROM answers').fetchone()[0]
+        if count <= ANSWER_STORE_MAX_ROWS:
+            return []
+        victims = [row[0] for row in conn.execute(
+            'SELECT id FROM answers ORDER BY used_count, COALESCE(last_used, created_at) LIMIT ?',
+            (count - ANSWER_STORE_MAX_ROWS,))]
+        conn.executemany('DELETE FROM answers WHERE id = ?', [(answer_id,) for answer_id in victims])
+        return victims
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until queued answers are written (True if the queue drained in time)"""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.02)
+        return True
+
+    def close(self, timeout: float = 5.0):
+        """Write what is queued, then stop the writer thread"""
+        self._queue.put(_SHUTDOWN)
+        self._writer.join(timeout)
+
+    # ---- reading ----
+
+    def search(self, text: str, limit: int = SEARCH_LIMIT) -> List[Dict]:
+        """
+        Find stored answers by question, answer or explanation text
+
+        Args:
+            text: Search words (all must match, each as a word prefix); empty for
+                the most recent answers
+
+        Returns:
+            [{"id", "question", "snippet", "model", "created_at", "used_count"}], best match first
+        """
+        query = _fts_query(text)
+        with self._lock:
+            if not query:
+                rows = self._conn.execute('''
+                    SELECT id, question, answers_text AS snippet, model, created_at, used_count
+                    FROM answers ORDER BY created_at DESC LIMIT ?
+                ''', (limit,)).fetchall()
+            elif self.fts_enabled:
+                rows = self._conn.execute(f'''
+                    SELECT a.id, a.question,
+                           snippet(answers_fts, -1, '[', ']', '…', {SNIPPET_TOKENS}) AS snippet,
+                           a.model, a.created_at, a.used_count
+                    FROM answers_fts JOIN answers a ON a.id = answers_fts.rowid
+                    WHERE answers_fts MATCH ?
+                    ORDER BY bm25(answers_fts, 10.0, 4.0, 1.0)
+                    LIMIT ?
+                ''', (query, limit)).fetchall()
+            else:
+                words = re.findall(r'\w+', text.lower())[:16]
+                where = " AND ".join(["(question || ' ' || answers_text || ' ' || explanations) LIKE ?"] * len(words))
+                rows = self._conn.execute(f'''
+                    SELECT id, question, answers_text AS snippet, model, created_at, used_count
+                    FROM answers WHERE {where} ORDER BY created_at DESC LIMIT ?
+                ''', [f"%{word}%" for word in words] + [limit]).fetchall()
+        return [dict(row) for row in rows]
+
+    def find_image(self, image_sha256: Optional[str], phash: Optional[int]) -> Optional[Dict]:
+        """
+        Stored answer for the same screenshot: exact file hash first, then the
+        nearest perceptual hash within PHASH_MAX_DISTANCE bits
+
+        Returns:
+            {"id", "question", "created_at", "model", "distance"} or None
+        """
+        with self._lock:
+            row = None
+            distance = 0
+            if image_sha256:
+                row = self._conn.execute('SELECT id, question, created_at, model FROM answers WHERE image_sha256 = ?',
+                                         (image_sha256,)).fetchone()
+            if row is None and phash is not None:
+                best_id, distance = None, PHASH_MAX_DISTANCE + 1
+                for answer_id, stored in self._phashes.items():
+                    bits = bin((stored ^ phash) & 0xFFFFFFFFFFFFFFFF).count('1')
+                    if bits < distance:
+                        best_id, distance = answer_id, bits
+                if best_id is not None:
+                    row = self._conn.execute('SELECT id, question, created_at, model FROM answers WHERE id = ?',
+                                             (best_id,)).fetchone()
+        if row is None:
+            return None
+        return dict(row, distance=distance)
+
+    def get_response(self, answer_id: int, mark_used: bool = True) -> Optional[Dict]:
+        """Stored response for reuse (counts as a use unless mark_used=False)"""
+        with self._lock:
+            row = self._conn.execute('SELECT response FROM answers WHERE id = ?', (answer_id,)).fetchone()
+            if row is None:
+                return None
+            if mark_used:
+                self._conn.execute('UPDATE answers SET used_count = used_count + 1, last_used = ? WHERE id = ?',
+                                   (time.time(), answer_id))
+        return json.loads(zlib.decompress(row['response']).decode('utf-8'))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count = self._conn.execute('SELECT COUNT(*) FROM answers').fetchone()[0]
+        return {"answers": count, "queued": self._queue.unfinished_tasks, "fts": self.fts_enabled}
+
+
+# Module-level singleton (one writer thread per app)
+_answer_store: Optional[AnswerStore] = None
+_answer_store_lock = threading.Lock()
+
+
+def get_answer_store() -> AnswerStore:
+    """Get the shared answer store (opened on first use)"""
+    global _answer_store
+    with _answer_store_lock:
+        if _answer_store is None:
+            _answer_store = AnswerStore()
+        return _answer_store
+
+
+__all__ = [
+    'AnswerStore',
+    'get_answer_store',
+    'image_fingerprint',
+    'extract_search_text',
+    'ANSWER_STORE_DIR',
+]
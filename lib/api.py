@@ -1,6 +1,11 @@
 """
 slckr API Client - Authentication and communication with api.slckr.xyz backend
 Handles error reporting, telemetry, and client secret management
+
+Error reports and telemetry go through a persistent outbox (~/.hwhelper/outbox):
+send_report / send_telemetry only write to it and return, and a background
+sender drains it over one pooled session, retrying with exponential backoff.
+Anything not delivered when the app exits is sent on the next launch.
 """
 
 import requests
@@ -8,9 +13,397 @@ import json
 import uuid
 import os
 import platform
+import random
+import re
+import shutil
+import sqlite3
 import sys
+import threading
+import time
+import zlib
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+OUTBOX_DIR = Path.home() / ".hwhelper" / "outbox"
+OUTBOX_MAX_ITEMS = 200                      # Oldest items (telemetry first) are evicted beyond this
+OUTBOX_MAX_BYTES = 50 * 1024 * 1024         # Payloads + spooled screenshots
+OUTBOX_MAX_AGE = 7 * 24 * 3600              # Undelivered items older than this are dropped
+OUTBOX_MAX_ATTEMPTS = 15                    # Failed deliveries; offline passes don't count (MAX_AGE bounds those)
+MAX_PAYLOAD_BYTES = 512 * 1024              # Compressed report JSON; larger reports are trimmed
+MAX_ATTACHMENT_BYTES = 8 * 1024 * 1024      # Screenshots larger than this are not attached
+
+SEND_BATCH_SIZE = 20                        # Items claimed per drain pass
+SEND_LEASE_SECONDS = 120                    # Claimed items are hidden from other senders this long
+SEND_TIMEOUT = (5, 30)                      # (connect, read) seconds
+BACKOFF_BASE_SECONDS = 5
+BACKOFF_MAX_SECONDS = 3600
+IDLE_POLL_SECONDS = 60
+
+# Optional report fields dropped (largest first) when a report exceeds MAX_PAYLOAD_BYTES
+TRIMMABLE_REPORT_FIELDS = ('widget_tree_json', 'ai_response_data', 'system_info')
+
+# HTTP statuses worth retrying; any other 4xx means the server will never accept the item
+RETRYABLE_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Shared keep-alive session (one connection pool for API calls and the outbox sender)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0)
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+        return _session
+
+
+# ============================================================================
+# OUTBOX
+# ============================================================================
+
+class ReportOutbox:
+    """
+    Append-only on-disk queue of API requests waiting to be delivered.
+
+    Each item is one POST: the JSON payload is stored zlib-compressed in SQLite and
+    screenshots are copied into the outbox directory (the originals are temp files
+    that get cleaned up). Every item carries a key that is sent as
+    X-Idempotency-Key, so a retry after a lost response is not stored twice.
+
+    Usage:
+        outbox = ReportOutbox()
+        key = outbox.enqueue('report', '/api/report', report_data,
+                             attachments={'question_screenshot': ('question.png', path)})
+        for item in outbox.claim(10): ...
+    """
+
+    def __init__(self, directory: Path = OUTBOX_DIR):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.directory / "outbox.db"), timeout=10,
+                                     isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT NOT NULL UNIQUE,
+                kind TEXT NOT NULL,
+                endpoint TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                attachments TEXT,
+                content_encoding TEXT,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt REAL NOT NULL,
+                last_error TEXT
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (next_attempt)')
+        columns = {row['name'] for row in self._conn.execute('PRAGMA table_info(outbox)')}
+        if 'content_encoding' not in columns:  # Outboxes created before metrics batches
+            self._conn.execute('ALTER TABLE outbox ADD COLUMN content_encoding TEXT')
+
+    # ---- writing ----
+
+    def enqueue(self, kind: str, endpoint: str, payload: Dict,
+                attachments: Optional[Dict[str, Tuple[str, str]]] = None,
+                replace_pending: bool = False, compress_wire: bool = False) -> str:
+        """
+        Add a request to the outbox
+
+        Args:
+            kind: Item type ('report', 'telemetry') - used for eviction order
+            endpoint: API path to POST to
+            payload: JSON body (sent as the report_data form field if there are attachments)
+            attachments: form field -> (filename, path); files are copied into the outbox
+            replace_pending: Drop undelivered items of the same kind first (latest wins)
+            compress_wire: Send the stored deflate body as-is (Content-Encoding: deflate);
+                only for endpoints that accept compressed bodies
+
+        Returns:
+            Item key (also the idempotency key sent to the server)
+        """
+        key = uuid.uuid4().hex
+        body = _compress_payload(payload)
+
+        spooled = {}
+        for field, (filename, path) in (attachments or {}).items():
+            try:
+                if not path or not os.path.exists(path):
+                    continue
+                if os.path.getsize(path) > MAX_ATTACHMENT_BYTES:
+                    print(f"⚠️ Not attaching {filename}: larger than {MAX_ATTACHMENT_BYTES // (1024 * 1024)} MB")
+                    continue
+                spool_path = self.directory / f"{key}_{field}{Path(filename).suffix}"
+                shutil.copyfile(path, spool_path)
+                spooled[field] = [filename, str(spool_path)]
+            except OSError as e:
+                print(f"⚠️ Could not spool {filename}: {e}")
+
+        size = len(body) + sum(os.path.getsize(path) for _, path in spooled.values())
+        now = time.time()
+        with self._lock:
+            if replace_pending:
+                for row in self._conn.execute('SELECT id, attachments FROM outbox WHERE kind = ?', (kind,)).fetchall():
+                    self._delete(row)
+            self._conn.execute('''
+                INSERT INTO outbox (key, kind, endpoint, payload, attachments, content_encoding,
+                                    size, created_at, next_attempt)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (key, kind, endpoint, body, json.dumps(spooled) if spooled else None,
+                  'deflate' if compress_wire and not spooled else None, size, now, now))
+            self._evict()
+        return key
+
+    def _evict(self):
+        """Enforce age, item and byte caps (caller holds the lock)"""
+        for row in self._conn.execute('SELECT id, attachments FROM outbox WHERE created_at < ?',
+                                      (time.time() - OUTBOX_MAX_AGE,)).fetchall():
+            self._delete(row)
+
+        count, total = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM outbox').fetchone()
+        if count <= OUTBOX_MAX_ITEMS and total <= OUTBOX_MAX_BYTES:
+            return
+        # Telemetry and metrics are expendable; reports go oldest first
+        for row in self._conn.execute('''
+            SELECT id, attachments, size FROM outbox ORDER BY kind = 'report', id
+        ''').fetchall():
+            if count <= OUTBOX_MAX_ITEMS and total <= OUTBOX_MAX_BYTES:
+                break
+            self._delete(row)
+            count -= 1
+            total -= row['size']
+
+    def _delete(self, row):
+        self._conn.execute('DELETE FROM outbox WHERE id = ?', (row['id'],))
+        for _, path in json.loads(row['attachments'] or '{}').values():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    # ---- draining ----
+
+    def claim(self, limit: int) -> List[sqlite3.Row]:
+        """Take up to `limit` due items, hiding them from other senders for SEND_LEASE_SECONDS"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                rows = self._conn.execute(
+                    'SELECT * FROM outbox WHERE next_attempt <= ? ORDER BY id LIMIT ?', (now, limit)
+                ).fetchall()
+                self._conn.executemany('UPDATE outbox SET next_attempt = ? WHERE id = ?',
+                                       [(now + SEND_LEASE_SECONDS, row['id']) for row in rows])
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return rows
+
+    def complete(self, row):
+        """Item delivered (or permanently rejected) - remove it and its files"""
+        with self._lock:
+            self._delete(row)
+
+    def retry_later(self, row, error: str, retry_after: Optional[float] = None):
+        """Schedule another attempt with exponential backoff (drops the item after OUTBOX_MAX_ATTEMPTS)"""
+        attempts = row['attempts'] + 1
+        with self._lock:
+            if attempts >= OUTBOX_MAX_ATTEMPTS:
+                print(f"⚠️ Giving up on {row['kind']} after {attempts} attempts: {error}")
+                self._delete(row)
+                return
+            delay = max(backoff_delay(attempts), retry_after or 0)
+            self._conn.execute('UPDATE outbox SET attempts = ?, next_attempt = ?, last_error = ? WHERE id = ?',
+                               (attempts, time.time() + delay, error[:500], row['id']))
+
+    def defer(self, rows, delay: float, error: Optional[str] = None):
+        """Push items back without counting an attempt (server unreachable, or not tried this pass)"""
+        next_attempt = time.time() + delay
+        with self._lock:
+            self._conn.executemany('UPDATE outbox SET next_attempt = ?, last_error = COALESCE(?, last_error) WHERE id = ?',
+                                   [(next_attempt, error[:500] if error else None, row['id']) for row in rows])
+
+    def next_due(self) -> Optional[float]:
+        """Timestamp of the earliest scheduled attempt (None if the outbox is empty)"""
+        with self._lock:
+            return self._conn.execute('SELECT MIN(next_attempt) FROM outbox').fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            count, total = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM outbox').fetchone()
+        return {'items': count, 'bytes': total}
+
+
+def backoff_delay(failures: int) -> float:
+    """Exponential backoff with jitter after `failures` consecutive failures (1 = first)"""
+    return min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** (failures - 1)) * random.uniform(0.5, 1.0)
+
+
+def _compress_payload(payload: Dict) -> bytes:
+    """zlib-compressed JSON, trimming optional report fields if it exceeds MAX_PAYLOAD_BYTES"""
+    body = zlib.compress(json.dumps(payload, default=str).encode('utf-8'), 6)
+    if len(body) <= MAX_PAYLOAD_BYTES:
+        return body
+
+    payload = dict(payload)
+    trimmed = []
+    for field in TRIMMABLE_REPORT_FIELDS:
+        if field in payload:
+            del payload[field]
+            trimmed.append(field)
+            payload['trimmed_fields'] = trimmed
+            body = zlib.compress(json.dumps(payload, default=str).encode('utf-8'), 6)
+            if len(body) <= MAX_PAYLOAD_BYTES:
+                break
+    print(f"⚠️ Report too large - dropped {', '.join(trimmed) or 'nothing'} ({len(body)} bytes compressed)")
+    return body
+
+
+class OutboxSender(threading.Thread):
+    """
+    Daemon thread that delivers outbox items.
+
+    Wakes on enqueue (notify) or when the next retry is due, sends due items in
+    batches over the shared session, and stops a pass at the first network failure
+    so an offline machine backs off instead of timing out on every item. Offline
+    passes back off per sender and never use up an item's attempts, so reports
+    wait out long offline periods (up to OUTBOX_MAX_AGE).
+    """
+
+    def __init__(self, outbox: ReportOutbox, headers_func):
+        super().__init__(name="outbox-sender", daemon=True)
+        self.outbox = outbox
+        self.headers_func = headers_func
+        self._wake = threading.Event()
+        self._offline_passes = 0   # Consecutive passes that found the server unreachable
+
+    def notify(self):
+        self._wake.set()
+
+    def run(self):
+        while True:
+            try:
+                while self._drain_batch():
+                    pass
+            except Exception as e:
+                print(f"⚠️ Outbox sender error: {e}")
+
+            next_due = self.outbox.next_due()
+            timeout = IDLE_POLL_SECONDS if next_due is None else min(IDLE_POLL_SECONDS, max(0.0, next_due - time.time()))
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    def _drain_batch(self) -> bool:
+        """Send one batch; returns True if another batch may be waiting"""
+        rows = self.outbox.claim(SEND_BATCH_SIZE)
+        for index, row in enumerate(rows):
+            outcome, error, retry_after = self._send(row)
+            if outcome == 'sent':
+                self.outbox.complete(row)
+            elif outcome == 'rejected':
+                print(f"⚠️ Server rejected {row['kind']}: {error}")
+                self.outbox.complete(row)
+            elif outcome == 'offline':
+                # Don't hammer an unreachable server - push this item and the untried
+                # rest back without counting an attempt against any of them
+                self._offline_passes += 1
+                delay = backoff_delay(self._offline_passes)
+                self.outbox.defer([row], delay, error)
+                self.outbox.defer(rows[index + 1:], delay)
+                return False
+            else:
+                self.outbox.retry_later(row, error, retry_after)
+            self._offline_passes = 0
+        return len(rows) == SEND_BATCH_SIZE
+
+    def _send(self, row) -> Tuple[str, str, Optional[float]]:
+        """
+        POST one item
+
+        Returns:
+            (outcome, error, retry_after) - outcome is 'sent', 'rejected', 'retry' or 'offline'
+        """
+        headers = dict(self.headers_func())
+        headers['X-Idempotency-Key'] = row['key']
+        attachments = json.loads(row['attachments'] or '{}')
+        file_handles = []
+
+        try:
+            if row['content_encoding'] == 'deflate':
+                # Stored body is already zlib (HTTP "deflate") - send without re-encoding
+                headers['Content-Type'] = 'application/json'
+                headers['Content-Encoding'] = 'deflate'
+                kwargs = {'data': row['payload']}
+            elif attachments:
+                payload = json.loads(zlib.decompress(row['payload']))
+                files = {}
+                for field, (filename, path) in attachments.items():
+                    if os.path.exists(path):
+                        fh = open(path, 'rb')
+                        file_handles.append(fh)
+                        files[field] = (filename, fh, 'image/png')
+                kwargs = {'data': {'report_data': json.dumps(payload, default=str)}, 'files': files}
+            else:
+                kwargs = {'json': json.loads(zlib.decompress(row['payload']))}
+
+            response = get_session().post(f"{SlckrAPIClient.BASE_URL}{row['endpoint']}",
+                                          headers=headers, timeout=SEND_TIMEOUT, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            return 'offline', f"{type(e).__name__}: {e}", None
+        except Exception as e:
+            return 'retry', str(e), None
+        finally:
+            for fh in file_handles:
+                try:
+                    fh.close()
+                except Exception:
+                    pass
+
+        if response.ok:
+            try:
+                result = response.json()
+            except ValueError:
+                result = {}
+            if row['kind'] == 'report':
+                print(f"✓ Error report delivered (ID: {result.get('report_id') or result.get('ingest_id', row['key'])})")
+            return 'sent', '', None
+
+        error = f"HTTP {response.status_code}: {response.text[:200]}"
+        if response.status_code in RETRYABLE_STATUSES:
+            retry_after = response.headers.get('Retry-After', '')
+            return 'retry', error, float(retry_after) if re.fullmatch(r'\d+(\.\d+)?', retry_after) else None
+        return 'rejected', error, None
+
+
+_outbox: Optional[ReportOutbox] = None
+_sender: Optional[OutboxSender] = None
+_outbox_lock = threading.Lock()
+
+
+def get_outbox(headers_func) -> Tuple[ReportOutbox, OutboxSender]:
+    """Process-wide outbox and its sender thread (started on first use, then drains leftovers)"""
+    global _outbox, _sender
+    with _outbox_lock:
+        if _outbox is None:
+            _outbox = ReportOutbox()
+            _sender = OutboxSender(_outbox, headers_func)
+            _sender.start()
+        return _outbox, _sender
+
+
+# ============================================================================
+# API CLIENT
+# ============================================================================
 
 
 class SlckrAPIClient:
@@ -86,7 +479,7 @@ class SlckrAPIClient:
         headers.update(self._get_headers())
 
         try:
-            response = requests.request(
+            response = get_session().request(
                 method,
                 url,
                 headers=headers,
@@ -112,13 +505,21 @@ class SlckrAPIClient:
     def health_check(self) -> bool:
         """Check if API is reachable"""
         try:
-            response = requests.get(f"{self.BASE_URL}/api/health", timeout=5)
+            response = get_session().get(f"{self.BASE_URL}/api/health", timeout=5)
             return response.status_code == 200
         except:
             return False
 
+    def _outbox(self) -> Tuple[ReportOutbox, OutboxSender]:
+        return get_outbox(self._get_headers)
+
     def send_telemetry(self, version: str, os_name: str, python_version: str) -> bool:
-        """Send telemetry ping on app startup"""
+        """
+        Queue a telemetry ping (delivered in the background; only the latest undelivered ping is kept)
+
+        Returns:
+            True if queued
+        """
         try:
             data = {
                 'client_id': self.client_id,
@@ -127,19 +528,34 @@ class SlckrAPIClient:
                 'python_version': python_version
             }
 
-            result = self._make_request('POST', '/api/telemetry', json=data)
-
-            if result and result.get('status') == 'success':
-                print(f"✓ Telemetry sent (v{version})")
-                return True
-            else:
-                print("⚠️ Telemetry failed")
-                return False
+            outbox, sender = self._outbox()
+            outbox.enqueue('telemetry', '/api/telemetry', data, replace_pending=True)
+            sender.notify()
+            print(f"✓ Telemetry queued (v{version})")
+            return True
 
         except Exception as e:
             print(f"⚠️ Telemetry error: {e}")
             return False
 
+    def send_metrics(self, batch: Dict, version: str, os_name: str) -> bool:
+        """
+        Queue a batch of aggregated performance histograms (lib.metrics) for /api/telemetry/batch
+
+        Returns:
+            True if queued
+        """
+        try:
+            data = dict(batch, client_id=self.client_id, version=version, os=os_name)
+            outbox, sender = self._outbox()
+            outbox.enqueue('metrics', '/api/telemetry/batch', data, compress_wire=True)
+            sender.notify()
+            return True
+
+        except Exception as e:
+            print(f"⚠️ Could not queue metrics: {e}")
+            return False
+
     def send_report(
         self,
         error_message: str,
@@ -150,13 +566,17 @@ class SlckrAPIClient:
         ai_response_json: Optional[Dict] = None,
         system_info_json: Optional[Dict] = None,
         question_screenshot_path: Optional[str] = None,
-        answer_screenshot_path: Optional[str] = None
+        answer_screenshot_path: Optional[str] = None,
+        traceback_text: Optional[str] = None
     ) -> Optional[str]:
         """
-        Send error report to backend
+        Queue an error report for the backend
+
+        Returns immediately: the report and screenshots are written to the outbox
+        and delivered by the background sender (retried until the server accepts it).
 
         Returns:
-            Report ID if successful, None otherwise
+            Outbox key (the report's idempotency key) if queued, None otherwise
         """
         try:
             # Prepare report data (matching backend field names)
@@ -175,60 +595,24 @@ class SlckrAPIClient:
                 report_data['ai_response_data'] = ai_response_json  # Backend expects 'ai_response_data'
             if system_info_json:
                 report_data['system_info'] = system_info_json  # Backend expects 'system_info'
-
-            # Prepare file uploads
-            files = {}
-            file_handles = []
-
-            try:
-                if question_screenshot_path and os.path.exists(question_screenshot_path):
-                    fh = open(question_screenshot_path, 'rb')
-                    files['question_screenshot'] = ('question.png', fh, 'image/png')
-                    file_handles.append(fh)
-
-                if answer_screenshot_path and os.path.exists(answer_screenshot_path):
-                    fh = open(answer_screenshot_path, 'rb')
-                    files['answer_screenshot'] = ('answer.png', fh, 'image/png')
-                    file_handles.append(fh)
-
-                # Send request with proper format
-                if files:
-                    # Multipart request: Send JSON as 'report_data' form field
-                    form_data = {
-                        'report_data': json.dumps(report_data, default=str)
-                    }
-                    result = self._make_request(
-                        'POST',
-                        '/api/report',
-                        data=form_data,
-                        files=files
-                    )
-                else:
-                    # Pure JSON request (no files)
-                    result = self._make_request(
-                        'POST',
-                        '/api/report',
-                        json=report_data
-                    )
-
-            finally:
-                # Always close file handles
-                for fh in file_handles:
-                    try:
-                        fh.close()
-                    except:
-                        pass
-
-            if result and result.get('status') == 'success':
-                report_id = result.get('report_id')
-                print(f"✓ Error report sent (ID: {report_id})")
-                return report_id
-            else:
-                print(f"⚠️ Error report failed: {result.get('message', 'Unknown error') if result else 'No response'}")
-                return None
+            if traceback_text:
+                report_data['traceback'] = traceback_text  # Backend groups reports by its frames
+
+            # Screenshots are copied into the outbox (the originals may be temp files)
+            attachments = {}
+            if question_screenshot_path:
+                attachments['question_screenshot'] = ('question.png', question_screenshot_path)
+            if answer_screenshot_path:
+                attachments['answer_screenshot'] = ('answer.png', answer_screenshot_path)
+
+            outbox, sender = self._outbox()
+            key = outbox.enqueue('report', '/api/report', report_data, attachments=attachments)
+            sender.notify()
+            print(f"✓ Error report queued (key: {key[:8]}..., {outbox.stats()['items']} pending)")
+            return key
 
         except Exception as e:
-            print(f"⚠️ Could not send error report: {e}")
+            print(f"⚠️ Could not queue error report: {e}")
             return None
 
     def get_stats(self, admin_token: str) -> Optional[Dict]:
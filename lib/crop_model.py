@@ -0,0 +1,220 @@
+"""
+HW Helper Crop Model
+====================
+Non-destructive crops: the captured screenshot is never modified, a crop is a
+rectangle (in original pixel coordinates) pushed on a stack, so crops can be
+undone and redone freely.
+
+Nothing is encoded when the user crops. The cropped pixels are only written to
+disk (PNG) when something needs a file - the AI request or OCR - and that happens
+on their worker threads via materialize(). Results are cached by crop rectangle,
+so sending the same crop again, or undoing back to it, reuses the file.
+
+Usage:
+    stack = CropStack(original_image, "/path/capture.png")
+    stack.push_selection((40, 30, 400, 260), display_size=(800, 450))   # UI thread
+    view = stack.view()            # PIL image of the current crop, for display
+    stack.undo(); stack.redo()
+    path = stack.materialize()     # worker thread: crop + encode once per rectangle
+    data = encode_image_base64(path)   # request body for the AI call
+
+This module must stay dependency-free (stdlib only) - images are used through the
+PIL Image methods crop/save and the size attribute.
+"""
+
+import base64
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+Rect = Tuple[int, int, int, int]   # (x1, y1, x2, y2) in original image pixels
+
+CROP_CACHE_DIR = Path(tempfile.gettempdir()) / "hwhelper_crops"
+CROP_FILE_MAX_AGE = 24 * 3600      # cleanup_crop_files() removes older materialized crops
+MAX_CACHED_VIEWS = 4               # Cropped PIL views kept for undo/redo display
+MIN_CROP_SIZE = 2                  # Smaller rectangles (original pixels) are rejected
+
+
+class CropStack:
+    """
+    Crop rectangles over one immutable original image, with undo/redo.
+
+    Each rectangle is absolute (original coordinates) and lies inside the one
+    below it. Navigation methods are for the UI thread; materialize() may run on
+    any thread.
+    """
+
+    def __init__(self, original: Any, source_path: Optional[str] = None):
+        self.original = original
+        self.source_path = source_path
+        self._rects: List[Rect] = []
+        self._redo: List[Rect] = []
+        self._views: "OrderedDict[Rect, Any]" = OrderedDict()
+        self._lock = threading.Lock()          # Guards _materialized
+        self._encode_lock = threading.Lock()   # One encode at a time per stack
+        self._materialized: Dict[Rect, str] = {}
+        source_id = source_path or f"memory-{id(original)}-{time.time()}"
+        self._file_prefix = f"{Path(source_path or 'capture').stem}_{hashlib.sha1(source_id.encode('utf-8')).hexdigest()[:8]}"
+
+    # ---- navigation ----
+
+    @property
+    def full_rect(self) -> Rect:
+        width, height = self.original.size
+        return (0, 0, width, height)
+
+    @property
+    def rect(self) -> Rect:
+        """Current crop rectangle (the full image if nothing is cropped)"""
+        return self._rects[-1] if self._rects else self.full_rect
+
+    @property
+    def cropped(self) -> bool:
+        return bool(self._rects)
+
+    @property
+    def depth(self) -> int:
+        return len(self._rects)
+
+    def can_undo(self) -> bool:
+        return bool(self._rects)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def push(self, rect: Rect) -> Optional[Rect]:
+        """Crop further to an original-coordinates rectangle (clamped to the current crop)"""
+        cx1, cy1, cx2, cy2 = self.rect
+        x1, y1 = max(cx1, min(int(rect[0]), cx2)), max(cy1, min(int(rect[1]), cy2))
+        x2, y2 = max(cx1, min(int(rect[2]), cx2)), max(cy1, min(int(rect[3]), cy2))
+        if x2 - x1 < MIN_CROP_SIZE or y2 - y1 < MIN_CROP_SIZE:
+            return None
+        new_rect = (x1, y1, x2, y2)
+        if new_rect == self.rect:
+            return None
+        self._rects.append(new_rect)
+        self._redo.clear()
+        return new_rect
+
+    def push_selection(self, selection: Tuple[int, int, int, int], display_size: Tuple[int, int]) -> Optional[Rect]:
+        """
+        Crop to a selection made on the displayed view
+
+        Args:
+            selection: (x1, y1, x2, y2) in display pixels
+            display_size: (width, height) the current view is displayed at
+
+        Returns:
+            The new rectangle, or None if the selection is empty/invalid
+        """
+        disp_w, disp_h = display_size
+        if disp_w <= 0 or disp_h <= 0:
+            return None
+        cx1, cy1, cx2, cy2 = self.rect
+        scale_x, scale_y = (cx2 - cx1) / disp_w, (cy2 - cy1) / disp_h
+        sel_x1, sel_y1 = min(selection[0], selection[2]), min(selection[1], selection[3])
+        sel_x2, sel_y2 = max(selection[0], selection[2]), max(selection[1], selection[3])
+        return self.push((cx1 + int(sel_x1 * scale_x), cy1 + int(sel_y1 * scale_y),
+                          cx1 + int(sel_x2 * scale_x), cy1 + int(sel_y2 * scale_y)))
+
+    def undo(self) -> bool:
+        if not self._rects:
+            return False
+        self._redo.append(self._rects.pop())
+        return True
+
+    def redo(self) -> bool:
+        if not self._redo:
+            return False
+        self._rects.append(self._redo.pop())
+        return True
+
+    def view(self) -> Any:
+        """Image of the current crop (the original itself if uncropped); recent views are reused"""
+        rect = self.rect
+        if rect == self.full_rect:
+            return self.original
+        view = self._views.get(rect)
+        if view is None:
+            view = self._views[rect] = self.original.crop(rect)
+            while len(self._views) > MAX_CACHED_VIEWS:
+                self._views.popitem(last=False)
+        else:
+            self._views.move_to_end(rect)
+        return view
+
+    # ---- materialization ----
+
+    def materialized_path(self, rect: Optional[Rect] = None) -> Optional[str]:
+        """File of an already materialized crop (never encodes); the source file if uncropped"""
+        rect = rect or self.rect
+        if rect == self.full_rect and self.source_path:
+            return self.source_path
+        with self._lock:
+            path = self._materialized.get(rect)
+        return path if path and os.path.exists(path) else None
+
+    def materialize(self, rect: Optional[Rect] = None, directory: Path = CROP_CACHE_DIR) -> str:
+        """
+        File with the pixels of a crop, encoding it on first use (slow - call off the UI thread)
+
+        Args:
+            rect: Crop to materialize (defaults to the current one - pass it explicitly
+                when the stack may change meanwhile)
+
+        Returns:
+            PNG path (the source file itself for the uncropped image)
+        """
+        rect = rect or self.rect
+        with self._encode_lock:
+            path = self.materialized_path(rect)
+            if path:
+                return path
+
+            directory = Path(directory)
+            directory.mkdir(parents=True, exist_ok=True)
+            x1, y1, x2, y2 = rect
+            path = str(directory / f"{self._file_prefix}_crop_{x1}_{y1}_{x2}_{y2}.png")
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            self.original.crop(rect).save(tmp_path, format="PNG")
+            os.replace(tmp_path, path)
+            with self._lock:
+                self._materialized[rect] = path
+            return path
+
+
+def encode_image_base64(path: str) -> str:
+    """Base64 text of an image file, as sent to the AI (call off the UI thread)"""
+    with open(path, "rb") as f:
+        return base64.b64encode(f.read()).decode("utf-8")
+
+
+def cleanup_crop_files(directory: Path = CROP_CACHE_DIR, max_age: float = CROP_FILE_MAX_AGE) -> int:
+    """Delete materialized crops older than max_age seconds; returns how many were removed"""
+    removed = 0
+    cutoff = time.time() - max_age
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return 0
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+__all__ = [
+    'CropStack',
+    'cleanup_crop_files',
+    'encode_image_base64',
+    'CROP_CACHE_DIR',
+]
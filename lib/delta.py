@@ -0,0 +1,237 @@
+"""
+HW Helper Delta Format
+======================
+Binary deltas between two versions of a file, used by the auto-updater so that a
+small change to a large file (e.g. ui.py) doesn't re-download the whole file.
+
+The diff is an rsync-style rolling-hash block match: the old file is indexed in
+fixed-size blocks, the new file is scanned with a rolling checksum, and matches are
+extended greedily. The result is a list of COPY (from old file) / INSERT (literal
+bytes) operations, zlib-compressed.
+
+Delta layout:
+    MAGIC (8 bytes) + zlib(
+        sha256(new) (32 bytes) + varint(new_size) + varint(old_size) +
+        ops: 0x00 varint(offset) varint(length)   COPY from old
+             0x01 varint(length) bytes            INSERT literal
+    )
+
+Built at release time by build_deltas.py; applied by AutoUpdater, which verifies
+the result against file_hashes and falls back to the full file on any mismatch.
+
+This module must stay dependency-free (stdlib only) - it is used by the updater.
+"""
+
+import hashlib
+import zlib
+from typing import Dict, List, Tuple
+
+MAGIC = b"HWDELTA1"
+BLOCK_SIZE = 32          # Bytes per indexed block in the old file
+MIN_MATCH = BLOCK_SIZE   # Shorter matches are cheaper as literals
+
+_OP_COPY = 0
+_OP_INSERT = 1
+_MOD = 1 << 16
+
+
+class DeltaError(Exception):
+    """Delta is malformed or does not apply to the given file"""
+    pass
+
+
+# ============================================================================
+# ENCODING HELPERS
+# ============================================================================
+
+def _write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise DeltaError("Truncated delta")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def _weak_checksum(block: bytes) -> Tuple[int, int]:
+    """rsync weak checksum components (a, b) of a block"""
+    a = sum(block) % _MOD
+    b = sum((len(block) - i) * byte for i, byte in enumerate(block)) % _MOD
+    return a, b
+
+
+# ============================================================================
+# DIFF / PATCH
+# ============================================================================
+
+def create_delta(old: bytes, new: bytes, block_size: int = BLOCK_SIZE) -> bytes:
+    """
+    Create a delta that turns `old` into `new`
+
+    Args:
+        old: Previous file contents
+        new: New file contents
+        block_size: Block size used for matching
+
+    Returns:
+        Delta bytes (apply with apply_delta)
+    """
+    ops: List[Tuple[int, int, int]] = []  # (op, offset_or_start, length) - INSERT refers into `new`
+
+    # Index old file blocks by weak checksum
+    index: Dict[int, List[int]] = {}
+    for offset in range(0, len(old) - block_size + 1, block_size):
+        a, b = _weak_checksum(old[offset:offset + block_size])
+        index.setdefault(a | (b << 16), []).append(offset)
+
+    literal_start = 0
+    pos = 0
+    new_len = len(new)
+
+    if new_len >= block_size and index:
+        a, b = _weak_checksum(new[0:block_size])
+        while True:
+            match_offset = -1
+            for candidate in index.get(a | (b << 16), ()):
+                if old[candidate:candidate + block_size] == new[pos:pos + block_size]:
+                    match_offset = candidate
+                    break
+
+            if match_offset >= 0:
+                # Extend backwards into the pending literal, then forwards
+                start_new, start_old = pos, match_offset
+                while start_new > literal_start and start_old > 0 and new[start_new - 1] == old[start_old - 1]:
+                    start_new -= 1
+                    start_old -= 1
+                end_new, end_old = pos + block_size, match_offset + block_size
+                while end_new < new_len and end_old < len(old) and new[end_new] == old[end_old]:
+                    end_new += 1
+                    end_old += 1
+
+                if start_new > literal_start:
+                    ops.append((_OP_INSERT, literal_start, start_new - literal_start))
+                ops.append((_OP_COPY, start_old, end_new - start_new))
+                literal_start = pos = end_new
+
+                if pos + block_size > new_len:
+                    break
+                a, b = _weak_checksum(new[pos:pos + block_size])
+                continue
+
+            # Roll the checksum forward one byte
+            if pos + block_size >= new_len:
+                break
+            out_byte = new[pos]
+            in_byte = new[pos + block_size]
+            a = (a - out_byte + in_byte) % _MOD
+            b = (b - block_size * out_byte + a) % _MOD
+            pos += 1
+
+    if literal_start < new_len:
+        ops.append((_OP_INSERT, literal_start, new_len - literal_start))
+
+    # Serialize, merging adjacent copies
+    body = bytearray()
+    body += hashlib.sha256(new).digest()
+    _write_varint(body, new_len)
+    _write_varint(body, len(old))
+
+    pending_copy = None
+    for op, start, length in ops:
+        if op == _OP_COPY:
+            if pending_copy and pending_copy[0] + pending_copy[1] == start:
+                pending_copy = (pending_copy[0], pending_copy[1] + length)
+                continue
+            if pending_copy:
+                body.append(_OP_COPY)
+                _write_varint(body, pending_copy[0])
+                _write_varint(body, pending_copy[1])
+            pending_copy = (start, length)
+        else:
+            if pending_copy:
+                body.append(_OP_COPY)
+                _write_varint(body, pending_copy[0])
+                _write_varint(body, pending_copy[1])
+                pending_copy = None
+            body.append(_OP_INSERT)
+            _write_varint(body, length)
+            body += new[start:start + length]
+    if pending_copy:
+        body.append(_OP_COPY)
+        _write_varint(body, pending_copy[0])
+        _write_varint(body, pending_copy[1])
+
+    return MAGIC + zlib.compress(bytes(body), 9)
+
+
+def apply_delta(old: bytes, delta: bytes) -> bytes:
+    """
+    Apply a delta to `old`
+
+    Args:
+        old: Current file contents (must be the file the delta was built from)
+        delta: Delta bytes from create_delta
+
+    Returns:
+        New file contents (SHA256 verified against the hash stored in the delta)
+
+    Raises:
+        DeltaError: Malformed delta, wrong base file, or hash mismatch
+    """
+    if not delta.startswith(MAGIC):
+        raise DeltaError("Not a delta file")
+    try:
+        body = zlib.decompress(delta[len(MAGIC):])
+    except zlib.error as e:
+        raise DeltaError(f"Corrupt delta: {e}")
+
+    if len(body) < 32:
+        raise DeltaError("Truncated delta")
+    expected_digest = body[:32]
+    new_size, pos = _read_varint(body, 32)
+    old_size, pos = _read_varint(body, pos)
+    if old_size != len(old):
+        raise DeltaError(f"Delta expects a {old_size}-byte base file, got {len(old)} bytes")
+
+    out = bytearray()
+    while pos < len(body):
+        op = body[pos]
+        pos += 1
+        if op == _OP_COPY:
+            offset, pos = _read_varint(body, pos)
+            length, pos = _read_varint(body, pos)
+            if offset + length > len(old):
+                raise DeltaError("Copy outside base file")
+            out += old[offset:offset + length]
+        elif op == _OP_INSERT:
+            length, pos = _read_varint(body, pos)
+            if pos + length > len(body):
+                raise DeltaError("Truncated literal")
+            out += body[pos:pos + length]
+            pos += length
+        else:
+            raise DeltaError(f"Unknown delta op {op}")
+
+    if len(out) != new_size or hashlib.sha256(out).digest() != expected_digest:
+        raise DeltaError("Patched file does not match expected hash")
+    return bytes(out)
+
+
+__all__ = [
+    'DeltaError',
+    'create_delta',
+    'apply_delta',
+    'BLOCK_SIZE',
+]
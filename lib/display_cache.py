@@ -0,0 +1,186 @@
+"""
+HW Helper Display Image Cache
+=============================
+Downscaled copies of screenshots for the screenshot area, cached by
+(image, target size, theme) so re-rendering the same screenshot - after a recrop
+preview, an error message, a history step or a window resize back to a size seen
+before - does not resize the multi-megapixel original again.
+
+Downscaling happens in two passes:
+- fast: integer box reduce (Image.reduce) to near the target size, then a bilinear
+  resize - a few ms even for 4K captures; JPEG files opened for display are also
+  decoded at reduced scale (Image.draft)
+- refined: a LANCZOS resize from the original, computed off the Tk thread when the
+  UI is idle and swapped into the cache (and the label) when ready
+
+Each cache entry also keeps the display object built from the resized image (a
+CTkImage in the app), so its internal PhotoImage cache is reused as well.
+
+Usage:
+    cache = DisplayImageCache(lambda img: ctk.CTkImage(img, img, size=img.size))
+    display, refined = cache.get(original, (800, 450), "Dark")
+    if not refined:
+        sharp = cache.render_refined(original, (800, 450))      # worker thread
+        display = cache.put_refined(original, (800, 450), "Dark", sharp)  # Tk thread
+"""
+
+import threading
+import weakref
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from PIL import Image
+
+DISPLAY_CACHE_MAX_BYTES = 64 * 1024 * 1024   # Resized pixels (display objects roughly double this)
+FAST_REDUCE_MIN_FACTOR = 2                   # Box-reduce first when the source is at least 2x the target
+
+# Modes Image.reduce works on; anything else is converted first
+_REDUCIBLE_MODES = ("L", "LA", "RGB", "RGBA", "RGBX", "RGBa", "La", "I", "F")
+
+
+def fast_downscale(image: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    """Quick resize for immediate display: integer box reduce, then bilinear"""
+    if image.mode not in _REDUCIBLE_MODES:
+        image = image.convert("RGBA")
+    factor = min(image.width // size[0], image.height // size[1])
+    if factor >= FAST_REDUCE_MIN_FACTOR:
+        image = image.reduce(factor)
+    if image.size == tuple(size):
+        return image
+    return image.resize(size, Image.Resampling.BILINEAR)
+
+
+def draft_for_display(image: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    """
+    Before an opened JPEG is decoded, ask for the smallest DCT scale that is still
+    at least `size` (much faster for large photos); other formats are unchanged
+    """
+    if image.format == "JPEG":
+        image.draft("RGB", (int(size[0]), int(size[1])))
+    return image
+
+
+class DisplayImageCache:
+    """
+    LRU cache of display-sized images, bounded by pixel bytes.
+
+    Images are identified by object (a token per live PIL image, dropped when the
+    image is garbage collected) or by an explicit key such as "path|mtime".
+    get()/put_refined() are for the Tk thread; render_refined() for any thread.
+    """
+
+    def __init__(self, make_display: Callable[[Image.Image], Any], max_bytes: int = DISPLAY_CACHE_MAX_BYTES):
+        self.make_display = make_display
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # (image_key, size, theme) -> [resized, display or None, refined, nbytes]
+        self._entries: "OrderedDict[Tuple, list]" = OrderedDict()
+        self._tokens: Dict[int, int] = {}   # id(image) -> token
+        self._forgotten = deque()           # (id(image), token) of collected images, applied under the lock
+        self._next_token = 1
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def image_key(self, image: Image.Image, key: Optional[str] = None):
+        """Cache identity of an image (explicit key, or a token tied to the object's lifetime)"""
+        if key is not None:
+            return key
+        with self._lock:
+            self._drop_forgotten()
+            token = self._tokens.get(id(image))
+            if token is None:
+                token = self._tokens[id(image)] = self._next_token
+                self._next_token += 1
+                weakref.finalize(image, self._forget, id(image), token)
+            return token
+
+    def _forget(self, image_id: int, token: int):
+        """
+        The image was garbage collected: queue its token and entries for removal.
+        Finalizers can run while this thread holds the lock (an entry or the
+        collector releasing the last reference), so this must not take it.
+        """
+        self._forgotten.append((image_id, token))
+
+    def _drop_forgotten(self):
+        """Apply queued _forget() calls (caller holds the lock)"""
+        while self._forgotten:
+            image_id, token = self._forgotten.popleft()
+            if self._tokens.get(image_id) == token:
+                del self._tokens[image_id]
+            for cache_key in [k for k in self._entries if k[0] == token]:
+                self._bytes -= self._entries.pop(cache_key)[3]
+
+    def get(self, image: Image.Image, size: Tuple[int, int], theme: str,
+            key: Optional[str] = None) -> Tuple[Any, bool]:
+        """
+        Display object for an image at a size (fast downscale on a miss)
+
+        Returns:
+            (display object, refined) - refined is False until a LANCZOS version
+            has been put in with put_refined()
+        """
+        size = (int(size[0]), int(size[1]))
+        cache_key = (self.image_key(image, key), size, theme)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+        if entry is None:
+            self.misses += 1
+            exact = image.size == size
+            # Copy exact-size images: an entry must never keep its own source alive
+            resized = image.copy() if exact else fast_downscale(image, size)
+            entry = self._store(cache_key, resized, refined=exact)
+        if entry[1] is None:
+            entry[1] = self.make_display(entry[0])
+        return entry[1], entry[2]
+
+    @staticmethod
+    def render_refined(image: Image.Image, size: Tuple[int, int]) -> Image.Image:
+        """High-quality (LANCZOS) resize - slow on large images, run it off the Tk thread"""
+        return image.resize((int(size[0]), int(size[1])), Image.Resampling.LANCZOS)
+
+    def put_refined(self, image: Image.Image, size: Tuple[int, int], theme: str,
+                    refined_image: Image.Image, key: Optional[str] = None) -> Any:
+        """Replace a fast entry with its refined version; returns the new display object"""
+        size = (int(size[0]), int(size[1]))
+        entry = self._store((self.image_key(image, key), size, theme), refined_image, refined=True)
+        entry[1] = self.make_display(refined_image)
+        return entry[1]
+
+    def _store(self, cache_key: Tuple, resized: Image.Image, refined: bool) -> list:
+        nbytes = resized.width * resized.height * len(resized.getbands())
+        entry = [resized, None, refined, nbytes]
+        with self._lock:
+            self._drop_forgotten()
+            old = self._entries.pop(cache_key, None)
+            if old is not None:
+                self._bytes -= old[3]
+            self._entries[cache_key] = entry
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[3]
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._drop_forgotten()
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._drop_forgotten()
+            return {"entries": len(self._entries), "bytes": self._bytes, "hits": self.hits, "misses": self.misses}
+
+
+__all__ = [
+    'DisplayImageCache',
+    'fast_downscale',
+    'draft_for_display',
+    'DISPLAY_CACHE_MAX_BYTES',
+]
@@ -17,6 +17,8 @@ import re
 import os
 import traceback
 import threading
+import hashlib
+from collections import OrderedDict
 
 
 # ============================================================================
@@ -1455,8 +1457,11 @@ class EdmentumQuestionRenderer:
             # Create EdmentumHotSpot component (displays text list in answer container)
             EdmentumHotSpot(parent, question_text, hot_spot_answers)
 
-            # Trigger screenshot annotation if UI instance provided
-            if ui_instance and hasattr(ui_instance, '_annotate_screenshot_with_boxes'):
+            # Trigger screenshot annotation if UI instance provided (OCR off the UI thread)
+            if ui_instance and hasattr(ui_instance, '_annotate_hot_spots_in_background'):
+                print("📦 Triggering screenshot annotation...")
+                ui_instance._annotate_hot_spots_in_background(hot_spot_answers)
+            elif ui_instance and hasattr(ui_instance, '_annotate_screenshot_with_boxes'):
                 print("📦 Triggering screenshot annotation...")
                 annotated_path = ui_instance._annotate_screenshot_with_boxes(hot_spot_answers)
 
@@ -1999,87 +2004,138 @@ def create_visual_answer_overlay(base_image_path: str,
 # OCR-BASED HOT SPOT DETECTOR (from ocr_hotspot_detector.py)
 # ============================================================================
 
-# Global cached EasyOCR reader (initialized on app startup)
-_cached_reader = None
-_reader_lock = threading.Lock()
-_initialization_complete = False
+# EasyOCR runs in a separate worker process (lib/ocr.py) so model loading and
+# readtext never hold the GUI process's GIL (v1.0.69)
+OCR_REQUEST_TIMEOUT = 30.0
 
 
-def initialize_easyocr_async():
+def initialize_easyocr():
     """
-    Initialize EasyOCR reader in background thread (call at app startup).
+    Start the EasyOCR worker process (non-blocking). Safe to call more than once.
 
-    This prevents delays when user clicks "Get AI Answer" button by pre-loading
-    the neural network models (~150MB) and PyTorch backend during app startup.
+    The worker loads the neural network models (~150MB) and PyTorch backend in its
+    own process, so hot spot detection is instant later without freezing the UI.
+    Normally run by the startup scheduler after first paint.
     """
-    global _cached_reader, _initialization_complete
+    from .ocr import get_ocr_worker
+    get_ocr_worker().warm_up()
 
-    def _init():
-        global _cached_reader, _initialization_complete
 
-        with _reader_lock:
-            if _cached_reader is not None:
-                return  # Already initialized
-
-            try:
-                import easyocr
-                print("🔄 [Background] Initializing EasyOCR reader for zero-latency hot spot detection...")
-                _cached_reader = easyocr.Reader(['en'], gpu=False, verbose=False)
-                _initialization_complete = True
-                print("✅ [Background] EasyOCR ready - hot spot detection will be instant!")
-            except Exception as e:
-                print(f"⚠️ [Background] EasyOCR initialization failed: {e}")
-                print(f"   Will fall back to AI percentage-based coordinates")
-                _initialization_complete = True  # Mark complete even on failure
+def initialize_easyocr_async():
+    """
+    Initialize EasyOCR in the background (call at app startup).
 
-    # Start background thread
-    thread = threading.Thread(target=_init, daemon=True, name="EasyOCR-Init")
-    thread.start()
+    Kept for compatibility - the worker process already loads asynchronously.
+    """
+    initialize_easyocr()
 
 
 def get_easyocr_reader():
-    """Get cached EasyOCR reader (blocks if initialization still in progress)"""
-    global _cached_reader, _initialization_complete
+    """
+    Get the OCR worker client (starts it if needed)
 
-    # Wait for background initialization to complete
-    if not _initialization_complete:
-        print("⏳ Waiting for EasyOCR initialization to complete...")
-        with _reader_lock:
-            pass  # Just need to acquire lock, which means init is done
+    Returns:
+        OCRWorker (has readtext(image, timeout=...)) or None if EasyOCR is unavailable
+    """
+    from .ocr import get_ocr_worker
+    worker = get_ocr_worker()
+    if not worker.wait_ready():
+        return None
+    return worker
+
+
+# Raw OCR results per image content hash, so re-annotating the same screenshot
+# never re-OCRs the same pixels. Each entry: {"full": results or None, "regions": {rect: results}}
+_OCR_CACHE_MAX_IMAGES = 16
+_ocr_result_cache: "OrderedDict[str, Dict]" = OrderedDict()
+_ocr_cache_lock = threading.Lock()
+
+# Regions around the AI's hotspot_data are grown by this fraction of their size on each
+# side (AI coordinates are approximate and the label usually sits below the picture)
+ROI_MARGIN = 0.5
+ROI_MIN_SIZE = 48  # px - smaller crops are too small for the text detector
+
+
+def _image_content_hash(image_path: str) -> str:
+    """Hash screenshot file bytes (cache key for OCR results)"""
+    digest = hashlib.sha1()
+    with open(image_path, 'rb') as f:
+        for block in iter(lambda: f.read(65536), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _get_ocr_cache_entry(image_hash: str) -> Dict:
+    with _ocr_cache_lock:
+        entry = _ocr_result_cache.get(image_hash)
+        if entry is None:
+            entry = {"full": None, "regions": {}}
+            _ocr_result_cache[image_hash] = entry
+            while len(_ocr_result_cache) > _OCR_CACHE_MAX_IMAGES:
+                _ocr_result_cache.popitem(last=False)
+        else:
+            _ocr_result_cache.move_to_end(image_hash)
+        return entry
 
-    return _cached_reader
 
+def clear_ocr_cache():
+    """Drop all cached OCR results"""
+    with _ocr_cache_lock:
+        _ocr_result_cache.clear()
 
-def detect_hotspot_locations(image_path: str, target_labels: List[str],
-                             padding_multiplier: float = 3.0) -> Dict[str, Dict[str, int]]:
+
+def _regions_to_rects(regions: Dict[str, Dict], image_size: Tuple[int, int]) -> List[Tuple[int, int, int, int]]:
     """
-    Use OCR to find exact locations of text labels in an image and generate
-    bounding boxes that include both the label and the organism image above it.
+    Convert hotspot_data percentages to padded pixel rectangles, merging overlaps
 
     Returns:
-        Dictionary mapping label name -> bounding box dict with keys:
-            'x', 'y', 'width', 'height', 'confidence', 'original_text'
+        List of (left, top, right, bottom) rectangles
     """
-    print(f"🔍 Starting OCR detection for labels: {target_labels}")
+    width, height = image_size
+    rects = []
+    for data in regions.values():
+        if not data:
+            continue
+        x = data.get('x_percent', 0) / 100 * width
+        y = data.get('y_percent', 0) / 100 * height
+        w = max(data.get('width_percent', 10) / 100 * width, ROI_MIN_SIZE)
+        h = max(data.get('height_percent', 10) / 100 * height, ROI_MIN_SIZE)
+        pad_x, pad_y = w * ROI_MARGIN, h * ROI_MARGIN
+        rects.append((
+            max(0, int(x - pad_x)), max(0, int(y - pad_y)),
+            min(width, int(x + w + pad_x)), min(height, int(y + h + pad_y)),
+        ))
+
+    # Merge overlapping rectangles so shared pixels are only OCR'd once
+    merged = True
+    while merged:
+        merged = False
+        for i in range(len(rects)):
+            for j in range(i + 1, len(rects)):
+                a, b = rects[i], rects[j]
+                if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                    rects[i] = (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+                    del rects[j]
+                    merged = True
+                    break
+            if merged:
+                break
+    return [r for r in rects if r[2] - r[0] > 0 and r[3] - r[1] > 0]
 
-    # Get cached EasyOCR reader
-    reader = get_easyocr_reader()
-    if reader is None:
-        print("⚠️ EasyOCR reader not available, falling back to AI coordinates")
-        return {}
 
-    try:
-        # Run OCR detection
-        ocr_results = reader.readtext(image_path)
-        print(f"   EasyOCR detected {len(ocr_results)} text regions")
-    except Exception as e:
-        print(f"⚠️ EasyOCR detection failed: {e}")
-        return {}
+def _offset_ocr_results(results: List, left: int, top: int) -> List:
+    """Translate OCR boxes from crop coordinates to full-image coordinates"""
+    return [
+        ([[px + left, py + top] for px, py in bbox], text, confidence)
+        for bbox, text, confidence in results
+    ]
 
-    results = {}
+
+def _match_ocr_labels(ocr_results: List, target_labels: List[str], padding_multiplier: float,
+                      results: Dict[str, Dict[str, int]]):
+    """Match OCR text regions against target labels, keeping the best match per label"""
     target_labels_lower = [label.lower().strip() for label in target_labels]
 
-    # Process EasyOCR results
     for bbox, text, confidence in ocr_results:
         if not text or not text.strip():
             continue
@@ -2113,31 +2169,91 @@ def detect_hotspot_locations(image_path: str, target_labels: List[str],
                 confidence_pct = int(confidence * 100)
 
                 # Keep highest confidence match for each label
-                if original_label in results:
-                    if confidence_pct > results[original_label]['confidence']:
-                        results[original_label] = {
-                            'x': expanded_x,
-                            'y': expanded_y,
-                            'width': expanded_w,
-                            'height': expanded_h,
-                            'confidence': confidence_pct,
-                            'original_text': text
-                        }
-                else:
-                    results[original_label] = {
-                        'x': expanded_x,
-                        'y': expanded_y,
-                        'width': expanded_w,
-                        'height': expanded_h,
-                        'confidence': confidence_pct,
-                        'original_text': text
-                    }
+                if original_label in results and confidence_pct <= results[original_label]['confidence']:
+                    continue
+
+                results[original_label] = {
+                    'x': expanded_x,
+                    'y': expanded_y,
+                    'width': expanded_w,
+                    'height': expanded_h,
+                    'confidence': confidence_pct,
+                    'original_text': text
+                }
 
                 print(f"   ✓ Found '{text}' (matched '{original_label}') at ({x}, {y}) "
                       f"with {confidence_pct}% confidence")
                 print(f"     Expanded box: ({expanded_x}, {expanded_y}) "
                       f"{expanded_w}x{expanded_h}")
 
+
+def detect_hotspot_locations(image_path: str, target_labels: List[str],
+                             padding_multiplier: float = 3.0,
+                             regions: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Use OCR to find exact locations of text labels in an image and generate
+    bounding boxes that include both the label and the organism image above it.
+
+    Args:
+        image_path: Screenshot path
+        target_labels: Label texts to find
+        padding_multiplier: How far boxes are expanded above the label (in label heights)
+        regions: Optional label -> hotspot_data (x/y/width/height_percent) from the AI.
+                 When given, only padded crops around these regions are OCR'd (in one
+                 batch); the full image is only OCR'd for labels not found in them.
+
+    Returns:
+        Dictionary mapping label name -> bounding box dict with keys:
+            'x', 'y', 'width', 'height', 'confidence', 'original_text'
+    """
+    print(f"🔍 Starting OCR detection for labels: {target_labels}")
+
+    # Get OCR worker
+    reader = get_easyocr_reader()
+    if reader is None:
+        print("⚠️ EasyOCR reader not available, falling back to AI coordinates")
+        return {}
+
+    results = {}
+    try:
+        image_hash = _image_content_hash(image_path)
+        cache_entry = _get_ocr_cache_entry(image_hash)
+
+        # Decode once - crops and the full image are sent to the worker from memory
+        with Image.open(image_path) as img:
+            image = img.convert('RGB')
+
+        # PHASE 1: OCR only the regions the AI pointed at
+        if regions:
+            rects = _regions_to_rects(regions, image.size)
+            missing = [r for r in rects if r not in cache_entry["regions"]]
+            if missing:
+                crops = [image.crop(rect) for rect in missing]
+                batch_results = reader.readtext_batch(crops, timeout=OCR_REQUEST_TIMEOUT)
+                for rect, crop_results in zip(missing, batch_results):
+                    if crop_results is not None:
+                        cache_entry["regions"][rect] = _offset_ocr_results(crop_results, rect[0], rect[1])
+            cached = len(rects) - len(missing)
+            print(f"   ROI OCR: {len(rects)} region(s), {cached} from cache")
+
+            for rect in rects:
+                _match_ocr_labels(cache_entry["regions"].get(rect, []), target_labels,
+                                  padding_multiplier, results)
+
+        # PHASE 2: Full-image OCR for anything the regions didn't cover
+        remaining = [label for label in target_labels if label not in results]
+        if remaining:
+            if cache_entry["full"] is None:
+                cache_entry["full"] = reader.readtext(image, timeout=OCR_REQUEST_TIMEOUT)
+                print(f"   EasyOCR detected {len(cache_entry['full'])} text regions")
+            else:
+                print(f"   Using cached full-image OCR ({len(cache_entry['full'])} text regions)")
+            _match_ocr_labels(cache_entry["full"], remaining, padding_multiplier, results)
+
+    except Exception as e:
+        print(f"⚠️ EasyOCR detection failed: {e}")
+        return results
+
     if results:
         print(f"✅ OCR detected {len(results)}/{len(target_labels)} labels")
     else:
@@ -2211,8 +2327,10 @@ __all__ = [
     'create_visual_answer_overlay',
 
     # OCR hot spot detection
+    'initialize_easyocr',
     'initialize_easyocr_async',
     'get_easyocr_reader',
     'detect_hotspot_locations',
+    'clear_ocr_cache',
     'visualize_detections',
 ]
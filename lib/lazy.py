@@ -0,0 +1,304 @@
+"""
+HW Helper Lazy Import Support
+=============================
+Deferred module loading and startup profiling.
+
+Heavy dependencies (selenium, numpy, easyocr, lib.capture, lib.edmentum renderers)
+are bound to lazy proxies at import time and only loaded on first real use, so the
+main window can appear before they are imported.
+
+This module also provides a `python -X importtime`-style startup report:
+- enable_import_profiling(): records every first-time import (self / cumulative time)
+- mark(): records named startup phases (e.g. "ui_imported", "first_paint")
+- print_startup_report(): prints phases, slowest imports, lazy loads and budget status
+
+This module must stay dependency-free (stdlib only) - it is imported first.
+"""
+
+import builtins
+import importlib
+import importlib.util
+import os
+import sys
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Import-time budget for everything loaded before the first paint (override with env var)
+STARTUP_IMPORT_BUDGET_MS = float(os.environ.get("HWHELPER_IMPORT_BUDGET_MS", "1500"))
+
+_PROCESS_START = time.perf_counter()
+_lock = threading.Lock()
+
+# Startup phases: list of (name, ms since process start)
+_phases: List[Tuple[str, float]] = []
+
+# Lazy proxy loads: list of (module name, load ms, thread name)
+_lazy_loads: List[Tuple[str, float, str]] = []
+
+# Import profiler records: list of (module name, self ms, cumulative ms, depth)
+_import_records: List[Tuple[str, float, float, int]] = []
+_original_import = None
+_import_state = threading.local()
+
+
+# ============================================================================
+# LAZY PROXIES
+# ============================================================================
+
+def _load_module(module_name: str):
+    """Import a module, recording how long the first load took"""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    with _lock:
+        _lazy_loads.append((module_name, elapsed_ms, threading.current_thread().name))
+    return module
+
+
+class LazyModule:
+    """Module proxy that imports the real module on first attribute access"""
+
+    __slots__ = ("_lazy_name", "_lazy_module")
+
+    def __init__(self, module_name: str):
+        object.__setattr__(self, "_lazy_name", module_name)
+        object.__setattr__(self, "_lazy_module", None)
+
+    def _load(self):
+        module = self._lazy_module
+        if module is None:
+            module = _load_module(self._lazy_name)
+            object.__setattr__(self, "_lazy_module", module)
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self._lazy_module is not None else "not loaded"
+        return f"<lazy module '{self._lazy_name}' ({state})>"
+
+
+class LazyAttribute:
+    """
+    Proxy for a single name from a module (class or function).
+
+    Calling the proxy or reading an attribute imports the module and forwards to
+    the real object, so call sites like `EdmentumHotSpot(parent, ...)` work unchanged.
+    """
+
+    __slots__ = ("_lazy_module", "_lazy_attr", "_lazy_target")
+
+    def __init__(self, module_name: str, attribute: str):
+        object.__setattr__(self, "_lazy_module", module_name)
+        object.__setattr__(self, "_lazy_attr", attribute)
+        object.__setattr__(self, "_lazy_target", None)
+
+    def _resolve(self):
+        target = self._lazy_target
+        if target is None:
+            target = getattr(_load_module(self._lazy_module), self._lazy_attr)
+            object.__setattr__(self, "_lazy_target", target)
+        return target
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._lazy_target is not None else "not loaded"
+        return f"<lazy {self._lazy_module}.{self._lazy_attr} ({state})>"
+
+
+def lazy_import(module_name: str, attribute: Optional[str] = None):
+    """
+    Create a lazy proxy for a module or for one attribute of a module
+
+    Args:
+        module_name: Dotted module name (e.g., "lib.edmentum")
+        attribute: Optional name inside the module (e.g., "EdmentumHotSpot")
+
+    Returns:
+        LazyModule or LazyAttribute proxy (the real object if already imported)
+    """
+    if module_name in sys.modules:
+        module = sys.modules[module_name]
+        return getattr(module, attribute) if attribute else module
+    if attribute:
+        return LazyAttribute(module_name, attribute)
+    return LazyModule(module_name)
+
+
+def module_available(module_name: str, requires: Iterable[str] = ()) -> bool:
+    """
+    Check whether a module (and its hard dependencies) can be imported, without importing it
+
+    Args:
+        module_name: Module to check (e.g., "lib.capture")
+        requires: Top-level third-party packages the module imports eagerly (e.g., ["selenium"])
+
+    Returns:
+        True if all modules are found on the import path
+    """
+    try:
+        for name in (module_name, *requires):
+            if name not in sys.modules and importlib.util.find_spec(name) is None:
+                return False
+        return True
+    except (ImportError, ValueError):
+        return False
+
+
+# ============================================================================
+# STARTUP PROFILING
+# ============================================================================
+
+def mark(phase: str):
+    """Record a named startup phase (time since process start)"""
+    with _lock:
+        _phases.append((phase, (time.perf_counter() - _PROCESS_START) * 1000))
+
+
+def phase_ms(phase: str) -> Optional[float]:
+    """Get the recorded time of a startup phase in ms (None if not recorded)"""
+    with _lock:
+        for name, at_ms in _phases:
+            if name == phase:
+                return at_ms
+    return None
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """builtins.__import__ replacement that times first-time module loads"""
+    if level != 0 or name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+
+    stack = getattr(_import_state, "stack", None)
+    if stack is None:
+        stack = _import_state.stack = []
+
+    frame = [name, 0.0]  # [module name, time spent in nested imports]
+    stack.append(frame)
+    start = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        cumulative = (time.perf_counter() - start) * 1000
+        stack.pop()
+        if stack:
+            stack[-1][1] += cumulative
+        with _lock:
+            _import_records.append((name, cumulative - frame[1], cumulative, len(stack)))
+
+
+def enable_import_profiling():
+    """Start recording per-module import times (call as early as possible)"""
+    global _original_import
+    if _original_import is not None:
+        return
+    _original_import = builtins.__import__
+    builtins.__import__ = _timed_import
+
+
+def disable_import_profiling():
+    """Stop recording import times"""
+    global _original_import
+    if _original_import is None:
+        return
+    builtins.__import__ = _original_import
+    _original_import = None
+
+
+def import_profiling_enabled() -> bool:
+    return _original_import is not None
+
+
+def get_startup_stats() -> Dict:
+    """Snapshot of startup timings (phases, slowest imports, lazy loads)"""
+    with _lock:
+        top_level = [r for r in _import_records if r[3] == 0]
+        return {
+            "phases": list(_phases),
+            "imports": list(_import_records),
+            "import_total_ms": sum(r[2] for r in top_level),
+            "lazy_loads": list(_lazy_loads),
+        }
+
+
+def print_startup_report(stream=None, top: int = 15, budget_phase: str = "first_paint"):
+    """
+    Print a `python -X importtime`-style startup report
+
+    Args:
+        stream: Output stream (defaults to the real console, bypassing UI redirection)
+        top: Number of slowest imports to list
+        budget_phase: Phase the import budget applies to
+    """
+    stream = stream or sys.__stdout__
+    if stream is None:
+        return
+
+    stats = get_startup_stats()
+    lines = ["", "=" * 60, "Startup report", "=" * 60]
+
+    if stats["phases"]:
+        lines.append("Phases (ms since process start):")
+        for name, at_ms in stats["phases"]:
+            lines.append(f"  {at_ms:>9.1f}  {name}")
+
+    if stats["imports"]:
+        lines.append("")
+        lines.append(f"import time: {'self [ms]':>10} | {'cumulative':>10} | imported package")
+        slowest = sorted(stats["imports"], key=lambda r: r[2], reverse=True)[:top]
+        for name, self_ms, cumulative_ms, depth in slowest:
+            lines.append(f"import time: {self_ms:>10.1f} | {cumulative_ms:>10.1f} | {'  ' * depth}{name}")
+        lines.append(f"Total import time: {stats['import_total_ms']:.1f} ms")
+
+    if stats["lazy_loads"]:
+        lines.append("")
+        lines.append("Deferred (lazy) loads:")
+        for name, load_ms, thread_name in stats["lazy_loads"]:
+            lines.append(f"  {load_ms:>9.1f} ms  {name}  [{thread_name}]")
+
+    budget_at = phase_ms(budget_phase)
+    if budget_at is not None and stats["imports"]:
+        status = "OK" if stats["import_total_ms"] <= STARTUP_IMPORT_BUDGET_MS else "OVER BUDGET"
+        lines.append("")
+        lines.append(f"Import budget before {budget_phase}: {stats['import_total_ms']:.0f} / "
+                     f"{STARTUP_IMPORT_BUDGET_MS:.0f} ms ({status})")
+
+    lines.append("=" * 60)
+    try:
+        stream.write("\n".join(lines) + "\n")
+        stream.flush()
+    except Exception:
+        pass
+
+
+__all__ = [
+    'LazyModule',
+    'LazyAttribute',
+    'lazy_import',
+    'module_available',
+    'mark',
+    'phase_ms',
+    'enable_import_profiling',
+    'disable_import_profiling',
+    'import_profiling_enabled',
+    'get_startup_stats',
+    'print_startup_report',
+    'STARTUP_IMPORT_BUDGET_MS',
+]
@@ -0,0 +1,267 @@
+"""
+HW Helper File Hash Manifest
+============================
+Persisted cache of file hashes (path -> size, mtime, sha256) so update checks and
+release tooling don't re-read the whole tree on every run.
+
+A cached hash is trusted while the file's size and mtime are unchanged; anything
+else is rehashed and the entry refreshed. The manifest lives under ~/.hwhelper and
+is keyed by the project directory, so the client updater and regenerate_hashes.py
+share it for the same checkout.
+
+Release tooling also gets per-directory rollup hashes (compute_directory_hashes):
+a directory's hash covers every file below it, so a client whose installed release
+has the same rollup for a directory can skip that whole subtree.
+
+This module must stay dependency-free (stdlib only) - it is used by the updater.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MANIFEST_DIR = Path.home() / ".hwhelper" / "manifests"
+MANIFEST_FORMAT = 1
+HASH_CHUNK_SIZE = 1024 * 1024       # Read buffer for small files
+MMAP_THRESHOLD = 4 * 1024 * 1024    # Larger files are hashed straight from an mmap
+PARALLEL_MIN_FILES = 16             # Fewer misses than this aren't worth a process pool
+
+# Files modified this recently may still change within the filesystem's mtime
+# resolution, so their hashes are not cached ("racy" entries)
+RACY_WINDOW_SECONDS = 2.0
+
+
+def compute_sha256(file_path: Path) -> str:
+    """Compute SHA256 of a file"""
+    sha256 = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                sha256.update(mapped)
+        else:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _hash_file_job(file_path: str) -> Tuple[Optional[str], Optional[str]]:
+    """Process pool worker: (digest, None) or (None, error message)"""
+    try:
+        return compute_sha256(Path(file_path)), None
+    except OSError as e:
+        return None, str(e)
+
+
+def compute_directory_hashes(file_hashes: Dict[str, str]) -> Dict[str, str]:
+    """
+    Compute Merkle-style rollup hashes for every directory in a file_hashes map
+
+    A directory's hash is the SHA256 of its sorted direct entries ("name<TAB>hash"
+    for files, "name/<TAB>rollup" for subdirectories), so it changes if and only if
+    something below it changes.
+
+    Args:
+        file_hashes: rel_path (forward slashes) -> sha256
+
+    Returns:
+        rel_dir -> rollup hash ("." is the root)
+    """
+    children: Dict[str, Dict[str, str]] = {}
+    for rel_path, digest in file_hashes.items():
+        parent, _, name = rel_path.rpartition('/')
+        children.setdefault(parent or '.', {})[name] = digest
+        # Make sure every ancestor exists, even if it only contains directories
+        while parent:
+            grandparent, _, _ = parent.rpartition('/')
+            children.setdefault(grandparent or '.', {})
+            parent = grandparent
+
+    rollups: Dict[str, str] = {}
+    # Deepest directories first, so each rollup is added to its parent before the parent is hashed
+    for rel_dir in sorted(children, key=lambda d: -1 if d == '.' else d.count('/'), reverse=True):
+        entries = children[rel_dir]
+        listing = ''.join(f"{name}\t{entries[name]}\n" for name in sorted(entries))
+        rollups[rel_dir] = hashlib.sha256(listing.encode('utf-8')).hexdigest()
+        if rel_dir != '.':
+            parent, _, name = rel_dir.rpartition('/')
+            children[parent or '.'][name + '/'] = rollups[rel_dir]
+
+    return dict(sorted(rollups.items()))
+
+
+class FileHashManifest:
+    """
+    Size/mtime-validated SHA256 cache for the files of one project directory.
+
+    Usage:
+        manifest = FileHashManifest(project_root)
+        digest = manifest.get_hash("ui.py")   # cached if ui.py is unchanged
+        manifest.save()
+    """
+
+    def __init__(self, root_dir, manifest_path: Optional[Path] = None):
+        self.root_dir = Path(root_dir).resolve()
+        if manifest_path is None:
+            root_key = hashlib.sha1(str(self.root_dir).encode('utf-8')).hexdigest()[:12]
+            manifest_path = MANIFEST_DIR / f"{root_key}.json"
+        self.manifest_path = Path(manifest_path)
+
+        # rel_path -> [size, mtime_ns, sha256]
+        self._entries: Dict[str, list] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') == MANIFEST_FORMAT and data.get('root') == str(self.root_dir):
+                self._entries = data.get('files', {})
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def get_hash(self, rel_path: str) -> str:
+        """
+        Get the SHA256 of a file, rehashing only if its size or mtime changed
+
+        Args:
+            rel_path: Path relative to the project root (forward slashes)
+
+        Returns:
+            Hex digest
+
+        Raises:
+            OSError: File missing or unreadable
+        """
+        file_path = self.root_dir / rel_path
+        stat = file_path.stat()
+
+        with self._lock:
+            entry = self._entries.get(rel_path)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            self.hits += 1
+            return entry[2]
+
+        self.misses += 1
+        digest = compute_sha256(file_path)
+        self._store(rel_path, stat, digest)
+        return digest
+
+    def get_hashes(self, rel_paths: Iterable[str], workers: Optional[int] = None) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Get hashes for many files, rehashing changed ones across a process pool
+
+        Args:
+            rel_paths: Paths relative to the project root (forward slashes)
+            workers: Process count (defaults to the CPU count)
+
+        Returns:
+            (hashes, errors) - rel_path -> sha256, and rel_path -> error message
+        """
+        hashes: Dict[str, str] = {}
+        errors: Dict[str, str] = {}
+        misses: List[Tuple[str, os.stat_result]] = []
+
+        for rel_path in rel_paths:
+            try:
+                stat = (self.root_dir / rel_path).stat()
+            except OSError as e:
+                errors[rel_path] = str(e)
+                continue
+            with self._lock:
+                entry = self._entries.get(rel_path)
+            if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+                self.hits += 1
+                hashes[rel_path] = entry[2]
+            else:
+                misses.append((rel_path, stat))
+
+        paths = [str(self.root_dir / rel_path) for rel_path, _ in misses]
+        if len(misses) >= PARALLEL_MIN_FILES and (workers is None or workers > 1):
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_hash_file_job, paths, chunksize=8))
+        else:
+            results = [_hash_file_job(path) for path in paths]
+
+        for (rel_path, stat), (digest, error) in zip(misses, results):
+            self.misses += 1
+            if error is not None:
+                errors[rel_path] = error
+                continue
+            # Stat from before hashing: if the file changed meanwhile, the next run
+            # sees a different mtime and rehashes it
+            self._store(rel_path, stat, digest)
+            hashes[rel_path] = digest
+
+        return hashes, errors
+
+    def record(self, rel_path: str, sha256: str):
+        """Record a known hash for a file just written (e.g., after applying an update)"""
+        try:
+            stat = (self.root_dir / rel_path).stat()
+        except OSError:
+            self.forget(rel_path)
+            return
+        self._store(rel_path, stat, sha256)
+
+    def forget(self, rel_path: str):
+        with self._lock:
+            if self._entries.pop(rel_path, None) is not None:
+                self._dirty = True
+
+    def prune(self, keep: Iterable[str]):
+        """Drop entries for files not in `keep`"""
+        keep = set(keep)
+        with self._lock:
+            stale = [path for path in self._entries if path not in keep]
+            for path in stale:
+                del self._entries[path]
+            if stale:
+                self._dirty = True
+
+    def _store(self, rel_path: str, stat: os.stat_result, digest: str):
+        if time.time() - stat.st_mtime < RACY_WINDOW_SECONDS:
+            self.forget(rel_path)
+            return
+        with self._lock:
+            self._entries[rel_path] = [stat.st_size, stat.st_mtime_ns, digest]
+            self._dirty = True
+
+    def save(self):
+        """Write the manifest atomically (no-op if nothing changed)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                'format': MANIFEST_FORMAT,
+                'root': str(self.root_dir),
+                'files': dict(self._entries),
+            }
+            self._dirty = False
+
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_name(self.manifest_path.name + f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            # Cache only - a failed write just means rehashing next time
+            print(f"⚠️ Could not save hash manifest: {e}")
+
+
+__all__ = [
+    'FileHashManifest',
+    'compute_sha256',
+    'compute_directory_hashes',
+    'MANIFEST_DIR',
+]
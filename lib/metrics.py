@@ -0,0 +1,207 @@
+"""
+HW Helper Performance Metrics
+=============================
+Local aggregation of per-request performance counters (time to first token, stream
+duration, parse/render/capture/OCR time, model errors) into compact histograms that
+are shipped in batches instead of one event per request.
+
+Histograms use log-spaced buckets: a value v (ms) goes into the bucket whose upper
+bound is the smallest BUCKET_GROWTH ** i >= v, so every percentile read from the
+buckets is at most 10% above the true value. Batches carry the bucket upper bounds, so
+the server can merge batches from any client without knowing the scheme.
+
+Usage:
+    from lib.metrics import get_metrics
+    metrics = get_metrics()
+    metrics.observe("ttft_ms", 812.4, model="google/gemini-2.5-flash")
+    metrics.increment("model_error.rate_limited", model="google/gemini-2.5-flash")
+    with metrics.timer("capture_ms"):
+        capture()
+    batch = metrics.drain()   # dict for /api/telemetry/batch, or None if empty
+
+This module must stay dependency-free (stdlib only).
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+BUCKET_GROWTH = 1.1          # Adjacent bucket bounds differ by 10%
+MIN_BUCKET_MS = 1.0          # Everything at or below 1 ms shares the first bucket
+MAX_BUCKET_MS = 600000.0     # Larger values are clamped (10 minutes)
+MAX_SERIES = 200             # (metric, model) pairs kept per batch; extra series are dropped
+
+METRICS_FORMAT = 1
+
+# Metric names recorded by the app
+METRIC_NAMES = (
+    "ttft_ms",       # Request sent -> first streamed token
+    "stream_ms",     # Request sent -> stream complete
+    "parse_ms",      # Progressive + final JSON parsing of one response
+    "render_ms",     # Final answer render on the Tk thread
+    "capture_ms",    # Screenshot capture task
+    "ocr_ms",        # OCR request round trip (queue + worker)
+)
+
+
+def bucket_upper_bound(value_ms: float) -> float:
+    """Upper bound (ms) of the histogram bucket that holds value_ms"""
+    value_ms = min(max(value_ms, MIN_BUCKET_MS), MAX_BUCKET_MS)
+    index = math.ceil(math.log(value_ms / MIN_BUCKET_MS, BUCKET_GROWTH) - 1e-9)
+    return round(MIN_BUCKET_MS * BUCKET_GROWTH ** index, 3)
+
+
+class Histogram:
+    """Bucket counts plus count/sum/min/max for one (metric, model) series"""
+
+    __slots__ = ("buckets", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.buckets: Dict[float, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def add(self, value_ms: float):
+        bound = bucket_upper_bound(value_ms)
+        self.buckets[bound] = self.buckets.get(bound, 0) + 1
+        self.count += 1
+        self.total += value_ms
+        self.min = min(self.min, value_ms)
+        self.max = max(self.max, value_ms)
+
+    def percentile(self, pct: float) -> float:
+        """Bucket upper bound at the given percentile (0-100)"""
+        if not self.count:
+            return 0.0
+        rank = pct / 100 * self.count
+        seen = 0
+        for bound in sorted(self.buckets):
+            seen += self.buckets[bound]
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 3),
+            "min": round(self.min, 3),
+            "max": round(self.max, 3),
+            "buckets": [[bound, n] for bound, n in sorted(self.buckets.items())],
+        }
+
+
+class PerfMetrics:
+    """
+    Thread-safe in-memory aggregation of histograms and counters.
+
+    Series are keyed by (name, model); model is "" for metrics that don't depend on
+    the AI model (capture, OCR). drain() returns everything recorded since the last
+    drain and starts a new window.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._counters: Dict[Tuple[str, str], int] = {}
+        self._window_start = time.time()
+        self._dropped = 0
+
+    def observe(self, metric: str, value_ms: float, model: Optional[str] = None):
+        """Record one duration (ms)"""
+        if value_ms is None or value_ms < 0 or math.isnan(value_ms):
+            return
+        key = (metric, model or "")
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                if len(self._histograms) >= MAX_SERIES:
+                    self._dropped += 1
+                    return
+                histogram = self._histograms[key] = Histogram()
+            histogram.add(value_ms)
+
+    def increment(self, name: str, model: Optional[str] = None, amount: int = 1):
+        """Bump a counter (e.g. ai_request, model_error.rate_limited)"""
+        key = (name, model or "")
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    @contextmanager
+    def timer(self, metric: str, model: Optional[str] = None):
+        """Time a block and observe it (also recorded if the block raises)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(metric, (time.perf_counter() - started) * 1000, model)
+
+    def summary(self, metric: str, model: Optional[str] = None) -> Optional[Dict[str, float]]:
+        """Local p50/p95 for one series in the current window (for debug output)"""
+        with self._lock:
+            histogram = self._histograms.get((metric, model or ""))
+            if not histogram or not histogram.count:
+                return None
+            return {"count": histogram.count, "p50": histogram.percentile(50), "p95": histogram.percentile(95)}
+
+    def drain(self) -> Optional[Dict]:
+        """
+        Take everything recorded since the last drain as one batch
+
+        Returns:
+            Batch payload for POST /api/telemetry/batch (without client fields),
+            or None if nothing was recorded
+        """
+        with self._lock:
+            histograms, counters = self._histograms, self._counters
+            window_start, dropped = self._window_start, self._dropped
+            self._reset()
+
+        if not histograms and not counters:
+            return None
+
+        return {
+            "format": METRICS_FORMAT,
+            "window_start": round(window_start, 3),
+            "window_end": round(time.time(), 3),
+            "histograms": [
+                dict(metric=metric, model=model, **histogram.to_dict())
+                for (metric, model), histogram in sorted(histograms.items())
+            ],
+            "counters": [
+                {"name": name, "model": model, "count": count}
+                for (name, model), count in sorted(counters.items())
+            ],
+            "dropped_series": dropped,
+        }
+
+
+# Module-level singleton (one aggregation window per app)
+_metrics: Optional[PerfMetrics] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> PerfMetrics:
+    """Get the shared metrics aggregator"""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = PerfMetrics()
+        return _metrics
+
+
+__all__ = [
+    'PerfMetrics',
+    'Histogram',
+    'get_metrics',
+    'bucket_upper_bound',
+    'METRIC_NAMES',
+    'BUCKET_GROWTH',
+]
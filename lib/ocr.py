@@ -0,0 +1,522 @@
+"""
+HW Helper OCR Worker
+====================
+Runs EasyOCR in a persistent worker process instead of the GUI process.
+
+Loading the EasyOCR/PyTorch model (~150MB) and running `readtext` in the GUI process
+holds the GIL for long stretches and freezes Tk. This module keeps the model in a
+separate process:
+- Request/response queues (multiprocessing, spawn context)
+- Images are transferred through shared memory (no pickling of pixel data)
+- Every request returns a concurrent.futures.Future with timeout/cancel support
+- The worker is started lazily (or warmed up at idle) and restarted if it crashes
+
+Usage:
+    from lib.ocr import get_ocr_worker
+    worker = get_ocr_worker()
+    worker.warm_up()                                   # optional, non-blocking
+    results = worker.readtext("screenshot.png", timeout=30)
+    # -> [([[x, y], [x, y], [x, y], [x, y]], text, confidence), ...]
+
+This module must not import tkinter/customtkinter (it is imported by the worker process).
+"""
+
+import collections
+import itertools
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional, Tuple
+
+from .metrics import get_metrics
+
+try:
+    from multiprocessing import shared_memory
+    SHARED_MEMORY_AVAILABLE = True
+except ImportError:
+    SHARED_MEMORY_AVAILABLE = False
+
+# Default time limits (seconds)
+DEFAULT_REQUEST_TIMEOUT = 30.0   # per readtext call
+WORKER_STARTUP_TIMEOUT = 120.0   # model download/load on first run can be slow
+STUCK_REQUEST_GRACE = 30.0       # kill the worker if a request runs this long past its timeout
+
+
+class OCRWorkerError(Exception):
+    """OCR worker failed to start, crashed, or returned an error"""
+    pass
+
+
+# ============================================================================
+# WORKER PROCESS
+# ============================================================================
+
+def _worker_main(request_queue, response_queue, languages: List[str], gpu: bool):
+    """
+    Entry point of the OCR worker process.
+
+    Messages in:  ("ocr", request_id, payload) / ("cancel", request_id, None) / ("stop", None, None)
+    Messages out: ("ready", None, error) / ("started", request_id, None) /
+                  ("result", request_id, results) / ("error", request_id, message)
+    """
+    try:
+        import easyocr
+        reader = easyocr.Reader(languages, gpu=gpu, verbose=False)
+    except Exception as e:
+        response_queue.put(("ready", None, f"EasyOCR initialization failed: {e}"))
+        return
+
+    response_queue.put(("ready", None, None))
+
+    jobs = collections.deque()
+    cancelled = set()
+
+    while True:
+        # Wait for work, then drain everything queued so cancellations of
+        # waiting requests are seen before those requests are processed
+        messages = [] if jobs else [request_queue.get()]
+        while True:
+            try:
+                messages.append(request_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        for kind, request_id, payload in messages:
+            if kind == "stop":
+                return
+            if kind == "cancel":
+                cancelled.add(request_id)
+            elif kind == "ocr":
+                jobs.append((request_id, payload))
+
+        if not jobs:
+            continue
+        request_id, payload = jobs.popleft()
+        if request_id in cancelled:
+            cancelled.discard(request_id)
+            continue
+
+        response_queue.put(("started", request_id, None))
+        try:
+            image = _load_payload(payload)
+            raw_results = reader.readtext(image, **payload.get("options", {}))
+            results = [
+                ([[float(x), float(y)] for x, y in bbox], str(text), float(confidence))
+                for bbox, text, confidence in raw_results
+            ]
+            response_queue.put(("result", request_id, results))
+        except Exception as e:
+            response_queue.put(("error", request_id, str(e)))
+
+
+def _load_payload(payload: Dict):
+    """Rebuild the image array from shared memory (or load it from a path)"""
+    if payload.get("shm_name"):
+        import numpy as np
+        block = shared_memory.SharedMemory(name=payload["shm_name"])
+        try:
+            view = np.ndarray(payload["shape"], dtype=payload["dtype"], buffer=block.buf)
+            return view.copy()
+        finally:
+            block.close()
+    return payload["path"]
+
+
+# ============================================================================
+# CLIENT (GUI PROCESS)
+# ============================================================================
+
+class OCRWorker:
+    """
+    Client for the EasyOCR worker process.
+
+    Thread-safe. A listener thread routes responses to request futures, detects
+    worker crashes and stuck requests, and fails outstanding requests so callers
+    can fall back. The next request (or warm_up()) starts a fresh worker.
+    """
+
+    def __init__(self, languages: Optional[List[str]] = None, gpu: bool = False):
+        self.languages = languages or ['en']
+        self.gpu = gpu
+
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.RLock()
+        self._process = None
+        self._request_queue = None
+        self._response_queue = None
+        self._listener = None
+        self._ready = threading.Event()
+        self._startup_error: Optional[str] = None
+        self._generation = 0
+        self._ids = itertools.count(1)
+
+        # request_id -> [future, shared memory block, timeout, submitted_at]
+        self._pending: Dict[int, list] = {}
+        # (request_id, started_at, timeout) of the request the worker is running
+        self._running: Optional[Tuple[int, float, float]] = None
+        self._ready_at = 0.0
+        self.restart_count = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def warm_up(self):
+        """Start the worker process in the background (non-blocking)"""
+        self._ensure_started()
+
+    def wait_ready(self, timeout: float = WORKER_STARTUP_TIMEOUT) -> bool:
+        """
+        Block until the worker has loaded the model
+
+        Returns:
+            True if the worker is ready, False on timeout or startup failure
+        """
+        self._ensure_started()
+        if not self._ready.wait(timeout):
+            return False
+        with self._lock:
+            # The worker may have died between the ready signal and now
+            alive = self._process is not None and self._process.is_alive()
+        return self._startup_error is None and alive
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set() and self._startup_error is None
+
+    @property
+    def startup_error(self) -> Optional[str]:
+        return self._startup_error
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._process is not None and self._process.is_alive():
+                return
+            if self._ready.is_set() and self._startup_error is not None:
+                return  # EasyOCR not usable - don't respawn on every request (restart() retries)
+
+            self._generation += 1
+            self._ready.clear()
+            self._startup_error = None
+            self._request_queue = self._ctx.Queue()
+            self._response_queue = self._ctx.Queue()
+            self._process = self._ctx.Process(
+                target=_worker_main,
+                args=(self._request_queue, self._response_queue, self.languages, self.gpu),
+                name="HWHelper-OCR",
+                daemon=True,
+            )
+            self._process.start()
+            print(f"🔄 OCR worker process started (pid {self._process.pid})")
+
+            self._listener = threading.Thread(
+                target=self._listen, args=(self._generation, self._process, self._response_queue),
+                name="OCR-Listener", daemon=True,
+            )
+            self._listener.start()
+
+    def restart(self):
+        """Kill the worker (failing outstanding requests) and start a new one"""
+        self._terminate("OCR worker restarted")
+        self._ready.clear()
+        self._startup_error = None
+        self.restart_count += 1
+        self._ensure_started()
+
+    def shutdown(self):
+        """Stop the worker process"""
+        with self._lock:
+            process, request_queue = self._process, self._request_queue
+        if process is not None and process.is_alive():
+            try:
+                request_queue.put(("stop", None, None))
+                process.join(timeout=2)
+            except Exception:
+                pass
+        self._terminate("OCR worker shut down")
+
+    def _terminate(self, reason: str):
+        with self._lock:
+            process = self._process
+            self._process = None
+            self._running = None
+            self._generation += 1  # Detach the old listener
+
+        if process is not None and process.is_alive():
+            process.terminate()
+            process.join(timeout=2)
+
+        self._fail_pending(reason)
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def submit(self, image, timeout: float = DEFAULT_REQUEST_TIMEOUT, **options) -> Future:
+        """
+        Queue an OCR request
+
+        Args:
+            image: Image path or PIL Image
+            timeout: Seconds before the request fails with TimeoutError
+            **options: Extra keyword arguments for reader.readtext (e.g., detail, paragraph)
+
+        Returns:
+            Future resolving to [(bbox_points, text, confidence), ...].
+            future.request_id can be passed to cancel().
+        """
+        self._ensure_started()
+        if self._ready.is_set() and self._startup_error:
+            future = Future()
+            future.set_exception(OCRWorkerError(self._startup_error))
+            return future
+
+        request_id = next(self._ids)
+        payload, block = self._build_payload(image)
+        payload["options"] = options
+
+        future = Future()
+        future.request_id = request_id
+        with self._lock:
+            self._pending[request_id] = [future, block, timeout, time.monotonic()]
+            request_queue = self._request_queue
+        request_queue.put(("ocr", request_id, payload))
+        return future
+
+    def readtext(self, image, timeout: float = DEFAULT_REQUEST_TIMEOUT, **options) -> List[Tuple]:
+        """
+        Run OCR and wait for the result (call from a background thread, not the Tk thread)
+
+        Raises:
+            TimeoutError: Request did not finish within `timeout` seconds
+            OCRWorkerError: Worker unavailable, crashed, or OCR failed
+        """
+        future = self.submit(image, timeout=timeout, **options)
+        # Model loading time doesn't count against the request timeout
+        self._ready.wait(WORKER_STARTUP_TIMEOUT)
+        try:
+            return future.result(timeout=timeout + 1.0)
+        except (FutureTimeoutError, TimeoutError):
+            self.cancel(future)
+            raise TimeoutError(f"OCR request timed out after {timeout:.0f}s")
+
+    def readtext_batch(self, images: List, timeout: float = DEFAULT_REQUEST_TIMEOUT,
+                       **options) -> List[Optional[List[Tuple]]]:
+        """
+        Run OCR on several images (e.g., cropped regions) in one pipelined batch
+
+        All requests are queued before waiting, so the worker processes them
+        back-to-back without a round trip in between.
+
+        Returns:
+            One result list per image (None for an image whose request failed)
+
+        Raises:
+            TimeoutError: The batch did not finish within `timeout` seconds
+        """
+        futures = [self.submit(image, timeout=timeout, **options) for image in images]
+        self._ready.wait(WORKER_STARTUP_TIMEOUT)
+        deadline = time.monotonic() + timeout + 1.0
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except (FutureTimeoutError, TimeoutError):
+                for pending in futures:
+                    self.cancel(pending)
+                raise TimeoutError(f"OCR batch timed out after {timeout:.0f}s")
+            except OCRWorkerError as e:
+                print(f"⚠️ OCR request in batch failed: {e}")
+                results.append(None)
+        return results
+
+    def cancel(self, future: Future) -> bool:
+        """
+        Cancel a queued or running request
+
+        A queued request is skipped by the worker; a running request's result is discarded.
+        """
+        request_id = getattr(future, "request_id", None)
+        with self._lock:
+            entry = self._pending.pop(request_id, None)
+            request_queue = self._request_queue
+        if entry is None:
+            return False
+        self._release(entry)
+        try:
+            request_queue.put(("cancel", request_id, None))
+        except Exception:
+            pass
+        return future.cancel() or future.done()
+
+    def _build_payload(self, image) -> Tuple[Dict, Optional[object]]:
+        """Copy image pixels into a shared memory block (falls back to sending the path)"""
+        if SHARED_MEMORY_AVAILABLE:
+            try:
+                import numpy as np
+                from PIL import Image
+
+                if isinstance(image, Image.Image):
+                    pil_image = image
+                else:
+                    pil_image = Image.open(image)
+                array = np.asarray(pil_image.convert("RGB"))
+
+                block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+                return {"shm_name": block.name, "shape": array.shape, "dtype": str(array.dtype)}, block
+            except Exception as e:
+                if not isinstance(image, str):
+                    raise OCRWorkerError(f"Could not transfer image: {e}")
+        return {"path": str(image)}, None
+
+    @staticmethod
+    def _release(entry: list):
+        """Free a request's shared memory block"""
+        block = entry[1]
+        entry[1] = None
+        if block is not None:
+            try:
+                block.close()
+                block.unlink()
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------------
+    # Listener
+    # ------------------------------------------------------------------
+
+    def _listen(self, generation: int, process, response_queue):
+        """Route worker responses to futures; detect crashes and stuck requests"""
+        while generation == self._generation:
+            try:
+                kind, request_id, data = response_queue.get(timeout=0.5)
+            except queue.Empty:
+                if not process.is_alive():
+                    self._on_worker_died(generation, process)
+                    return
+                self._check_timeouts(generation)
+                continue
+            except (EOFError, OSError):
+                self._on_worker_died(generation, process)
+                return
+
+            if kind == "ready":
+                self._startup_error = data
+                self._ready_at = time.monotonic()
+                self._ready.set()
+                if data:
+                    print(f"⚠️ OCR worker unavailable: {data}")
+                    self._fail_pending(data)
+                    return  # Worker exits on its own
+                print("✅ OCR worker ready - hot spot detection will be instant!")
+                continue
+
+            if kind == "started":
+                with self._lock:
+                    entry = self._pending.get(request_id)
+                    if entry is not None:
+                        self._running = (request_id, time.monotonic(), entry[2])
+                continue
+
+            with self._lock:
+                if self._running and self._running[0] == request_id:
+                    self._running = None
+                entry = self._pending.pop(request_id, None)
+            if entry is None:
+                continue  # Cancelled or timed out
+
+            self._release(entry)
+            if entry[0].done():
+                continue
+            if kind == "result":
+                get_metrics().observe("ocr_ms", (time.monotonic() - entry[3]) * 1000)
+                entry[0].set_result(data)
+            else:
+                get_metrics().increment("ocr_error")
+                entry[0].set_exception(OCRWorkerError(data))
+
+    def _check_timeouts(self, generation: int):
+        """Fail expired requests; restart the worker if one is stuck running"""
+        if not self._ready.is_set():
+            return  # Still loading the model - timeouts start once it is ready
+
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            for request_id, entry in list(self._pending.items()):
+                future, _, timeout, submitted_at = entry
+                if now - max(submitted_at, self._ready_at) > timeout:
+                    del self._pending[request_id]
+                    expired.append(entry)
+            running = self._running
+
+        for entry in expired:
+            self._release(entry)
+            if not entry[0].done():
+                entry[0].set_exception(TimeoutError("OCR request timed out"))
+
+        if running and now - running[1] > running[2] + STUCK_REQUEST_GRACE:
+            if generation == self._generation:
+                print("⚠️ OCR worker appears stuck - restarting")
+                self.restart()
+
+    def _fail_pending(self, reason: str):
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for entry in pending:
+            self._release(entry)
+            if not entry[0].done():
+                entry[0].set_exception(OCRWorkerError(reason))
+
+    def _on_worker_died(self, generation: int, process):
+        if generation != self._generation:
+            return
+        exit_code = process.exitcode
+        if not self._ready.is_set():
+            # Keep the error (and the ready flag) so waiters see the failure; only an
+            # explicit restart() tries again - requests fail fast instead of respawning
+            self._startup_error = f"OCR worker exited during startup (code {exit_code})"
+            self._ready.set()
+            self._terminate(self._startup_error)
+            print(f"⚠️ OCR worker exited during startup (code {exit_code}) - OCR disabled until restart()")
+        else:
+            self._terminate(f"OCR worker crashed (exit code {exit_code})")
+            print(f"⚠️ OCR worker exited (code {exit_code}) - it will restart on next use")
+        self.restart_count += 1
+
+
+# Module-level singleton (one worker per app)
+_worker: Optional[OCRWorker] = None
+_worker_lock = threading.Lock()
+
+
+def get_ocr_worker() -> OCRWorker:
+    """Get the shared OCR worker client (does not start the process)"""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = OCRWorker()
+        return _worker
+
+
+def shutdown_ocr_worker():
+    """Stop the shared OCR worker process if it is running"""
+    with _worker_lock:
+        worker = _worker
+    if worker is not None:
+        worker.shutdown()
+
+
+__all__ = [
+    'OCRWorker',
+    'OCRWorkerError',
+    'get_ocr_worker',
+    'shutdown_ocr_worker',
+    'DEFAULT_REQUEST_TIMEOUT',
+    'SHARED_MEMORY_AVAILABLE',
+]
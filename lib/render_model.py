@@ -0,0 +1,281 @@
+"""
+HW Helper Answer Render Model
+=============================
+Compact structural record of what the answer display shows, kept up to date by the
+UI as answers are rendered (question, layout placeholders, each answer and how it
+was rendered, and the final status).
+
+Error reports used to rebuild this by walking the live widget tree on the Tk thread
+(export_widget_tree / export_answers_html), which froze the app on large answer
+displays. With the render model, a report takes a snapshot (a few small dict copies)
+on the Tk thread and serializes it - JSON and HTML - on a background thread.
+
+Usage:
+    model = AnswerRenderModel()
+    model.begin("google/gemini-2.5-flash")
+    model.set_layout("edmentum_multiple_choice", question, answer_structure)
+    model.set_answer(answer_item, via="component")
+    model.finish(processed_response, strategy="edmentum_multiple_choice")
+    snapshot = model.snapshot()            # Tk thread
+    html = render_model_html(snapshot)     # any thread
+
+This module must stay dependency-free (stdlib only).
+"""
+
+import collections
+import copy
+import html
+import threading
+import time
+from typing import Dict, List, Optional
+
+RENDER_MODEL_FORMAT = 1
+MAX_EVENTS = 200             # Render events kept per question (oldest dropped)
+MAX_TEXT_LENGTH = 2000       # Per answer text kept in the model
+
+# Answer states
+STATE_PLACEHOLDER = "placeholder"
+STATE_FILLED = "filled"
+
+
+def summarize_answer(answer: Dict) -> Dict:
+    """
+    Reduce an AI answer item to what the display shows
+
+    Returns:
+        {"type", "text", "correct", "label"} - text is the visible content
+        ("term → match" for pairs)
+    """
+    content_type = answer.get("content_type", "") or "text_plain"
+    if content_type == "matching_pair":
+        pair = answer.get("pair_data") or {}
+        text = f"{pair.get('term', '')} → {pair.get('match', '')}"
+    else:
+        text = answer.get("text_content", "")
+        if not isinstance(text, str):
+            text = str(text)
+
+    return {
+        "type": content_type,
+        "text": text[:MAX_TEXT_LENGTH],
+        "correct": bool(answer.get("is_correct_option", False)),
+        "label": str(answer.get("label", "") or ""),
+    }
+
+
+class AnswerRenderModel:
+    """
+    What the answer display currently shows, one question at a time.
+
+    All mutators are cheap (no widget access) and thread-safe; the UI calls them
+    from the same places that create or update answer widgets.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Answer display was cleared"""
+        with self._lock:
+            self._question = ""
+            self._model_name: Optional[str] = None
+            self._strategy: Optional[str] = None
+            self._component: Optional[str] = None
+            self._status = "empty"
+            self._error: Optional[str] = None
+            self._items: Dict[str, Dict] = {}   # answer_id -> item (insertion = display order)
+            self._events = collections.deque(maxlen=MAX_EVENTS)
+            self._started = time.time()
+            self._finished: Optional[float] = None
+
+    def begin(self, model_name: Optional[str]):
+        """A new AI request started streaming into the (cleared) display"""
+        self.reset()
+        with self._lock:
+            self._model_name = model_name
+            self._status = "streaming"
+            self._event("begin")
+
+    def set_question(self, question: str):
+        with self._lock:
+            self._question = str(question or "")[:MAX_TEXT_LENGTH]
+
+    def set_layout(self, strategy: str, question: str, answer_structure: List[Dict]):
+        """Placeholders were created from the streamed metadata"""
+        with self._lock:
+            self._strategy = strategy or self._strategy
+            if question:
+                self._question = str(question)[:MAX_TEXT_LENGTH]
+            for index, spec in enumerate(answer_structure or []):
+                if not isinstance(spec, dict):
+                    continue
+                answer_id = str(spec.get("id") or f"item_{index + 1}")
+                self._items.setdefault(answer_id, {
+                    "answer_id": answer_id,
+                    "type": spec.get("type", ""),
+                    "label": str(spec.get("label", "") or ""),
+                    "state": STATE_PLACEHOLDER,
+                    "text": "",
+                    "correct": False,
+                    "via": None,
+                })
+            self._event("layout", count=len(answer_structure or []))
+
+    def set_component(self, component_name: Optional[str]):
+        with self._lock:
+            self._component = component_name
+
+    def set_answer(self, answer: Dict, via: str):
+        """
+        An answer was rendered
+
+        Args:
+            answer: AI answer item
+            via: How it was rendered - "component", "skeleton", "direct" or "final"
+        """
+        if not isinstance(answer, dict):
+            return
+        summary = summarize_answer(answer)
+        with self._lock:
+            answer_id = str(answer.get("answer_id") or f"item_{len(self._items) + 1}")
+            item = self._items.get(answer_id)
+            if item is None:
+                item = self._items[answer_id] = {"answer_id": answer_id, "label": "", "via": None}
+            label = summary.pop("label")
+            item.update(summary)
+            if label or not item["label"]:
+                item["label"] = label
+            item["state"] = STATE_FILLED
+            item["via"] = item["via"] if via == "final" and item["via"] else via
+            self._event("answer", answer_id=answer_id, via=via)
+
+    def finish(self, response_data: Dict, via: str = "final", strategy: Optional[str] = None,
+               component: Optional[str] = None):
+        """The final (validated) response was rendered"""
+        response_data = response_data if isinstance(response_data, dict) else {}
+        for answer in response_data.get("answers") or []:
+            self.set_answer(answer, via)
+        with self._lock:
+            if response_data.get("identified_question"):
+                self._question = str(response_data["identified_question"])[:MAX_TEXT_LENGTH]
+            self._strategy = strategy or self._strategy
+            self._component = component or self._component
+            status = str(response_data.get("status") or "SUCCESS")
+            self._status = status.lower()
+            if status.startswith("ERROR"):
+                self._error = str(response_data.get("error_message", ""))[:MAX_TEXT_LENGTH]
+            self._finished = time.time()
+            self._event("finish", status=self._status)
+
+    def restore(self, snapshot: Dict):
+        """The display was redrawn from an earlier snapshot (answer history)"""
+        self.reset()
+        with self._lock:
+            self._question = snapshot.get("question", "")
+            self._model_name = snapshot.get("model")
+            self._strategy = snapshot.get("rendering_strategy")
+            self._component = snapshot.get("component")
+            self._status = snapshot.get("status", "success")
+            self._error = snapshot.get("error")
+            for item in snapshot.get("answers", []):
+                self._items[item["answer_id"]] = copy.copy(item)
+            self._events.extend(dict(event) for event in snapshot.get("events", []))
+            self._finished = time.time()
+            self._event("restore")
+
+    def _event(self, kind: str, **fields):
+        """Append a render event (caller holds the lock)"""
+        fields["t_ms"] = round((time.time() - self._started) * 1000)
+        fields["event"] = kind
+        self._events.append(fields)
+
+    def snapshot(self) -> Dict:
+        """Copy of the model (JSON-serializable), safe to hand to another thread"""
+        with self._lock:
+            items = [copy.copy(item) for item in self._items.values()]
+            return {
+                "format": RENDER_MODEL_FORMAT,
+                "source": "render_model",
+                "question": self._question,
+                "model": self._model_name,
+                "rendering_strategy": self._strategy,
+                "component": self._component,
+                "status": self._status,
+                "error": self._error,
+                "started_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self._started)),
+                "render_ms": round((self._finished - self._started) * 1000) if self._finished else None,
+                "answer_count": len(items),
+                "unfilled": [item["answer_id"] for item in items if item.get("state") != STATE_FILLED],
+                "answers": items,
+                "events": [dict(event) for event in self._events],
+            }
+
+
+# Same look as lib.utils.export_answers_html, so report pages render both alike
+_HTML_STYLE = """
+<style>
+.answer-container { font-family: 'Segoe UI', Arial, sans-serif; padding: 20px; background: #1e1e1e; color: #fff; }
+.answer-frame { margin: 10px 0; padding: 15px; border-radius: 8px; background: #2d2d2d; border: 1px solid #444; }
+.answer-correct { background: #1a311a; border-color: #388E3C; }
+.answer-placeholder { opacity: 0.5; font-style: italic; }
+.answer-label { font-size: 14px; line-height: 1.6; margin: 5px 0; }
+.answer-badge { display: inline-block; padding: 4px 12px; border-radius: 14px; margin-right: 8px; font-weight: bold; }
+.answer-badge-correct { background: #28A745; color: white; }
+.answer-badge-default { background: #4a90e2; color: white; }
+.answer-text { display: inline; }
+.answer-meta { color: #888; font-size: 11px; margin-top: 4px; }
+.checkmark { color: #28A745; font-size: 18px; margin-left: 10px; }
+.error { color: #e74c3c; padding: 20px; }
+</style>
+"""
+
+
+def render_model_html(snapshot: Dict) -> str:
+    """
+    Render a render-model snapshot as HTML for error reports (no widget access)
+
+    Args:
+        snapshot: AnswerRenderModel.snapshot()
+
+    Returns:
+        HTML string with embedded CSS
+    """
+    if not snapshot or not snapshot.get("answers") and not snapshot.get("question"):
+        return "<div class='error'>No answers displayed</div>"
+
+    parts = [_HTML_STYLE, "<div class='answer-container'>"]
+    if snapshot.get("question"):
+        parts.append(f"<div class='answer-label'><b>{html.escape(snapshot['question'])}</b></div>")
+    if snapshot.get("error"):
+        parts.append(f"<div class='error'>{html.escape(snapshot['error'])}</div>")
+
+    for item in snapshot.get("answers", []):
+        classes = ["answer-frame"]
+        if item.get("correct"):
+            classes.append("answer-correct")
+        if item.get("state") != STATE_FILLED:
+            classes.append("answer-placeholder")
+        parts.append(f"<div class='{' '.join(classes)}'>")
+
+        if item.get("label"):
+            badge = "answer-badge-correct" if item.get("correct") else "answer-badge-default"
+            parts.append(f"<span class='answer-badge {badge}'>{html.escape(item['label'])}</span>")
+        text = item.get("text") if item.get("state") == STATE_FILLED else "Loading..."
+        parts.append(f"<span class='answer-text'>{html.escape(text or '')}</span>")
+        if item.get("correct"):
+            parts.append("<span class='checkmark'>✓</span>")
+        parts.append(f"<div class='answer-meta'>{html.escape(item.get('answer_id', ''))} · "
+                     f"{html.escape(item.get('type') or '')} · {html.escape(item.get('via') or item.get('state', ''))}</div>")
+        parts.append("</div>")
+
+    parts.append("</div>")
+    return "".join(parts)
+
+
+__all__ = [
+    'AnswerRenderModel',
+    'render_model_html',
+    'summarize_answer',
+    'RENDER_MODEL_FORMAT',
+]
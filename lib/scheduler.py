@@ -0,0 +1,315 @@
+"""
+HW Helper Startup Scheduler
+===========================
+Runs background startup work (telemetry, balance check, update check, OCR warm-up)
+after the main window has painted, instead of as unmanaged daemon threads that
+compete with the first layout.
+
+Each task declares:
+- priority: lower runs first among ready tasks
+- depends_on: names of tasks that must finish first
+- resource: "cpu", "network" or "disk" - limits how many tasks of a class run at once
+
+All tasks share one ThreadPoolExecutor and record queue/run timings.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Max tasks of each resource class running at the same time
+DEFAULT_RESOURCE_LIMITS = {
+    "cpu": 1,       # CPU-heavy work (model loading) - never run two at once
+    "network": 2,   # HTTP requests
+    "disk": 1,      # file I/O (cleanup, cache loads)
+}
+
+
+class StartupTask:
+    """A unit of startup work with scheduling metadata and timings"""
+
+    def __init__(self, name: str, func: Callable, priority: int = 50,
+                 depends_on: Iterable[str] = (), resource: str = "network"):
+        self.name = name
+        self.func = func
+        self.priority = priority
+        self.depends_on = list(depends_on)
+        self.resource = resource
+
+        self.status = "pending"  # pending -> running -> done / failed / skipped
+        self.error: Optional[str] = None
+        self.ready_at: Optional[float] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def wait_ms(self) -> Optional[float]:
+        """Time spent ready but waiting for a free slot"""
+        if self.ready_at is None or self.started_at is None:
+            return None
+        return (self.started_at - self.ready_at) * 1000
+
+    @property
+    def run_ms(self) -> Optional[float]:
+        """Time spent running"""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return (self.finished_at - self.started_at) * 1000
+
+    def __repr__(self):
+        return f"<StartupTask {self.name} [{self.resource}, p{self.priority}] {self.status}>"
+
+
+class StartupScheduler:
+    """
+    Dependency- and resource-aware scheduler for startup tasks.
+
+    Usage:
+        scheduler = StartupScheduler()
+        scheduler.add("balance", self.refresh_account_balance, priority=10, resource="network")
+        scheduler.add("ocr_warmup", initialize_easyocr, priority=30, resource="cpu")
+        scheduler.start_after_first_paint(app)
+    """
+
+    def __init__(self, max_workers: int = 3, resource_limits: Optional[Dict[str, int]] = None):
+        self.max_workers = max_workers
+        self.resource_limits = dict(DEFAULT_RESOURCE_LIMITS)
+        if resource_limits:
+            self.resource_limits.update(resource_limits)
+
+        self._tasks: Dict[str, StartupTask] = {}
+        self._running: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._started = False
+        self._start_time: Optional[float] = None
+        self._all_done = threading.Event()
+        self._on_complete: List[Callable] = []
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def add(self, name: str, func: Callable, priority: int = 50,
+            depends_on: Iterable[str] = (), resource: str = "network") -> StartupTask:
+        """
+        Register a startup task
+
+        Args:
+            name: Unique task name
+            func: Callable with no arguments
+            priority: Lower values run first when several tasks are ready
+            depends_on: Names of tasks that must complete before this one
+            resource: Resource class ("cpu", "network", "disk")
+
+        Returns:
+            The registered StartupTask
+        """
+        if resource not in self.resource_limits:
+            raise ValueError(f"Unknown resource class '{resource}' for task '{name}'")
+
+        with self._lock:
+            if name in self._tasks:
+                raise ValueError(f"Startup task '{name}' already registered")
+            task = StartupTask(name, func, priority, depends_on, resource)
+            self._tasks[name] = task
+            self._all_done.clear()
+
+        # Tasks added after start() are scheduled immediately
+        if self._started:
+            self._dispatch()
+        return task
+
+    def on_complete(self, callback: Callable):
+        """Register a callback run (on a worker thread) once all tasks have finished"""
+        self._on_complete.append(callback)
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Validate the dependency graph and start running ready tasks"""
+        with self._lock:
+            if self._started:
+                return
+            self._validate()
+            self._started = True
+            self._start_time = time.perf_counter()
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="Startup")
+        self._dispatch()
+
+    def start_after_first_paint(self, root, delay_ms: int = 0):
+        """
+        Start once the Tk main loop is idle (i.e. the first frame has been drawn)
+
+        Args:
+            root: Tk root window
+            delay_ms: Extra delay after the first idle callback
+        """
+        root.after_idle(lambda: root.after(delay_ms, self.start))
+
+    def run(self, name: str, func: Callable, resource: str = "network", priority: int = 50):
+        """Run an ad-hoc task on the shared executor (usable after startup too)"""
+        suffix = 1
+        unique_name = name
+        with self._lock:
+            while unique_name in self._tasks:
+                suffix += 1
+                unique_name = f"{name}#{suffix}"
+        task = self.add(unique_name, func, priority=priority, resource=resource)
+        if not self._started:
+            self.start()
+        return task
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until all registered tasks have finished"""
+        return self._all_done.wait(timeout)
+
+    def shutdown(self, wait: bool = False):
+        """Stop the shared executor"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+    def _validate(self):
+        """Check for unknown dependencies and cycles (lock must be held)"""
+        for task in self._tasks.values():
+            for dep in task.depends_on:
+                if dep not in self._tasks:
+                    raise ValueError(f"Startup task '{task.name}' depends on unknown task '{dep}'")
+
+        visiting, visited = set(), set()
+
+        def visit(name):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle involving startup task '{name}'")
+            visiting.add(name)
+            for dep in self._tasks[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self._tasks:
+            visit(name)
+
+    def _dispatch(self):
+        """Submit every ready task that has a free resource slot"""
+        to_submit = []
+        with self._lock:
+            if self._executor is None:
+                return
+            now = time.perf_counter()
+            self._skip_blocked()
+            pending = sorted((t for t in self._tasks.values() if t.status == "pending"),
+                             key=lambda t: t.priority)
+            for task in pending:
+                deps = [self._tasks[d] for d in task.depends_on if d in self._tasks]
+                if any(d.status != "done" for d in deps):
+                    continue
+                if task.ready_at is None:
+                    task.ready_at = now
+                if self._running.get(task.resource, 0) >= self.resource_limits[task.resource]:
+                    continue
+                task.status = "running"
+                self._running[task.resource] = self._running.get(task.resource, 0) + 1
+                to_submit.append(task)
+
+            finished = all(t.status in ("done", "failed", "skipped") for t in self._tasks.values())
+
+        for task in to_submit:
+            self._executor.submit(self._run_task, task)
+
+        if finished and not to_submit:
+            self._finish()
+
+    def _skip_blocked(self):
+        """Mark tasks whose dependencies failed as skipped (lock must be held)"""
+        changed = True
+        while changed:
+            changed = False
+            for task in self._tasks.values():
+                if task.status != "pending":
+                    continue
+                deps = [self._tasks[d] for d in task.depends_on if d in self._tasks]
+                if any(d.status in ("failed", "skipped") for d in deps):
+                    task.status = "skipped"
+                    task.error = "dependency failed"
+                    changed = True
+
+    def _run_task(self, task: StartupTask):
+        task.started_at = time.perf_counter()
+        try:
+            task.func()
+            task.status = "done"
+        except Exception as e:
+            task.status = "failed"
+            task.error = str(e)
+            print(f"⚠️ Startup task '{task.name}' failed: {e}")
+        finally:
+            task.finished_at = time.perf_counter()
+            with self._lock:
+                self._running[task.resource] -= 1
+            self._dispatch()
+
+    def _finish(self):
+        if self._all_done.is_set():
+            return
+        self._all_done.set()
+        callbacks, self._on_complete = self._on_complete, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"⚠️ Startup completion callback failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def get_timings(self) -> List[Dict]:
+        """
+        Get per-task timings
+
+        Returns:
+            List of dicts with name, resource, priority, status, start_ms (relative
+            to scheduler start), wait_ms, run_ms and error
+        """
+        timings = []
+        with self._lock:
+            tasks = list(self._tasks.values())
+        for task in tasks:
+            start_ms = None
+            if task.started_at is not None and self._start_time is not None:
+                start_ms = (task.started_at - self._start_time) * 1000
+            timings.append({
+                "name": task.name,
+                "resource": task.resource,
+                "priority": task.priority,
+                "status": task.status,
+                "start_ms": start_ms,
+                "wait_ms": task.wait_ms,
+                "run_ms": task.run_ms,
+                "error": task.error,
+            })
+        timings.sort(key=lambda t: (t["start_ms"] is None, t["start_ms"] or 0))
+        return timings
+
+    def print_timings(self):
+        """Print a one-line-per-task timing summary"""
+        print("⏱️ Startup tasks:")
+        for t in self.get_timings():
+            start = f"+{t['start_ms']:.0f}ms" if t["start_ms"] is not None else "-"
+            run = f"{t['run_ms']:.0f}ms" if t["run_ms"] is not None else "-"
+            wait = f"{t['wait_ms']:.0f}ms" if t["wait_ms"] is not None else "-"
+            print(f"   {t['name']:<18} [{t['resource']}] {t['status']:<8} start {start}, ran {run}, waited {wait}")
+
+
+__all__ = [
+    'StartupTask',
+    'StartupScheduler',
+    'DEFAULT_RESOURCE_LIMITS',
+]
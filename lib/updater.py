@@ -8,14 +8,27 @@ import os
 import sys
 import urllib.request
 import urllib.error
+import urllib.parse
+import http.client
 import shutil
+import subprocess
 import tempfile
+import threading
 import zipfile
 import hashlib
+import io
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Dict, Tuple, List
 import logging
 
+try:
+    from lib.delta import apply_delta, DeltaError
+    from lib.manifest import FileHashManifest
+except ImportError:  # Running as a script from lib/
+    from delta import apply_delta, DeltaError
+    from manifest import FileHashManifest
+
 # GitHub repository info
 GITHUB_USER = "c26609124-sketch"
 GITHUB_REPO = "hw-helper"
@@ -25,11 +38,86 @@ GITHUB_RAW_URL = f"https://raw.githubusercontent.com/{GITHUB_USER}/{GITHUB_REPO}
 # Version file path
 VERSION_FILE = "version.json"
 
+# Tiny pointer document checked on every launch (version + where/which manifest to fetch).
+# The full version.json (changelog + file hashes) is only fetched when an update exists.
+POINTER_FILE = "latest.json"
+CHECK_TIMEOUT = 5  # seconds for pointer/manifest requests
+
+# ETag/Last-Modified + body of fetched update documents (for conditional requests)
+UPDATE_CACHE_DIR = Path.home() / ".hwhelper" / "update_cache"
+
+# Download settings
+USER_AGENT = 'HW-Helper-AutoUpdater/1.0'
+MAX_DOWNLOAD_WORKERS = 4          # Concurrent file downloads
+DOWNLOAD_CHUNK_SIZE = 64 * 1024   # Streamed + hashed in chunks of this size
+DOWNLOAD_TIMEOUT = 30             # Socket timeout per request (seconds)
+DOWNLOAD_RETRIES = 2              # Extra attempts per file on network/hash errors
+
+# Verified files are staged here (per version) before being moved into place,
+# so an interrupted update resumes without re-downloading finished files
+STAGING_DIR = '.update_staging'
+BACKUP_DIR = '.update_backup'
+
+# Written into a staging dir once every file in it is verified: the update can then
+# be swapped in by the launcher at the next start, with no network access
+STAGED_MARKER = '.staged.json'
+# Written before that swap starts; if present at launch the swap was interrupted
+# and is rolled forward from the remaining staged files
+APPLY_JOURNAL = '.applying'
+
 # Logger setup
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("AutoUpdater")
 
 
+class DownloadError(Exception):
+    """A file could not be downloaded or failed verification"""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class _ConnectionPool:
+    """Per-thread persistent HTTP(S) connections, reused across file downloads"""
+
+    def __init__(self, timeout: float = DOWNLOAD_TIMEOUT):
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all: List[http.client.HTTPConnection] = []
+
+    def get(self, scheme: str, host: str) -> http.client.HTTPConnection:
+        connections = getattr(self._local, 'connections', None)
+        if connections is None:
+            connections = self._local.connections = {}
+
+        conn = connections.get((scheme, host))
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+            conn = conn_class(host, timeout=self.timeout)
+            connections[(scheme, host)] = conn
+            with self._lock:
+                self._all.append(conn)
+        return conn
+
+    def discard(self, scheme: str, host: str):
+        """Drop this thread's connection (after an error or server-side close)"""
+        connections = getattr(self._local, 'connections', {})
+        conn = connections.pop((scheme, host), None)
+        if conn is not None:
+            conn.close()
+
+    def close_all(self):
+        with self._lock:
+            for conn in self._all:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._all.clear()
+
+
 class AutoUpdater:
     """Handles automatic updates from GitHub"""
 
@@ -43,6 +131,7 @@ class AutoUpdater:
         # CRITICAL FIX: updater.py is in lib/, so parent.parent gets project root
         self.current_dir = Path(current_dir) if current_dir else Path(__file__).parent.parent
         self.version_file = self.current_dir / VERSION_FILE
+        self.manifest = FileHashManifest(self.current_dir)
         self.current_version = self._load_current_version()
 
     def _load_current_version(self) -> str:
@@ -57,24 +146,118 @@ class AutoUpdater:
 
         return "0.0.0"
 
-    def _fetch_remote_version(self) -> Optional[Dict]:
+    def _load_installed_directory_hashes(self) -> Dict[str, str]:
+        """Load the per-directory rollup hashes of the installed release (version.json)"""
+        try:
+            with open(self.version_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get('directory_hashes', {})
+        except (OSError, ValueError):
+            return {}
+
+    def _conditional_get(self, url: str, timeout: float = CHECK_TIMEOUT) -> Optional[bytes]:
         """
-        Fetch version.json from GitHub
+        GET a document with If-None-Match/If-Modified-Since, reusing the cached body on 304
+
+        Args:
+            url: Document URL
+            timeout: Request timeout in seconds
 
         Returns:
-            Dict with version info or None if failed
+            Document bytes, or None if it doesn't exist (404)
+
+        Raises:
+            urllib.error.URLError / OSError on network errors
+        """
+        cache_path = UPDATE_CACHE_DIR / (hashlib.sha1(url.encode('utf-8')).hexdigest()[:16] + ".json")
+        cached = None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        req = urllib.request.Request(url)
+        req.add_header('User-Agent', USER_AGENT)
+        req.add_header('Cache-Control', 'no-cache')
+        if cached and cached.get('etag'):
+            req.add_header('If-None-Match', cached['etag'])
+        if cached and cached.get('last_modified'):
+            req.add_header('If-Modified-Since', cached['last_modified'])
+
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                body = response.read()
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached is not None:
+                logger.info(f"Not modified: {url}")
+                return cached['body'].encode('utf-8')
+            if e.code == 404:
+                return None
+            raise
+
+        if etag or last_modified:
+            try:
+                UPDATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix('.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'url': url, 'etag': etag, 'last_modified': last_modified,
+                               'body': body.decode('utf-8')}, f)
+                os.replace(tmp_path, cache_path)
+            except (OSError, UnicodeDecodeError) as e:
+                logger.debug(f"Could not cache {url}: {e}")
+        return body
+
+    def _fetch_version_pointer(self) -> Optional[Dict]:
+        """
+        Fetch the tiny latest.json pointer (conditional request)
+
+        Returns:
+            Dict with version, release_date, manifest, manifest_sha256 - or None if
+            the release has no pointer yet or the request failed
         """
         try:
-            url = f"{GITHUB_RAW_URL}/{VERSION_FILE}"
+            url = f"{GITHUB_RAW_URL}/{POINTER_FILE}"
             logger.info(f"Checking for updates at {url}")
+            body = self._conditional_get(url)
+            if body is None:
+                return None
+            return json.loads(body.decode('utf-8'))
+        except Exception as e:
+            logger.warning(f"Could not fetch version pointer: {e}")
+            return None
 
-            req = urllib.request.Request(url)
-            req.add_header('User-Agent', 'HW-Helper-AutoUpdater/1.0')
-            req.add_header('Cache-Control', 'no-cache')
+    def _fetch_remote_version(self, pointer: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Fetch version.json (changelog + file hashes) from GitHub
 
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode('utf-8'))
-                return data
+        Args:
+            pointer: Version pointer naming the manifest and its expected SHA256
+
+        Returns:
+            Dict with version info or None if failed
+        """
+        try:
+            manifest_name = (pointer or {}).get('manifest', VERSION_FILE)
+            url = f"{GITHUB_RAW_URL}/{manifest_name}"
+            logger.info(f"Fetching release manifest {url}")
+
+            body = self._conditional_get(url, timeout=10)
+            if body is None:
+                logger.error(f"Release manifest not found: {url}")
+                return None
+
+            expected_hash = (pointer or {}).get('manifest_sha256')
+            if expected_hash and hashlib.sha256(body).hexdigest() != expected_hash:
+                # The CDN can briefly serve the two files from different releases
+                logger.warning("Release manifest does not match version pointer yet - try again later")
+                return None
+
+            data = json.loads(body.decode('utf-8'))
+            # version.json can't contain its own hash - remember the hash of what we fetched
+            data['manifest_sha256'] = hashlib.sha256(body).hexdigest()
+            return data
 
         except urllib.error.URLError as e:
             logger.error(f"Network error checking for updates: {e}")
@@ -129,6 +312,22 @@ class AutoUpdater:
             logger.error(f"Error computing hash for {file_path}: {e}")
             return ""
 
+    def _local_file_hash(self, rel_path: str) -> str:
+        """
+        SHA256 of an installed file, using the persisted manifest when size/mtime are unchanged
+
+        Args:
+            rel_path: Path relative to the application directory
+
+        Returns:
+            Hexadecimal hash string ("" if the file can't be read)
+        """
+        try:
+            return self.manifest.get_hash(rel_path)
+        except OSError as e:
+            logger.error(f"Error computing hash for {rel_path}: {e}")
+            return ""
+
     def _clear_python_cache(self):
         """
         Clear Python bytecode cache files (.pyc) to force reload of updated modules
@@ -175,7 +374,15 @@ class AutoUpdater:
         """
         logger.info(f"Current version: {self.current_version}")
 
-        remote_data = self._fetch_remote_version()
+        # Cheap check first: the pointer is a few hundred bytes (usually a 304)
+        pointer = self._fetch_version_pointer()
+        if pointer and not self._compare_versions(self.current_version, pointer.get('version', '0.0.0')):
+            logger.info(f"Remote version: {pointer.get('version')}")
+            logger.info("Application is up to date")
+            return False, None
+
+        # Update available (or no pointer published) - fetch the full manifest
+        remote_data = self._fetch_remote_version(pointer)
         if not remote_data:
             logger.info("Could not check for updates (no network or repo not found)")
             return False, None
@@ -190,39 +397,142 @@ class AutoUpdater:
         logger.info("Application is up to date")
         return False, None
 
-    def _download_file(self, url: str, dest_path: Path) -> bool:
+    def _download_file(self, url: str, dest_path: Path, expected_hash: Optional[str] = None,
+                       pool: Optional[_ConnectionPool] = None) -> bool:
         """
-        Download a file from GitHub
+        Download a file from GitHub, verifying its SHA256 while streaming
+
+        Bytes are written as-is (hashes in version.json are over raw bytes) to a
+        .part file that is atomically renamed to dest_path only after verification.
 
         Args:
             url: URL to download from
             dest_path: Destination file path
+            expected_hash: SHA256 from file_hashes (skip verification if None)
+            pool: Connection pool to reuse (a temporary one is used if None)
 
         Returns:
             True if successful, False otherwise
         """
-        try:
-            logger.info(f"Downloading {url}")
+        own_pool = pool is None
+        pool = pool or _ConnectionPool()
+        part_path = dest_path.with_name(dest_path.name + '.part')
 
-            req = urllib.request.Request(url)
-            req.add_header('User-Agent', 'HW-Helper-AutoUpdater/1.0')
+        try:
+            for attempt in range(1 + DOWNLOAD_RETRIES):
+                try:
+                    self._stream_to_file(url, part_path, expected_hash, pool)
+                    os.replace(part_path, dest_path)
+                    logger.info(f"Downloaded to {dest_path}")
+                    return True
+                except DownloadError as e:
+                    if not e.retryable or attempt == DOWNLOAD_RETRIES:
+                        logger.error(f"Error downloading {url}: {e}")
+                        return False
+                    logger.warning(f"Retrying {url} ({e})")
+                except (http.client.HTTPException, OSError) as e:
+                    if attempt == DOWNLOAD_RETRIES:
+                        logger.error(f"Error downloading {url}: {e}")
+                        return False
+                    logger.warning(f"Retrying {url} ({e})")
+            return False
+        finally:
+            if part_path.exists():
+                try:
+                    part_path.unlink()
+                except OSError:
+                    pass
+            if own_pool:
+                pool.close_all()
+
+    def _stream_to_file(self, url: str, part_path: Path, expected_hash: Optional[str],
+                        pool: _ConnectionPool):
+        """Stream one URL into part_path over a pooled connection, hashing as it goes"""
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(part_path, 'wb') as f:
+            self._stream_to(url, f, expected_hash, pool)
+
+    def _stream_to(self, url: str, out, expected_hash: Optional[str], pool: _ConnectionPool):
+        """Stream one URL into a writable file object, verifying its SHA256"""
+        parts = urllib.parse.urlsplit(url)
+        request_path = parts.path + (f"?{parts.query}" if parts.query else '')
+
+        conn = pool.get(parts.scheme, parts.netloc)
+        try:
+            conn.request('GET', request_path, headers={
+                'User-Agent': USER_AGENT,
+                'Accept-Encoding': 'identity',
+            })
+            response = conn.getresponse()
+
+            if response.status != 200:
+                response.read()
+                raise DownloadError(f"HTTP {response.status}", retryable=response.status >= 500)
+
+            sha256 = hashlib.sha256()
+            for chunk in iter(lambda: response.read(DOWNLOAD_CHUNK_SIZE), b''):
+                sha256.update(chunk)
+                out.write(chunk)
+
+            if response.will_close:
+                pool.discard(parts.scheme, parts.netloc)
+        except Exception:
+            # Connection state is unknown after an error - reconnect next time
+            pool.discard(parts.scheme, parts.netloc)
+            raise
+
+        if expected_hash and sha256.hexdigest() != expected_hash:
+            raise DownloadError(f"SHA256 mismatch (expected {expected_hash[:12]}..., "
+                                f"got {sha256.hexdigest()[:12]}...)")
+
+    def _download_via_delta(self, file_path: str, delta_info: Dict, dest_path: Path,
+                            expected_hash: str, pool: _ConnectionPool) -> bool:
+        """
+        Rebuild a changed file from the local copy plus a published delta
 
-            with urllib.request.urlopen(req, timeout=30) as response:
-                content = response.read()
-                # Write text files with UTF-8 encoding, binary files as-is
-                if dest_path.suffix in ['.py', '.txt', '.md', '.json', '.sh', '.bat']:
-                    with open(dest_path, 'w', encoding='utf-8', newline='') as f:
-                        f.write(content.decode('utf-8'))
-                else:
-                    with open(dest_path, 'wb') as f:
-                        f.write(content)
+        Args:
+            file_path: Relative path of the file being updated
+            delta_info: Entry from version.json "deltas" (path, size, sha256)
+            dest_path: Where to write the rebuilt file (atomically)
+            expected_hash: SHA256 the rebuilt file must have
 
-            logger.info(f"Downloaded to {dest_path}")
+        Returns:
+            True if the file was rebuilt and verified, False to fall back to a full download
+        """
+        part_path = dest_path.with_name(dest_path.name + '.part')
+        try:
+            buffer = io.BytesIO()
+            self._stream_to(f"{GITHUB_RAW_URL}/{urllib.parse.quote(delta_info['path'])}",
+                            buffer, delta_info.get('sha256'), pool)
+
+            old_data = (self.current_dir / file_path).read_bytes()
+            new_data = apply_delta(old_data, buffer.getvalue())
+            if hashlib.sha256(new_data).hexdigest() != expected_hash:
+                raise DeltaError("Rebuilt file does not match file_hashes")
+
+            part_path.parent.mkdir(parents=True, exist_ok=True)
+            part_path.write_bytes(new_data)
+            os.replace(part_path, dest_path)
+            logger.info(f"Patched {file_path} with {delta_info.get('size', len(buffer.getvalue()))}-byte delta")
             return True
-
-        except Exception as e:
-            logger.error(f"Error downloading file: {e}")
+        except (DownloadError, DeltaError, http.client.HTTPException, OSError, KeyError) as e:
+            logger.warning(f"Delta for {file_path} failed ({e}) - downloading full file")
             return False
+        finally:
+            if part_path.exists():
+                try:
+                    part_path.unlink()
+                except OSError:
+                    pass
+
+    def _fetch_file(self, file_path: str, dest_path: Path, expected_hash: Optional[str],
+                    delta_info: Optional[Dict], pool: _ConnectionPool) -> bool:
+        """Stage one file: try the delta first (if any), then the full file"""
+        if delta_info and expected_hash:
+            if self._download_via_delta(file_path, delta_info, dest_path, expected_hash, pool):
+                return True
+        return self._download_file(f"{GITHUB_RAW_URL}/{urllib.parse.quote(file_path)}",
+                                   dest_path, expected_hash, pool)
 
     def _get_repo_files(self) -> Optional[list]:
         """
@@ -254,9 +564,132 @@ class AutoUpdater:
             logger.error(f"Error getting repo files: {e}")
             return None
 
+    def _plan_update(self, remote_version_data: Optional[Dict]) -> Optional[Tuple[List[str], Dict[str, str], Dict[str, Dict], str]]:
+        """
+        Work out which files an update needs (hash-based differential update)
+
+        Args:
+            remote_version_data: Remote version data with file_hashes (from version.json)
+
+        Returns:
+            (files_to_download, remote_hashes, file_deltas, version), or None if the
+            file list could not be determined
+        """
+        # Get remote file hashes
+        remote_hashes = {}
+        if remote_version_data:
+            remote_hashes = dict(remote_version_data.get('file_hashes', {}))
+
+            # The file_hashes entry for version.json is always stale (a file can't
+            # hash itself) - verify it against the manifest we actually fetched
+            if VERSION_FILE in remote_hashes:
+                manifest_hash = remote_version_data.get('manifest_sha256')
+                if manifest_hash:
+                    remote_hashes[VERSION_FILE] = manifest_hash
+                else:
+                    del remote_hashes[VERSION_FILE]
+
+        # If no hashes available, fall back to downloading all files
+        if not remote_hashes:
+            logger.warning("No file hashes in version.json - downloading all files")
+            files_to_update = self._get_repo_files()
+            if not files_to_update:
+                logger.error("Could not get list of files to update")
+                return None
+        else:
+            # Hash-based comparison - only download changed files
+            files_to_update = list(remote_version_data.get('file_hashes', {}).keys())
+
+        # Filter out files we don't want to overwrite
+        excluded_patterns = [
+            '.git',
+            '__pycache__',
+            '*.pyc',
+            '.DS_Store',
+            'screenshots/',
+            'saved_screenshots/',
+            STAGING_DIR,
+            BACKUP_DIR,
+            'deltas/',  # Release deltas are fetched on demand, never installed
+            POINTER_FILE,
+            'api_key.txt',  # Don't overwrite user's API key
+            'config.json'  # Don't overwrite user's config
+        ]
+
+        # Directories whose rollup hash matches the installed release are unchanged
+        # between releases - their files only need an existence check, not hashing
+        remote_dir_hashes = (remote_version_data or {}).get('directory_hashes', {})
+        installed_dir_hashes = self._load_installed_directory_hashes() if remote_dir_hashes else {}
+        unchanged_dirs = {
+            rel_dir for rel_dir, digest in remote_dir_hashes.items()
+            if rel_dir != '.' and installed_dir_hashes.get(rel_dir) == digest
+        }
+        if unchanged_dirs:
+            logger.info(f"Skipping {len(unchanged_dirs)} unchanged directories")
+
+        def in_unchanged_dir(file_path: str) -> bool:
+            parent = file_path.rpartition('/')[0]
+            while parent:
+                if parent in unchanged_dirs:
+                    return True
+                parent = parent.rpartition('/')[0]
+            return False
+
+        files_to_download = []
+        local_hashes = {}  # file -> hash of the local (old) copy, used to pick deltas
+        for file_path in files_to_update:
+            # Skip excluded patterns
+            if any(pattern.replace('*', '') in file_path or file_path.startswith(pattern.replace('*', ''))
+                   for pattern in excluded_patterns):
+                continue
+
+            # If hashes available, compare local vs remote
+            if remote_hashes and file_path in remote_hashes:
+                local_path = self.current_dir / file_path
+                remote_hash = remote_hashes[file_path]
+
+                # Download if file missing OR hash differs
+                if not local_path.exists():
+                    files_to_download.append(file_path)
+                    logger.info(f"  New file: {file_path}")
+                elif in_unchanged_dir(file_path):
+                    logger.debug(f"  Unchanged (directory): {file_path}")
+                else:
+                    # Cached by size/mtime - unchanged files aren't re-read
+                    local_hash = self._local_file_hash(file_path)
+                    if local_hash != remote_hash:
+                        files_to_download.append(file_path)
+                        local_hashes[file_path] = local_hash
+                        logger.info(f"  Changed: {file_path}")
+                    else:
+                        logger.debug(f"  Unchanged: {file_path}")
+            else:
+                # No hash info - download file
+                files_to_download.append(file_path)
+
+        self.manifest.save()
+        logger.info(f"Hash manifest: {self.manifest.hits} cached, {self.manifest.misses} rehashed")
+        logger.info(f"Downloading {len(files_to_download)}/{len(files_to_update)} changed files...")
+
+        # Deltas published for this release, keyed by file then by old file hash
+        available_deltas = (remote_version_data or {}).get('deltas', {})
+        file_deltas = {
+            file_path: available_deltas[file_path][local_hash]
+            for file_path, local_hash in local_hashes.items()
+            if local_hash in available_deltas.get(file_path, {})
+        }
+        if file_deltas:
+            logger.info(f"Using deltas for {len(file_deltas)} file(s)")
+
+        version = (remote_version_data or {}).get('version', 'latest')
+        return files_to_download, remote_hashes, file_deltas, version
+
     def download_update(self, remote_version_data: Optional[Dict] = None, progress_callback=None) -> bool:
         """
-        Download update files from GitHub (hash-based differential update)
+        Download update files from GitHub and apply them immediately
+
+        Used when the app can't wait for a restart (CLI, broken install recovery).
+        The running app uses stage_update() + apply_staged_update() instead.
 
         Args:
             remote_version_data: Remote version data with file_hashes (from version.json)
@@ -266,111 +699,318 @@ class AutoUpdater:
             True if successful, False otherwise
         """
         try:
-            # Get remote file hashes
-            remote_hashes = {}
-            if remote_version_data:
-                remote_hashes = remote_version_data.get('file_hashes', {})
-
-            # If no hashes available, fall back to downloading all files
-            if not remote_hashes:
-                logger.warning("No file hashes in version.json - downloading all files")
-                files_to_update = self._get_repo_files()
-                if not files_to_update:
-                    logger.error("Could not get list of files to update")
-                    return False
+            plan = self._plan_update(remote_version_data)
+            if plan is None:
+                return False
+            files_to_download, remote_hashes, file_deltas, version = plan
+            staging_dir = self._prepare_staging_dir(version)
+
+            # Stage (download + verify) everything first; nothing in the app changes yet
+            if not self._stage_files(files_to_download, remote_hashes, staging_dir, progress_callback,
+                                     file_deltas=file_deltas):
+                logger.error("Some files could not be downloaded - update not applied "
+                             "(finished files stay staged and will be reused on retry)")
+                return False
+
+            success_count = self._apply_staged_files(files_to_download, staging_dir, remote_hashes)
+
+            # CRITICAL: Clear Python bytecode cache to force reload of updated .py files
+            # Without this, Python will use cached .pyc files even though source changed
+            if success_count > 0:
+                self._clear_python_cache()
+
+            return success_count > 0 or not files_to_download
+
+        except Exception as e:
+            logger.error(f"Error downloading update: {e}")
+            return False
+
+    def stage_update(self, remote_version_data: Dict, progress_callback=None) -> bool:
+        """
+        Download and verify an update into the staging directory without touching the app
+
+        Once every file is verified a marker is written; the launcher then swaps the
+        files in at the next start (apply_staged_update) with no network access.
+
+        Args:
+            remote_version_data: Remote version data with file_hashes (from version.json)
+            progress_callback: Optional callback function(current, total, filename, percentage)
+
+        Returns:
+            True if the update is fully staged and ready to apply
+        """
+        try:
+            version = remote_version_data.get('version', 'latest')
+            staged = self.get_staged_update()
+            if staged and staged['version'] == version:
+                logger.info(f"Update v{version} already staged - will be applied on next start")
+                return True
+
+            plan = self._plan_update(remote_version_data)
+            if plan is None:
+                return False
+            files_to_download, remote_hashes, file_deltas, version = plan
+            staging_dir = self._prepare_staging_dir(version)
+
+            if not self._stage_files(files_to_download, remote_hashes, staging_dir, progress_callback,
+                                     file_deltas=file_deltas):
+                logger.error("Some files could not be downloaded - update not staged "
+                             "(finished files are kept and reused on retry)")
+                return False
+
+            changes = (remote_version_data.get('changelog') or [{}])[0].get('changes', [])
+            marker = {
+                'version': version,
+                'files': files_to_download,
+                'file_hashes': {f: remote_hashes[f] for f in files_to_download if f in remote_hashes},
+                'changelog': changes,
+            }
+            tmp_path = staging_dir / (STAGED_MARKER + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(marker, f, indent=2)
+            os.replace(tmp_path, staging_dir / STAGED_MARKER)
+
+            logger.info(f"Update v{version} staged ({len(files_to_download)} files) - will be applied on next start")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error staging update: {e}")
+            return False
+
+    def get_staged_update(self) -> Optional[Dict]:
+        """
+        Find a fully staged update that is newer than the installed version
+
+        Staged updates that are incomplete stay for download resume; ones that are no
+        longer newer than the installed version are removed.
+
+        Returns:
+            Staged marker data (version, files, file_hashes, changelog) plus
+            'staging_dir', or None
+        """
+        staging_root = self.current_dir / STAGING_DIR
+        if not staging_root.is_dir():
+            return None
+
+        for staging_dir in staging_root.iterdir():
+            marker_path = staging_dir / STAGED_MARKER
+            if not marker_path.is_file():
+                continue
+            try:
+                with open(marker_path, 'r', encoding='utf-8') as f:
+                    staged = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Discarding unreadable staged update {staging_dir.name}: {e}")
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                continue
+
+            # An interrupted swap must be finished even though version.json may
+            # already report the new version
+            interrupted = (staging_dir / APPLY_JOURNAL).exists()
+            if not interrupted and not self._compare_versions(self.current_version, staged.get('version', '0.0.0')):
+                logger.info(f"Discarding staged update v{staged.get('version')} (installed: v{self.current_version})")
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                continue
+
+            staged['staging_dir'] = str(staging_dir)
+            return staged
+
+        return None
+
+    def apply_staged_update(self) -> Optional[str]:
+        """
+        Swap a staged update into place (launcher, before the UI is imported)
+
+        Local file operations only. A journal file is written before the first file
+        is moved; if the process dies mid-swap, the next launch sees the journal and
+        rolls forward from the remaining (already verified) staged files.
+
+        Returns:
+            The version that was applied, or None if nothing was applied
+        """
+        staged = self.get_staged_update()
+        if not staged:
+            return None
+
+        version = staged['version']
+        staging_dir = Path(staged['staging_dir'])
+        journal_path = staging_dir / APPLY_JOURNAL
+        resume = journal_path.exists()
+
+        if resume:
+            logger.warning(f"Resuming interrupted update to v{version}")
+        else:
+            logger.info(f"Applying staged update v{version}...")
+            journal_path.write_text(version, encoding='utf-8')
+
+        files = staged.get('files', [])
+        applied = self._apply_staged_files(files, staging_dir, staged.get('file_hashes'), resume=resume)
+
+        if files and not applied:
+            # Rolled back - drop the marker so the app re-stages (missing files only)
+            for name in (STAGED_MARKER, APPLY_JOURNAL):
+                try:
+                    (staging_dir / name).unlink()
+                except OSError:
+                    pass
+            logger.error(f"Staged update v{version} could not be applied - keeping v{self.current_version}")
+            return None
+
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        self._clear_python_cache()
+        self.current_version = self._load_current_version()
+        logger.info(f"Updated to version {version}")
+        return version
+
+    def _prepare_staging_dir(self, version: str) -> Path:
+        """Get the staging directory for a version, removing stale ones from other versions"""
+        staging_root = self.current_dir / STAGING_DIR
+        staging_dir = staging_root / version
+        if staging_root.exists():
+            for old_dir in staging_root.iterdir():
+                if old_dir != staging_dir:
+                    shutil.rmtree(old_dir, ignore_errors=True)
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        return staging_dir
+
+    def _stage_files(self, files: List[str], remote_hashes: Dict[str, str], staging_dir: Path,
+                     progress_callback=None, file_deltas: Optional[Dict[str, Dict]] = None) -> bool:
+        """
+        Download files into the staging directory concurrently, skipping ones already staged
+
+        Files with an entry in file_deltas are rebuilt from the local copy + delta,
+        falling back to the full file if the delta fails.
+
+        Returns:
+            True if every file is staged and verified
+        """
+        total_files = len(files)
+        completed = [0]
+        progress_lock = threading.Lock()
+
+        def report(file_path: str):
+            with progress_lock:
+                completed[0] += 1
+                if progress_callback:
+                    percentage = int((completed[0] / total_files) * 100)
+                    progress_callback(completed[0], total_files, file_path, percentage)
+
+        # Resume: files staged by an interrupted run were verified before being renamed into place
+        pending = []
+        for file_path in files:
+            staged_path = staging_dir / file_path
+            expected_hash = remote_hashes.get(file_path)
+            if staged_path.exists() and (not expected_hash or self._compute_file_hash(staged_path) == expected_hash):
+                logger.info(f"  Already staged: {file_path}")
+                report(file_path)
             else:
-                # Hash-based comparison - only download changed files
-                files_to_update = list(remote_hashes.keys())
-
-            # Filter out files we don't want to overwrite
-            excluded_patterns = [
-                '.git',
-                '__pycache__',
-                '*.pyc',
-                '.DS_Store',
-                'screenshots/',
-                'saved_screenshots/',
-                'api_key.txt',  # Don't overwrite user's API key
-                'config.json'  # Don't overwrite user's config
-            ]
-
-            files_to_download = []
-            for file_path in files_to_update:
-                # Skip excluded patterns
-                if any(pattern.replace('*', '') in file_path or file_path.startswith(pattern.replace('*', ''))
-                       for pattern in excluded_patterns):
-                    continue
-
-                # If hashes available, compare local vs remote
-                if remote_hashes and file_path in remote_hashes:
-                    local_path = self.current_dir / file_path
-                    remote_hash = remote_hashes[file_path]
-
-                    # Download if file missing OR hash differs
-                    if not local_path.exists():
-                        files_to_download.append(file_path)
-                        logger.info(f"  New file: {file_path}")
+                pending.append(file_path)
+
+        if not pending:
+            return True
+
+        failed = []
+        pool = _ConnectionPool()
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS, thread_name_prefix="Update") as executor:
+                futures = {
+                    executor.submit(
+                        self._fetch_file,
+                        file_path,
+                        staging_dir / file_path,
+                        remote_hashes.get(file_path),
+                        (file_deltas or {}).get(file_path),
+                        pool,
+                    ): file_path
+                    for file_path in pending
+                }
+                for future in as_completed(futures):
+                    file_path = futures[future]
+                    try:
+                        ok = future.result()
+                    except Exception as e:
+                        logger.error(f"Error downloading {file_path}: {e}")
+                        ok = False
+                    if ok:
+                        report(file_path)
                     else:
-                        local_hash = self._compute_file_hash(local_path)
-                        if local_hash != remote_hash:
-                            files_to_download.append(file_path)
-                            logger.info(f"  Changed: {file_path}")
-                        else:
-                            logger.debug(f"  Unchanged: {file_path}")
-                else:
-                    # No hash info - download file
-                    files_to_download.append(file_path)
+                        failed.append(file_path)
+                        logger.warning(f"Failed to download {file_path}")
+        finally:
+            pool.close_all()
 
-            logger.info(f"Downloading {len(files_to_download)}/{len(files_to_update)} changed files...")
+        return not failed
 
-            # Create backup directory
-            backup_dir = self.current_dir / '.update_backup'
-            backup_dir.mkdir(exist_ok=True)
+    def _apply_staged_files(self, files: List[str], staging_dir: Path,
+                            remote_hashes: Optional[Dict[str, str]] = None, resume: bool = False) -> int:
+        """
+        Move staged files into place (backing up originals, rolling back on failure)
+
+        Verified hashes of applied files are recorded in the hash manifest.
 
-            # Download and apply updates
-            success_count = 0
-            total_files = len(files_to_download)
+        Args:
+            resume: Continue an interrupted swap - files already moved are kept and
+                backups from the first attempt (the real originals) are not overwritten
 
-            for index, file_path in enumerate(files_to_download, 1):
-                url = f"{GITHUB_RAW_URL}/{file_path}"
+        Returns:
+            Number of files applied
+        """
+        backup_dir = self.current_dir / BACKUP_DIR
+        backup_dir.mkdir(exist_ok=True)
+        applied = []
+
+        try:
+            for file_path in files:
                 dest_path = self.current_dir / file_path
+                staged_path = staging_dir / file_path
+                backup_path = backup_dir / file_path
 
-                # Report progress
-                if progress_callback:
-                    percentage = int((index / total_files) * 100)
-                    progress_callback(index, total_files, file_path, percentage)
+                if resume and not staged_path.exists():
+                    expected_hash = (remote_hashes or {}).get(file_path)
+                    if dest_path.exists() and (not expected_hash or self._compute_file_hash(dest_path) == expected_hash):
+                        applied.append(file_path)  # Moved before the interruption
+                        continue
+                    raise FileNotFoundError(f"Staged file missing: {file_path}")
 
                 # Backup existing file
-                if dest_path.exists():
-                    backup_path = backup_dir / file_path
+                if dest_path.exists() and not (resume and backup_path.exists()):
                     backup_path.parent.mkdir(parents=True, exist_ok=True)
                     shutil.copy2(dest_path, backup_path)
 
-                # Download new version
                 dest_path.parent.mkdir(parents=True, exist_ok=True)
-                if self._download_file(url, dest_path):
-                    success_count += 1
-                else:
-                    logger.warning(f"Failed to download {file_path}")
+                os.replace(staged_path, dest_path)
+                applied.append(file_path)
 
-            logger.info(f"Successfully updated {success_count}/{len(files_to_download)} files")
+        except Exception as e:
+            logger.error(f"Error applying update, rolling back: {e}")
+            for file_path in applied:
+                backup_path = backup_dir / file_path
+                try:
+                    if backup_path.exists():
+                        os.replace(backup_path, self.current_dir / file_path)
+                    else:
+                        (self.current_dir / file_path).unlink()
+                except OSError as restore_error:
+                    logger.error(f"  Could not restore {file_path}: {restore_error}")
+            return 0
 
-            # CRITICAL: Clear Python bytecode cache to force reload of updated .py files
-            # Without this, Python will use cached .pyc files even though source changed
-            if success_count > 0:
-                self._clear_python_cache()
+        logger.info(f"Successfully updated {len(applied)}/{len(files)} files")
 
-            # Clean up old backup (keep only latest)
-            try:
-                shutil.rmtree(backup_dir)
-            except:
-                pass
+        for file_path in applied:
+            if remote_hashes and file_path in remote_hashes:
+                self.manifest.record(file_path, remote_hashes[file_path])
+            else:
+                self.manifest.forget(file_path)
+        self.manifest.save()
 
-            return success_count > 0
+        # Clean up staging and old backup (keep only latest)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        try:
+            shutil.rmtree(backup_dir)
+        except:
+            pass
 
-        except Exception as e:
-            logger.error(f"Error downloading update: {e}")
-            return False
+        return len(applied)
 
     def apply_update(self, progress_callback=None) -> bool:
         """
@@ -406,6 +1046,31 @@ class AutoUpdater:
         return False
 
 
+def write_version_pointer(root_dir: Optional[Path] = None) -> Dict:
+    """
+    Write latest.json for the release in version.json (release tooling)
+
+    Must be re-run whenever version.json changes, since the pointer records its hash.
+
+    Returns:
+        The pointer dict that was written
+    """
+    root_dir = Path(root_dir) if root_dir else Path(__file__).parent.parent
+    version_bytes = (root_dir / VERSION_FILE).read_bytes()
+    version_data = json.loads(version_bytes.decode('utf-8'))
+
+    pointer = {
+        'version': version_data.get('version', '0.0.0'),
+        'release_date': version_data.get('release_date', ''),
+        'manifest': VERSION_FILE,
+        'manifest_sha256': hashlib.sha256(version_bytes).hexdigest(),
+    }
+    with open(root_dir / POINTER_FILE, 'w', encoding='utf-8') as f:
+        json.dump(pointer, f, indent=2)
+        f.write('\n')
+    return pointer
+
+
 def check_for_updates_silent() -> Tuple[bool, Optional[str], Optional[list]]:
     """
     Check for updates without logging (for UI integration)
@@ -442,11 +1107,78 @@ def apply_update_silent(progress_callback=None) -> bool:
     return updater.apply_update(progress_callback=progress_callback)
 
 
+def stage_update_silent(progress_callback=None) -> Tuple[bool, Optional[str], Optional[list]]:
+    """
+    Check for an update and stage it in the background (for UI integration)
+
+    Nothing in the app changes; the launcher applies it at the next start.
+
+    Args:
+        progress_callback: Optional callback function(current, total, filename, percentage)
+
+    Returns:
+        Tuple of (staged, new_version, changelog) - staged is False if there is
+        no update or the download failed
+    """
+    project_root = Path(__file__).parent.parent
+    updater = AutoUpdater(str(project_root))
+    update_available, remote_data = updater.check_for_updates()
+
+    if not (update_available and remote_data):
+        return False, None, None
+
+    new_version = remote_data.get('version', 'unknown')
+    changelog = remote_data.get('changelog', [{}])[0].get('changes', [])
+    return updater.stage_update(remote_data, progress_callback=progress_callback), new_version, changelog
+
+
+def apply_staged_update_silent() -> Optional[str]:
+    """
+    Apply a previously staged update, if any (launcher - no network access)
+
+    Returns:
+        The version that was applied, or None
+    """
+    project_root = Path(__file__).parent.parent
+    updater = AutoUpdater(str(project_root))
+    return updater.apply_staged_update()
+
+
+def restart_process(argv: Optional[List[str]] = None):
+    """
+    Restart the app with the same interpreter (after an update was applied)
+
+    POSIX replaces this process with os.execv. Windows has no real exec: os.execv
+    spawns a child and ends the parent at once, racing the console/launcher
+    handles, and does not quote arguments containing spaces. There the new
+    process is started with subprocess.Popen (list arguments are quoted) and
+    this one exits normally, so atexit handlers still run.
+
+    Args:
+        argv: Script and arguments (default: sys.argv)
+    """
+    python = sys.executable
+    args = [python] + list(sys.argv if argv is None else argv)
+    sys.stdout.flush()
+    if sys.platform == "win32":
+        subprocess.Popen(args)
+        sys.exit(0)
+    os.execv(python, args)
+
+
 if __name__ == "__main__":
     # CLI usage
     updater = AutoUpdater()
 
-    if len(sys.argv) > 1 and sys.argv[1] == "--check":
+    if len(sys.argv) > 1 and sys.argv[1] == "--stage":
+        # Download + verify only; applied by the launcher at next start
+        update_available, remote_data = updater.check_for_updates()
+        if update_available and updater.stage_update(remote_data):
+            print(f"Update {remote_data['version']} staged - it will be applied on next start.")
+            sys.exit(0)
+        print("No update staged")
+        sys.exit(1)
+    elif len(sys.argv) > 1 and sys.argv[1] == "--check":
         # Just check, don't apply
         update_available, remote_data = updater.check_for_updates()
         if update_available:
@@ -13,11 +13,16 @@ progressive JSON parsing, and UI widget tree export.
 
 import json
 import re
+import sys
 import tkinter
-import numpy as np
 from typing import Dict, List, Optional, Tuple, Any
 from PIL import Image, ImageDraw, ImageFilter
 
+from .lazy import lazy_import
+
+# numpy is only needed by VisualElementDetector - load it on first use
+np = lazy_import("numpy")
+
 
 # ============================================================================
 # RESPONSE VALIDATOR
@@ -472,13 +477,13 @@ class VisualElementDetector:
         return metadata
 
     # Helper methods
-    def _detect_edges_simple(self, img_array: np.ndarray, threshold: int = 128) -> np.ndarray:
+    def _detect_edges_simple(self, img_array: 'np.ndarray', threshold: int = 128) -> 'np.ndarray':
         """Simple edge detection using threshold"""
         edges = np.zeros_like(img_array)
         edges[img_array > threshold] = 255
         return edges
 
-    def _find_rectangular_regions(self, edges: np.ndarray, min_size: int) -> List[Dict]:
+    def _find_rectangular_regions(self, edges: 'np.ndarray', min_size: int) -> List[Dict]:
         """Find rectangular regions in edge image"""
         # Simplified region detection
         regions = []
@@ -756,188 +761,293 @@ class ProgressiveJSONParser:
 # ============================================================================
 # UI EXPORT (Widget Tree Export)
 # ============================================================================
+# v1.0.69: The tree is walked once with an explicit stack. Geometry for every
+# widget comes back from a single Tcl call, what each widget class supports is
+# probed once and memoized, and config properties that still have their class
+# (theme) default are omitted - so export time and payload size track what is
+# actually distinctive in the tree, not how many widgets it has.
+
+EXPORT_TEXT_LIMIT = 500
+EXPORT_CONFIG_PROPERTIES = ('fg_color', 'bg_color', 'text_color', 'border_color', 'border_width', 'corner_radius')
+
+# Tcl lambda for `apply`: geometry of every widget path in one round trip
+# ({} for widgets destroyed since the walk)
+_GEOMETRY_SCRIPT = """{paths} {
+    set result {}
+    foreach w $paths {
+        if {[winfo exists $w]} {
+            lappend result [list [winfo x $w] [winfo y $w] [winfo width $w] [winfo height $w] [winfo viewable $w]]
+        } else {
+            lappend result {}
+        }
+    }
+    return $result
+}"""
 
-def export_widget_tree(widget, max_depth: int = 10, current_depth: int = 0) -> Optional[Dict]:
-    """
-    Recursively export widget tree to JSON-serializable dict
+_EMPTY_GEOMETRY = {"x": 0, "y": 0, "width": 0, "height": 0, "visible": False}
 
-    Args:
-        widget: Root widget to export (CTkFrame, CTkLabel, etc.)
-        max_depth: Maximum recursion depth
-        current_depth: Current recursion level (internal)
 
-    Returns:
-        Dict with widget structure and properties
-    """
-    if widget is None or current_depth >= max_depth:
-        return None
+class _WidgetClassInfo:
+    """What one widget class supports, probed on its first instance"""
 
-    try:
-        # Get widget type
-        widget_type = widget.__class__.__name__
+    __slots__ = ("name", "text_source", "properties", "defaults")
 
-        # Get geometry (position and size)
-        geometry = _get_widget_geometry(widget)
+    def __init__(self, name: str, text_source: Optional[str], properties: Tuple[str, ...], defaults: Dict[str, str]):
+        self.name = name
+        self.text_source = text_source      # "cget", "textbox", "entry" or None
+        self.properties = properties        # EXPORT_CONFIG_PROPERTIES the class accepts
+        self.defaults = defaults            # property -> default value (str)
 
-        # Get text content if applicable
-        text_content = _get_widget_text(widget)
 
-        # Get configuration
-        config = _get_widget_config(widget)
+_widget_class_info: Dict[type, _WidgetClassInfo] = {}
 
-        # Build widget data
-        widget_data = {
-            "type": widget_type,
-            "geometry": geometry
-        }
 
-        if text_content:
-            widget_data["text"] = text_content
+def _theme_defaults(widget_class: type) -> Dict[str, str]:
+    """Theme defaults for a CustomTkinter class (nearest themed base class), else {}"""
+    # Only look at customtkinter if the app already loaded it - never import it here
+    ctk = sys.modules.get("customtkinter")
+    theme = getattr(getattr(ctk, "ThemeManager", None), "theme", None) or {}
+    for cls in widget_class.__mro__:
+        entry = theme.get(cls.__name__)
+        if isinstance(entry, dict):
+            defaults = {prop: str(entry[prop]) for prop in EXPORT_CONFIG_PROPERTIES if prop in entry}
+            defaults.setdefault("bg_color", "transparent")
+            return defaults
+    return {}
 
-        if config:
-            widget_data["config"] = config
 
-        # Get children recursively
-        children = _get_widget_children(widget, max_depth, current_depth + 1)
-        if children:
-            widget_data["children"] = children
+def _get_class_info(widget) -> _WidgetClassInfo:
+    """Memoized per-class support info (probing costs a few failed cgets, once per class)"""
+    widget_class = widget.__class__
+    info = _widget_class_info.get(widget_class)
+    if info is not None:
+        return info
 
-        return widget_data
+    properties = []
+    text_source = None
+    if hasattr(widget, 'cget'):
+        for prop in EXPORT_CONFIG_PROPERTIES:
+            try:
+                widget.cget(prop)
+                properties.append(prop)
+            except Exception:
+                pass
+        try:
+            widget.cget('text')
+            text_source = "cget"
+        except Exception:
+            pass
+    if text_source is None and hasattr(widget, 'get'):
+        # CTkTextbox uses get("1.0", "end-1c"), CTkEntry plain get()
+        text_source = "textbox" if hasattr(widget, 'insert') and hasattr(widget, 'see') else "entry"
 
-    except Exception as e:
-        # Return minimal data if export fails
-        return {
-            "type": "Unknown",
-            "error": str(e)
-        }
+    info = _WidgetClassInfo(widget_class.__name__, text_source, tuple(properties), _theme_defaults(widget_class))
+    _widget_class_info[widget_class] = info
+    return info
 
 
-def _get_widget_geometry(widget) -> Dict[str, Any]:
-    """Get widget position and size"""
-    try:
-        # Try to get actual rendered geometry
-        if widget.winfo_exists():
-            return {
-                "x": widget.winfo_x(),
-                "y": widget.winfo_y(),
-                "width": widget.winfo_width(),
-                "height": widget.winfo_height(),
-                "visible": widget.winfo_viewable()
-            }
-    except:
-        pass
+def _walk_widget_tree(widget, max_depth: Optional[int]) -> List[Tuple[Any, int]]:
+    """
+    Walk a widget tree once, without recursion
 
-    # Fallback to empty geometry
-    return {"x": 0, "y": 0, "width": 0, "height": 0, "visible": False}
+    Returns:
+        Pre-order list of (widget, depth) - the root has depth 0
+    """
+    nodes = []
+    stack = [(widget, 0)]
+    while stack:
+        current, depth = stack.pop()
+        nodes.append((current, depth))
+        if max_depth is not None and depth + 1 >= max_depth:
+            continue
+        try:
+            children = current.winfo_children()
+        except Exception:
+            continue
+        stack.extend((child, depth + 1) for child in reversed(children))
+    return nodes
 
 
-def _get_widget_text(widget) -> Optional[str]:
-    """Extract text content from widget if available"""
+def _batch_geometry(widgets: List[Any]) -> List[Dict[str, Any]]:
+    """Position, size and visibility of many widgets in a single Tcl call"""
+    if not widgets:
+        return []
     try:
-        # CTkLabel, CTkButton - use cget('text')
-        if hasattr(widget, 'cget'):
-            try:
-                text = widget.cget('text')
-                if text and isinstance(text, str) and len(text) > 0:
-                    # Truncate very long text
-                    return text[:500] if len(text) > 500 else text
-            except:
-                pass
+        tk_app = widgets[0].tk
+        rows = tk_app.splitlist(tk_app.call('apply', _GEOMETRY_SCRIPT, tuple(str(w) for w in widgets)))
+    except Exception:
+        return [dict(_EMPTY_GEOMETRY) for _ in widgets]
+
+    geometries = []
+    for row in rows:
+        values = tk_app.splitlist(row)
+        if len(values) == 5:
+            x, y, width, height, visible = (int(value) for value in values)
+            geometries.append({"x": x, "y": y, "width": width, "height": height, "visible": visible})
+        else:
+            geometries.append(dict(_EMPTY_GEOMETRY))
+    return geometries
 
-        # CTkTextbox, CTkEntry - use get()
-        if hasattr(widget, 'get'):
-            try:
-                if hasattr(widget, 'get'):
-                    # CTkTextbox uses get("1.0", "end")
-                    text = widget.get("1.0", "end-1c") if hasattr(widget, 'insert') else widget.get()
-                    if text and isinstance(text, str) and len(text.strip()) > 0:
-                        return text[:500] if len(text) > 500 else text
-            except:
-                pass
 
+def _read_widget_text(widget, info: _WidgetClassInfo) -> Optional[str]:
+    """Text content of a widget (truncated), using the class's known text source"""
+    try:
+        if info.text_source == "cget":
+            text = widget.cget('text')
+        elif info.text_source == "textbox":
+            text = widget.get("1.0", "end-1c")
+        elif info.text_source == "entry":
+            text = widget.get()
+        else:
+            return None
     except Exception:
-        pass
+        return None
 
+    if isinstance(text, str) and text.strip():
+        return text[:EXPORT_TEXT_LIMIT]
     return None
 
 
-def _get_widget_config(widget) -> Dict[str, Any]:
-    """Get widget configuration (colors, fonts, etc.)"""
-    config = {}
-
+def _export_widget_node(widget, geometry: Dict[str, Any]) -> Dict[str, Any]:
+    """One widget's data (no children); config only lists non-default properties"""
     try:
-        # Common properties to extract
-        properties = ['fg_color', 'bg_color', 'text_color', 'border_color', 'border_width', 'corner_radius']
+        info = _get_class_info(widget)
+        widget_data = {"type": info.name, "geometry": geometry}
 
-        for prop in properties:
-            if hasattr(widget, 'cget'):
-                try:
-                    value = widget.cget(prop)
-                    if value is not None:
-                        config[prop] = str(value)
-                except:
-                    pass
+        text = _read_widget_text(widget, info)
+        if text:
+            widget_data["text"] = text
 
-    except Exception:
-        pass
-
-    return config if config else None
+        config = {}
+        for prop in info.properties:
+            try:
+                value = widget.cget(prop)
+            except Exception:
+                continue
+            if value is None:
+                continue
+            value = str(value)
+            if info.defaults.get(prop) != value:
+                config[prop] = value
+        if config:
+            widget_data["config"] = config
 
+        return widget_data
 
-def _get_widget_children(widget, max_depth: int, current_depth: int) -> Optional[List[Dict]]:
-    """Get all child widgets recursively"""
-    children = []
+    except Exception as e:
+        # Return minimal data if export fails
+        return {
+            "type": "Unknown",
+            "error": str(e)
+        }
 
-    try:
-        # Get widget children
-        if hasattr(widget, 'winfo_children'):
-            child_widgets = widget.winfo_children()
 
-            for child in child_widgets:
-                try:
-                    child_data = export_widget_tree(child, max_depth, current_depth)
-                    if child_data:
-                        children.append(child_data)
-                except:
-                    continue
+def _summarize_nodes(nodes: List[Tuple[Any, int]], summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill a get_widget_summary()-style dict from walked nodes"""
+    counts = {}
+    max_depth = 0
+    for widget, depth in nodes:
+        name = widget.__class__.__name__
+        counts[name] = counts.get(name, 0) + 1
+        max_depth = max(max_depth, depth)
+    summary.update({"total_widgets": len(nodes), "max_depth": max_depth, "widget_counts": counts})
+    return summary
 
-    except Exception:
-        pass
 
-    return children if children else None
+def export_widget_tree(widget, max_depth: int = 10, current_depth: int = 0,
+                       summary: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
+    """
+    Export widget tree to JSON-serializable dict
 
+    Args:
+        widget: Root widget to export (CTkFrame, CTkLabel, etc.)
+        max_depth: Maximum tree depth
+        current_depth: Depth of `widget` itself (counts against max_depth)
+        summary: Optional dict filled with get_widget_summary() counts for the
+            exported widgets, from the same walk
 
-def get_widget_summary(widget) -> Dict[str, Any]:
+    Returns:
+        Dict with widget structure and properties. "config" only holds properties
+        that differ from the widget class's theme default.
     """
-    Get a lightweight summary of widget tree (for quick diagnostics)
+    if widget is None or current_depth >= max_depth:
+        return None
+
+    nodes = _walk_widget_tree(widget, max_depth - current_depth)
+    geometries = _batch_geometry([node for node, _ in nodes])
+    if summary is not None:
+        _summarize_nodes(nodes, summary)
+
+    root_data = None
+    path: List[Dict] = []   # path[d] = dict of the current ancestor at depth d
+    for (node, depth), geometry in zip(nodes, geometries):
+        widget_data = _export_widget_node(node, geometry)
+        del path[depth:]
+        if path:
+            path[-1].setdefault("children", []).append(widget_data)
+        else:
+            root_data = widget_data
+        path.append(widget_data)
+
+    return root_data
 
-    Returns counts of widget types and total depth
+
+def write_widget_tree(widget, writer, max_depth: int = 10) -> Dict[str, Any]:
     """
-    summary = {
-        "total_widgets": 0,
-        "max_depth": 0,
-        "widget_counts": {}
-    }
+    Stream the export_widget_tree() JSON for a widget tree to a writer
+
+    Each widget is serialized and written as soon as it is read, so the full tree
+    never has to exist as one dict (or one string).
+
+    Args:
+        widget: Root widget to export
+        writer: File-like object with write(str), or a callable taking str
+        max_depth: Maximum tree depth
 
-    def count_widgets(w, depth=0):
-        if w is None:
-            return
+    Returns:
+        get_widget_summary()-style counts for the written widgets
+    """
+    write = writer.write if hasattr(writer, 'write') else writer
+    if widget is None or max_depth <= 0:
+        write("null")
+        return {"total_widgets": 0, "max_depth": 0, "widget_counts": {}}
+
+    nodes = _walk_widget_tree(widget, max_depth)
+    geometries = _batch_geometry([node for node, _ in nodes])
+
+    open_depths: List[int] = []   # depths whose "children" array is still open
+    need_comma = False
+    for index, ((node, depth), geometry) in enumerate(zip(nodes, geometries)):
+        while open_depths and open_depths[-1] >= depth:
+            write("]}")
+            open_depths.pop()
+            need_comma = True
+        if need_comma:
+            write(",")
+
+        body = json.dumps(_export_widget_node(node, geometry), ensure_ascii=False, separators=(',', ':'))
+        if index + 1 < len(nodes) and nodes[index + 1][1] > depth:
+            write(body[:-1] + ',"children":[')
+            open_depths.append(depth)
+            need_comma = False
+        else:
+            write(body)
+            need_comma = True
 
-        summary["total_widgets"] += 1
-        summary["max_depth"] = max(summary["max_depth"], depth)
+    write("]}" * len(open_depths))
+    return _summarize_nodes(nodes, {})
 
-        widget_type = w.__class__.__name__
-        summary["widget_counts"][widget_type] = summary["widget_counts"].get(widget_type, 0) + 1
 
-        try:
-            if hasattr(w, 'winfo_children'):
-                for child in w.winfo_children():
-                    count_widgets(child, depth + 1)
-        except:
-            pass
+def get_widget_summary(widget) -> Dict[str, Any]:
+    """
+    Get a lightweight summary of widget tree (for quick diagnostics)
 
-    count_widgets(widget)
-    return summary
+    Returns counts of widget types and total depth. To get these alongside a full
+    export, pass summary={} to export_widget_tree instead of walking twice.
+    """
+    if widget is None:
+        return {"total_widgets": 0, "max_depth": 0, "widget_counts": {}}
+    return _summarize_nodes(_walk_widget_tree(widget, None), {})
 
 
 def export_answers_html(widget) -> str:
@@ -1059,6 +1169,7 @@ __all__ = [
 
     # UI Export
     'export_widget_tree',
+    'write_widget_tree',
     'get_widget_summary',
     'export_answers_html',
 ]
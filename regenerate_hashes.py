@@ -2,17 +2,17 @@
 """Regenerate file hashes for version.json"""
 
 import json
-import hashlib
+import os
+import time
 from pathlib import Path
 
+from lib.manifest import FileHashManifest, compute_sha256, compute_directory_hashes
+from lib.updater import write_version_pointer
+
 
 def calculate_sha256(file_path: Path) -> str:
     """Calculate SHA256 hash of a file"""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+    return compute_sha256(file_path)
 
 
 def get_all_files(root_dir: Path) -> list:
@@ -20,36 +20,35 @@ def get_all_files(root_dir: Path) -> list:
     exclude_dirs = {
         '__pycache__', '.git', 'venv', 'ENV', 'env',
         '.hwhelper', 'node_modules', 'build', 'dist',
-        'screenshots', 'saved_screenshots', '.update_backup',
+        'screenshots', 'saved_screenshots', '.update_backup', '.update_staging', 'deltas',
         'downloads', 'eggs', '.eggs'
     }
 
     exclude_patterns = {
         '.pyc', '.pyo', '.pyd', '.so', '.egg-info',
-        '.DS_Store', 'Thumbs.db', '.swp', '.swo'
+        '.DS_Store', 'Thumbs.db', '.swp', '.swo',
+        'latest.json'  # Version pointer records version.json's hash (would be circular)
     }
 
     files = []
-    for file_path in root_dir.rglob('*'):
-        # Skip if in excluded directory
-        if any(excluded in file_path.parts for excluded in exclude_dirs):
-            continue
-
-        # Skip if excluded pattern
-        if any(file_path.name.endswith(pattern) for pattern in exclude_patterns):
-            continue
+    for dir_path, dir_names, file_names in os.walk(root_dir):
+        # Prune excluded directories so they are never descended into
+        dir_names[:] = [
+            name for name in dir_names
+            if name not in exclude_dirs and not any(name.endswith(pattern) for pattern in exclude_patterns)
+        ]
 
-        # Skip directories
-        if file_path.is_dir():
-            continue
+        for name in file_names:
+            # Skip if excluded pattern
+            if any(name.endswith(pattern) for pattern in exclude_patterns):
+                continue
 
-        # Get relative path
-        rel_path = file_path.relative_to(root_dir)
+            file_path = Path(dir_path) / name
 
-        # Convert to forward slashes for consistency
-        rel_path_str = str(rel_path).replace('\\', '/')
+            # Get relative path, with forward slashes for consistency
+            rel_path_str = file_path.relative_to(root_dir).as_posix()
 
-        files.append((rel_path_str, file_path))
+            files.append((rel_path_str, file_path))
 
     return sorted(files)
 
@@ -62,15 +61,28 @@ def main():
     files = get_all_files(root_dir)
 
     print(f"📝 Calculating hashes for {len(files)} files...")
-    file_hashes = {}
+    started = time.perf_counter()
+
+    # Shared with the updater: unchanged files (same size + mtime) aren't rehashed,
+    # changed ones are hashed across a process pool
+    manifest = FileHashManifest(root_dir)
+    hashes, errors = manifest.get_hashes(rel_path for rel_path, _ in files)
 
-    for rel_path, full_path in files:
-        try:
-            file_hash = calculate_sha256(full_path)
-            file_hashes[rel_path] = file_hash
+    file_hashes = {}
+    for rel_path, _ in files:
+        if rel_path in hashes:
+            file_hashes[rel_path] = hashes[rel_path]
             print(f"  ✓ {rel_path}")
-        except Exception as e:
-            print(f"  ✗ {rel_path}: {e}")
+        else:
+            print(f"  ✗ {rel_path}: {errors.get(rel_path)}")
+
+    manifest.prune(file_hashes)
+    manifest.save()
+    print(f"   ({manifest.hits} unchanged from manifest, {manifest.misses} rehashed "
+          f"in {(time.perf_counter() - started) * 1000:.0f} ms)")
+
+    # Rollups let clients skip directories that are identical to their installed release
+    directory_hashes = compute_directory_hashes(file_hashes)
 
     # Load existing version.json
     print("\n📖 Loading version.json...")
@@ -79,14 +91,19 @@ def main():
 
     # Update file_hashes
     version_data['file_hashes'] = file_hashes
+    version_data['directory_hashes'] = directory_hashes
 
     # Save updated version.json
     print("💾 Saving updated version.json...")
     with open(version_file, 'w', encoding='utf-8') as f:
         json.dump(version_data, f, indent=2, ensure_ascii=False)
 
+    # Pointer clients check on launch (must follow every version.json write)
+    pointer = write_version_pointer(root_dir)
+    print(f"📌 Wrote latest.json (v{pointer['version']})")
+
     print(f"\n✅ Regenerated hashes for {len(file_hashes)} files")
-    print(f"📊 Total files: {len(file_hashes)}")
+    print(f"📊 Total files: {len(file_hashes)} in {len(directory_hashes)} directories")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,12 @@
+"""
+HW Helper Test Configuration
+============================
+Makes the repository root importable (lib.*) however pytest is invoked.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
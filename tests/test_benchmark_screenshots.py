@@ -0,0 +1,46 @@
+"""
+Image Pipeline Benchmark Tests
+==============================
+The regression check of benchmark_screenshots.py as a test. It compares with the
+saved baseline only on the machine that recorded it (save one with
+`python benchmark_screenshots.py --save-baseline`); otherwise it is skipped.
+Only wall time is checked here: the spawned step processes import pytest, so their
+peak RSS is not comparable with a baseline from the CLI (which checks both).
+"""
+
+from pathlib import Path
+
+import pytest
+
+import benchmark_screenshots as bench
+
+
+def test_compare_with_baseline_flags_regressions():
+    baseline = {"steps": {"display": {"median_ms": 100.0, "peak_rss_kb": 1000},
+                          "crop": {"median_ms": 50.0, "peak_rss_kb": 1000}}}
+    results = {"display": {"median_ms": 125.0, "peak_rss_kb": 1000},
+               "crop": {"median_ms": 55.0, "peak_rss_kb": 1200},
+               "ocr": {"step": "ocr", "skipped": "missing dependency"}}
+    regressions = bench.compare_with_baseline(results, baseline, 0.20, 0.15)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("display: median") and regressions[1].startswith("crop: peak RSS")
+    assert bench.compare_with_baseline(results, baseline, 0.20, None) == regressions[:1]
+
+
+@pytest.mark.parametrize("step", bench.PIL_STEPS)
+def test_pil_steps_run_the_app_functions(step):
+    paths = [Path(p) for p in bench.corpus_paths()[:2]]
+    samples = bench.STEP_FUNCTIONS[step](paths, 1)
+    assert len(samples) == 1 and samples[0] > 0
+
+
+def test_no_regression_against_baseline():
+    baseline = bench.load_baseline(bench.BASELINE_FILE)
+    if not baseline:
+        pytest.skip(f"no baseline at {bench.BASELINE_FILE}")
+    if baseline.get("machine") != bench._machine_info():
+        pytest.skip("baseline was recorded on a different machine/interpreter")
+    steps = [step for step in bench.PIL_STEPS if step in baseline.get("steps", {})]
+    results = bench.run_benchmark(steps, bench.corpus_paths())
+    regressions = bench.compare_with_baseline(results, baseline, bench.DEFAULT_MAX_TIME_REGRESSION, None)
+    assert not regressions, "\n".join(regressions)
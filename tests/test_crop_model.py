@@ -0,0 +1,62 @@
+"""
+Crop Model Tests
+================
+"""
+
+import base64
+
+from PIL import Image
+
+from lib.crop_model import CropStack, cleanup_crop_files, encode_image_base64
+
+
+def make_stack(tmp_path):
+    path = tmp_path / "capture.png"
+    Image.new("RGB", (400, 200), "white").save(path)
+    return CropStack(Image.open(path), str(path))
+
+
+def test_push_selection_maps_display_to_original(tmp_path):
+    stack = make_stack(tmp_path)
+    assert stack.push_selection((10, 10, 110, 60), display_size=(200, 100)) == (20, 20, 220, 120)
+    assert stack.view().size == (200, 100)
+
+
+def test_push_is_clamped_and_rejects_tiny_crops(tmp_path):
+    stack = make_stack(tmp_path)
+    stack.push((100, 50, 300, 150))
+    assert stack.push((0, 0, 1000, 1000)) is None          # Clamps to the current crop
+    assert stack.push((100, 50, 101, 51)) is None          # Below MIN_CROP_SIZE
+    assert stack.push((150, 60, 1000, 1000)) == (150, 60, 300, 150)
+
+
+def test_undo_redo(tmp_path):
+    stack = make_stack(tmp_path)
+    stack.push((0, 0, 200, 100))
+    assert stack.undo() and not stack.cropped and stack.view() is stack.original
+    assert stack.redo() and stack.rect == (0, 0, 200, 100)
+    stack.undo()
+    stack.push((10, 10, 50, 50))
+    assert not stack.can_redo()
+
+
+def test_materialize_encodes_once_per_rect(tmp_path):
+    stack = make_stack(tmp_path)
+    assert stack.materialize(directory=tmp_path) == stack.source_path   # Uncropped: the source file
+    stack.push((0, 0, 200, 100))
+    path = stack.materialize(directory=tmp_path / "crops")
+    assert stack.materialize(directory=tmp_path / "crops") == path
+    assert Image.open(path).size == (200, 100)
+    assert stack.materialized_path() == path
+
+
+def test_encode_image_base64_round_trips(tmp_path):
+    stack = make_stack(tmp_path)
+    with open(stack.source_path, "rb") as f:
+        assert base64.b64decode(encode_image_base64(stack.source_path)) == f.read()
+
+
+def test_cleanup_removes_old_files(tmp_path):
+    (tmp_path / "old.png").write_bytes(b"x")
+    assert cleanup_crop_files(tmp_path, max_age=-1) == 1
+    assert cleanup_crop_files(tmp_path / "missing") == 0
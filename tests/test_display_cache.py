@@ -0,0 +1,85 @@
+"""
+Display Image Cache Tests
+=========================
+Pure PIL - no Tk needed (the display object is the resized image itself).
+"""
+
+import gc
+import threading
+
+from PIL import Image
+
+from lib.display_cache import DisplayImageCache, fast_downscale
+
+
+def make_cache(max_bytes=64 * 1024 * 1024):
+    return DisplayImageCache(lambda img: img, max_bytes=max_bytes)
+
+
+def run_with_timeout(func, timeout=5.0):
+    """Run func on a daemon thread; False if it did not return in time (deadlock)"""
+    thread = threading.Thread(target=func, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+def test_fast_downscale_hits_target_size():
+    image = Image.new("RGB", (3840, 2160), "white")
+    assert fast_downscale(image, (800, 450)).size == (800, 450)
+    assert fast_downscale(Image.new("P", (1000, 1000)), (300, 200)).size == (300, 200)
+
+
+def test_hit_after_miss():
+    cache = make_cache()
+    image = Image.new("RGB", (1600, 900))
+    first, refined = cache.get(image, (800, 450), "Dark")
+    second, _ = cache.get(image, (800, 450), "Dark")
+    assert first is second and not refined
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_exact_size_entry_is_a_copy():
+    cache = make_cache()
+    image = Image.new("RGB", (800, 450))
+    display, refined = cache.get(image, (800, 450), "Dark")
+    assert refined and display is not image
+
+
+def test_entries_dropped_when_image_collected():
+    cache = make_cache()
+    image = Image.new("RGB", (1600, 900))
+    cache.get(image, (800, 450), "Dark")
+    del image
+    gc.collect()
+    assert cache.stats()["entries"] == 0 and cache.stats()["bytes"] == 0
+
+
+def test_clear_with_exact_size_entry_does_not_deadlock():
+    cache = make_cache()
+    image = Image.new("RGB", (800, 450))
+    cache.get(image, (800, 450), "Dark")
+    del image
+    assert run_with_timeout(cache.clear)
+
+
+def test_eviction_of_last_reference_does_not_deadlock():
+    cache = make_cache(max_bytes=800 * 450 * 3)
+
+    def fill():
+        for _ in range(3):
+            cache.get(Image.new("RGB", (800, 450)), (800, 450), "Dark")
+            gc.collect()
+
+    assert run_with_timeout(fill)
+    assert cache.stats()["entries"] <= 1
+
+
+def test_put_refined_replaces_fast_entry():
+    cache = make_cache()
+    image = Image.new("RGB", (1600, 900))
+    cache.get(image, (800, 450), "Dark")
+    sharp = cache.render_refined(image, (800, 450))
+    assert cache.put_refined(image, (800, 450), "Dark", sharp) is sharp
+    display, refined = cache.get(image, (800, 450), "Dark")
+    assert display is sharp and refined
@@ -6,78 +6,98 @@ import os
 import glob
 import time
 import json
+import copy # Report state snapshots
 import traceback
 import tkinter
 import re # Import regular expressions for parsing placeholders
 import random # Added for replacing "None"
 import subprocess # For launching Brave browser
 import platform # For OS detection
+import atexit # Final metrics flush
 from pathlib import Path # For icon directory path resolution
 from tkinter import filedialog # For file selection dialog
 from typing import Dict, List, Optional, Tuple, Union # Type hints for progressive parser
 
+# --- Deferred Imports ---
+# v1.0.69: Heavy modules are bound to lazy proxies and only imported on first use,
+# so the main window paints before requests/numpy/selenium/renderers are loaded.
+# Availability flags are computed with find_spec (no import) to keep the same fallbacks.
+from lib.answer_history import AnswerHistory
+from lib.answer_store import get_answer_store, image_fingerprint
+from lib.display_cache import DisplayImageCache, draft_for_display
+from lib.crop_model import CropStack, cleanup_crop_files, encode_image_base64
+from lib.lazy import lazy_import, module_available
+from lib.metrics import get_metrics
+from lib.render_model import AnswerRenderModel, render_model_html
+from lib.scheduler import StartupScheduler
+
 # --- OpenRouter API Integration ---
-import requests
-import base64
+requests = lazy_import("requests")
 from datetime import datetime
 
 # --- Enhanced Visual Display ---
-try:
-    from lib.edmentum import EnhancedAnswerPresenter, DragToImageRenderer
-    from lib.utils import VisualElementDetector
-    VISUAL_ENHANCEMENT_AVAILABLE = True
-except ImportError as e:
-    print(f"Note: Visual enhancement modules not available: {e}")
-    VISUAL_ENHANCEMENT_AVAILABLE = False
+VISUAL_ENHANCEMENT_AVAILABLE = module_available("lib.edmentum") and module_available("lib.utils", requires=["numpy"])
+if VISUAL_ENHANCEMENT_AVAILABLE:
+    EnhancedAnswerPresenter = lazy_import("lib.edmentum", "EnhancedAnswerPresenter")
+    DragToImageRenderer = lazy_import("lib.edmentum", "DragToImageRenderer")
+    VisualElementDetector = lazy_import("lib.utils", "VisualElementDetector")
+else:
+    print("Note: Visual enhancement modules not available")
 
 # --- Progressive JSON Parser ---
-try:
-    from lib.utils import ProgressiveJSONParser
-    PROGRESSIVE_PARSER_AVAILABLE = True
-except ImportError as e:
-    print(f"Note: Progressive parser not available: {e}")
-    PROGRESSIVE_PARSER_AVAILABLE = False
+PROGRESSIVE_PARSER_AVAILABLE = module_available("lib.utils")
+if PROGRESSIVE_PARSER_AVAILABLE:
+    ProgressiveJSONParser = lazy_import("lib.utils", "ProgressiveJSONParser")
+else:
+    print("Note: Progressive parser not available")
 
 # --- Edmentum Question Renderer ---
-try:
-    from lib.edmentum import (
-        EdmentumQuestionRenderer,
-        EdmentumMultipleChoice,
-        EdmentumMatchedPairs,
-        EdmentumFillBlank,      # v1.0.61: Added missing component
-        EdmentumHotSpot,        # v1.0.61: Added missing component
-        EdmentumHotText,
-        EdmentumOrdering
-    )
-    EDMENTUM_RENDERER_AVAILABLE = True
-except ImportError as e:
-    print(f"Note: Edmentum renderer not available: {e}")
-    EDMENTUM_RENDERER_AVAILABLE = False
+EDMENTUM_RENDERER_AVAILABLE = module_available("lib.edmentum")
+if EDMENTUM_RENDERER_AVAILABLE:
+    EdmentumQuestionRenderer = lazy_import("lib.edmentum", "EdmentumQuestionRenderer")
+    EdmentumMultipleChoice = lazy_import("lib.edmentum", "EdmentumMultipleChoice")
+    EdmentumMatchedPairs = lazy_import("lib.edmentum", "EdmentumMatchedPairs")
+    EdmentumFillBlank = lazy_import("lib.edmentum", "EdmentumFillBlank")      # v1.0.61: Added missing component
+    EdmentumHotSpot = lazy_import("lib.edmentum", "EdmentumHotSpot")          # v1.0.61: Added missing component
+    EdmentumHotText = lazy_import("lib.edmentum", "EdmentumHotText")
+    EdmentumOrdering = lazy_import("lib.edmentum", "EdmentumOrdering")
+else:
+    print("Note: Edmentum renderer not available")
 
 # --- Response Validator ---
-try:
-    from lib.utils import validate_response
-    RESPONSE_VALIDATOR_AVAILABLE = True
-except ImportError as e:
-    print(f"Note: Response validator not available: {e}")
-    RESPONSE_VALIDATOR_AVAILABLE = False
+RESPONSE_VALIDATOR_AVAILABLE = module_available("lib.utils")
+if RESPONSE_VALIDATOR_AVAILABLE:
+    validate_response = lazy_import("lib.utils", "validate_response")
+else:
+    print("Note: Response validator not available")
 
 # --- Auto Updater ---
 try:
-    from lib.updater import check_for_updates_silent, apply_update_silent
+    from lib.updater import stage_update_silent
     AUTO_UPDATER_AVAILABLE = True
 except ImportError as e:
     print(f"Note: Auto updater not available: {e}")
     AUTO_UPDATER_AVAILABLE = False
 
 # --- slckr API Client ---
-try:
-    from lib.api import SlckrAPIClient
-    from lib.utils import export_widget_tree, get_widget_summary, export_answers_html
-    API_CLIENT_AVAILABLE = True
-except ImportError as e:
-    print(f"Note: API client not available: {e}")
-    API_CLIENT_AVAILABLE = False
+# v1.0.69: Error reports use the render model (lib.render_model), not the lib.utils widget export -
+# the live widget tree is only walked for on-demand reports (Ctrl+Shift+E)
+WIDGET_TREE_EXPORT_AVAILABLE = module_available("lib.utils")
+if WIDGET_TREE_EXPORT_AVAILABLE:
+    export_widget_tree = lazy_import("lib.utils", "export_widget_tree")
+LIVE_WIDGET_TREE_MAX_DEPTH = 12
+
+API_CLIENT_AVAILABLE = module_available("lib.api", requires=["requests"])
+if API_CLIENT_AVAILABLE:
+    SlckrAPIClient = lazy_import("lib.api", "SlckrAPIClient")
+else:
+    print("Note: API client not available")
+
+# v1.0.69: Aggregated performance histograms (lib.metrics) are queued this often
+METRICS_FLUSH_INTERVAL_MS = 10 * 60 * 1000
+HISTORY_THUMBNAIL_SIZE = (1280, 960)  # Screenshots kept in the answer history are downscaled to this
+SCREENSHOT_REFINE_DELAY_MS = 150  # Idle time before the LANCZOS pass replaces the fast downscale
+SCREENSHOT_RESIZE_DEBOUNCE_MS = 120  # Refit the screenshot once the window stops resizing
 
 # --- Error Reporting Configuration ---
 # Error reporting endpoint loaded from config.json
@@ -155,15 +175,15 @@ def get_edmentum_color(key: str, dark_mode: bool = False) -> str:
 
 
 # --- Selenium Script Import ---
-try:
-    from lib.capture import run_brave_screenshot_task
-    SELENIUM_SCRIPT_AVAILABLE = True
-except ImportError as e:
+# v1.0.69: selenium is imported on the first capture, not at startup
+SELENIUM_SCRIPT_AVAILABLE = module_available("lib.capture", requires=["selenium"])
+if SELENIUM_SCRIPT_AVAILABLE:
+    run_brave_screenshot_task = lazy_import("lib.capture", "run_brave_screenshot_task")
+else:
     print("***********************************************************************************")
-    print(f"WARNING: Could not import screenshot capture module: {e}")
+    print("WARNING: Could not import screenshot capture module: selenium is not installed")
     print("The application will run in STUB mode for screenshot capture.")
     print("***********************************************************************************")
-    SELENIUM_SCRIPT_AVAILABLE = False
     def run_brave_screenshot_task_stub():
         print("Starting STUBBED screenshot task...")
         time.sleep(0.5)
@@ -286,65 +306,99 @@ class ErrorReporter:
     """Collects and packages error information for debugging"""
 
     @staticmethod
-    def create_report(app_instance) -> dict:
-        """Generate comprehensive error report"""
+    def snapshot_state(app_instance, include_widget_tree: bool = False) -> dict:
+        """
+        Copy everything a report needs from the app (Tk thread)
+
+        v1.0.69: No widget tree walks - the answer display comes from the render
+        model, so this is a handful of small copies. Serialize the result with
+        build_report() on any thread.
+
+        Args:
+            include_widget_tree: Also export the live answer widget tree (slow on
+                large answers - only for reports the user asks for explicitly)
+        """
+        live_widget_tree = None
+        answer_frame = getattr(app_instance, 'answer_scroll_frame', None)
+        if include_widget_tree and WIDGET_TREE_EXPORT_AVAILABLE and answer_frame is not None:
+            try:
+                summary = {}
+                tree = export_widget_tree(answer_frame, max_depth=LIVE_WIDGET_TREE_MAX_DEPTH, summary=summary)
+                live_widget_tree = {"tree": tree, "summary": summary}
+            except Exception as e:
+                live_widget_tree = {"error": f"Widget tree export failed: {e}"}
+
+        last_ai_response = getattr(app_instance, 'last_ai_response', None)
+        last_exception = getattr(app_instance, 'last_exception', None)
+        component = getattr(app_instance, 'edmentum_component', None)
+        activity_entries = app_instance.activity_log.log_entries[-200:] if hasattr(app_instance, 'activity_log') else []
+
+        return {
+            "last_exception": str(last_exception) if last_exception else None,
+            # Formatted stack - the server groups reports by its innermost frames
+            "traceback": "".join(traceback.format_exception(type(last_exception), last_exception, last_exception.__traceback__)) if last_exception else None,
+            "activity_entries": list(activity_entries),
+            "render_model": app_instance.render_model.snapshot() if hasattr(app_instance, 'render_model') else None,
+            "model": app_instance.selected_model_var.get() if hasattr(app_instance, 'selected_model_var') else None,
+            "answer_text": app_instance.answer_textbox.get("1.0", "end")[:5000] if hasattr(app_instance, 'answer_textbox') else "",
+            "response_metadata": copy.deepcopy(last_ai_response),
+            "identified_question": getattr(app_instance, 'identified_question', None),
+            "answer_structure": copy.deepcopy(getattr(app_instance, 'answer_structure', None)),
+            "answer_index_map": dict(getattr(app_instance, 'answer_index_map', None) or {}),
+            "rendering_strategy": getattr(app_instance, 'rendering_strategy', None),
+            "edmentum_component_type": type(component).__name__ if component else None,
+            "console_buffer": list(getattr(app_instance, 'console_buffer', [])[-50:]),
+            "version": getattr(app_instance, 'current_version', 'Unknown'),
+            "screenshot_path": str(app_instance.current_image_path) if getattr(app_instance, 'current_image_path', None) else None,
+            "live_widget_tree": live_widget_tree,
+        }
+
+    @staticmethod
+    def build_report(state: dict) -> dict:
+        """Generate comprehensive error report from a snapshot_state() copy (safe off the Tk thread)"""
         import platform
 
         # Extract error message from last exception or activity log
         error_message = "Unknown error"
-        if hasattr(app_instance, 'last_exception') and app_instance.last_exception:
-            error_message = str(app_instance.last_exception)
-        elif hasattr(app_instance, 'activity_log') and app_instance.activity_log.log_entries:
+        if state.get("last_exception"):
+            error_message = state["last_exception"]
+        else:
             # Get last error from activity log
-            for entry in reversed(app_instance.activity_log.log_entries):
+            for entry in reversed(state.get("activity_entries", [])):
                 if '❌' in entry or '🚨' in entry or 'ERROR' in entry.upper():
                     error_message = entry[:200]
                     break
 
-        # Export widget tree from answer display
-        widget_tree_json = None
-        if API_CLIENT_AVAILABLE and hasattr(app_instance, 'answer_scroll_frame'):
-            try:
-                widget_tree_json = export_widget_tree(app_instance.answer_scroll_frame, max_depth=8)
-            except Exception as e:
-                widget_tree_json = {"error": f"Widget export failed: {e}"}
+        # Answer display structure, recorded while it was rendered
+        render_model = state.get("render_model")
+        widget_tree_json = render_model
+        if state.get("live_widget_tree"):
+            # On-demand dump of the real widgets, next to the render model it should match
+            widget_tree_json = dict(render_model or {}, live_widget_tree=state["live_widget_tree"])
 
         # Capture last AI response metadata
         ai_response_json = None
         try:
-            # Export answer display as HTML for report page
-            # Priority 1: Export progressive_answers_container (has streaming answers with green highlights)
-            progressive_html = ""
-            if hasattr(app_instance, 'progressive_answers_container') and \
-               app_instance.progressive_answers_container is not None and \
-               app_instance.progressive_answers_container.winfo_exists():
-                try:
-                    progressive_html = export_answers_html(app_instance.progressive_answers_container)
-                except Exception as prog_err:
-                    progressive_html = f"<div class='error'>Progressive HTML export failed: {prog_err}</div>"
-
-            # Fallback: Export full answer_scroll_frame
-            answer_html = ""
-            if hasattr(app_instance, 'answer_scroll_frame'):
-                try:
-                    answer_html = export_answers_html(app_instance.answer_scroll_frame)
-                except Exception as html_err:
-                    answer_html = f"<div class='error'>HTML export failed: {html_err}</div>"
+            response_metadata = state.get("response_metadata")
+            if render_model and render_model.get("component") is None:
+                render_model["component"] = state.get("edmentum_component_type")
 
             ai_response_json = {
-                "model": app_instance.selected_model_var.get() if hasattr(app_instance, 'selected_model_var') else None,
-                "progressive_answers_html": progressive_html,  # NEW: Streaming answers with green highlights
-                "answer_html": answer_html,  # Full answer display (fallback)
-                "answer_text": app_instance.answer_textbox.get("1.0", "end")[:5000] if hasattr(app_instance, 'answer_textbox') else "",
-                "response_metadata": getattr(app_instance, 'last_ai_response', None),
+                "model": state.get("model"),
+                # Answer display as HTML, rendered from the render model (one rendering -
+                # answer_html is kept empty for report page compatibility)
+                "progressive_answers_html": render_model_html(render_model) if render_model else "",
+                "answer_html": "",
+                "answer_text": state.get("answer_text", ""),
+                "response_metadata": response_metadata,
                 # v1.0.67: NEW - Critical debugging data for fill-in-the-blank issues
-                "identified_question": getattr(app_instance, 'identified_question', None),  # Shows if {{placeholders}} present
-                "answers_array": getattr(app_instance, 'last_ai_response', {}).get('answers') if hasattr(app_instance, 'last_ai_response') else None,  # All answer objects with IDs
-                "answer_structure": getattr(app_instance, 'answer_structure', None),  # Metadata about expected answers
-                "answer_index_map": getattr(app_instance, 'answer_index_map', None),  # Shows ID → index mapping
-                "rendering_strategy": getattr(app_instance, 'rendering_strategy', None),  # Which renderer was used
-                "edmentum_component_type": type(app_instance.edmentum_component).__name__ if hasattr(app_instance, 'edmentum_component') and app_instance.edmentum_component else None,
-                "console_buffer": getattr(app_instance, 'console_buffer', [])[-50:]  # Last 50 console log lines
+                "identified_question": state.get("identified_question"),  # Shows if {{placeholders}} present
+                "answers_array": response_metadata.get('answers') if isinstance(response_metadata, dict) else None,  # All answer objects with IDs
+                "answer_structure": state.get("answer_structure"),  # Metadata about expected answers
+                "answer_index_map": state.get("answer_index_map"),  # Shows ID → index mapping
+                "rendering_strategy": state.get("rendering_strategy"),  # Which renderer was used
+                "edmentum_component_type": state.get("edmentum_component_type"),
+                "console_buffer": state.get("console_buffer", [])  # Last 50 console log lines
             }
         except Exception as e:
             ai_response_json = {"error": f"AI response capture failed: {e}"}
@@ -360,14 +414,20 @@ class ErrorReporter:
 
         return {
             "error_message": error_message,
-            "version": getattr(app_instance, 'current_version', 'Unknown'),
+            "version": state.get("version", "Unknown"),
             "widget_tree_json": widget_tree_json,
             "ai_response_json": ai_response_json,
             "system_info_json": system_info_json,
-            "activity_log": app_instance.activity_log.log_entries[-50:] if hasattr(app_instance, 'activity_log') else [],
-            "screenshot_path": str(app_instance.current_image_path) if hasattr(app_instance, 'current_image_path') and app_instance.current_image_path else None
+            "activity_log": state.get("activity_entries", [])[-50:],
+            "screenshot_path": state.get("screenshot_path"),
+            "traceback": state.get("traceback")
         }
 
+    @staticmethod
+    def create_report(app_instance) -> dict:
+        """Generate comprehensive error report (snapshot + build in one call, on the Tk thread)"""
+        return ErrorReporter.build_report(ErrorReporter.snapshot_state(app_instance))
+
     @staticmethod
     def save_report(report_data: dict, output_dir: str = ".") -> str:
         """Save report to JSON file"""
@@ -378,41 +438,45 @@ class ErrorReporter:
         return filepath
 
     @staticmethod
-    def capture_widget_screenshot(widget, output_path: str = None) -> Optional[str]:
+    def widget_bbox(widget) -> Optional[Tuple[int, int, int, int]]:
         """
-        Capture a screenshot of a CustomTkinter widget and save as PNG
-
-        Args:
-            widget: The CustomTkinter widget to capture
-            output_path: Optional path to save screenshot. If None, generates temp path.
+        Screen bounding box of a widget (Tk thread)
 
         Returns:
-            Path to saved screenshot, or None if capture failed
+            (x1, y1, x2, y2), or None if the widget is missing or not laid out
         """
         if not widget or not widget.winfo_exists():
             print("⚠️ Widget screenshot: Widget doesn't exist")
             return None
 
-        try:
-            # Import PIL ImageGrab
-            from PIL import ImageGrab
+        # Ensure widget is rendered and updated
+        widget.update_idletasks()
 
-            # Ensure widget is rendered and updated
-            widget.update_idletasks()
+        # Get widget absolute position and size
+        x = widget.winfo_rootx()
+        y = widget.winfo_rooty()
+        width = widget.winfo_width()
+        height = widget.winfo_height()
 
-            # Get widget absolute position and size
-            x = widget.winfo_rootx()
-            y = widget.winfo_rooty()
-            width = widget.winfo_width()
-            height = widget.winfo_height()
+        # Validate dimensions
+        if width <= 0 or height <= 0:
+            print(f"⚠️ Widget screenshot: Invalid dimensions ({width}x{height})")
+            return None
+        return (x, y, x + width, y + height)
 
-            # Validate dimensions
-            if width <= 0 or height <= 0:
-                print(f"⚠️ Widget screenshot: Invalid dimensions ({width}x{height})")
-                return None
+    @staticmethod
+    def grab_bbox(bbox: Tuple[int, int, int, int], output_path: str = None) -> Optional[str]:
+        """
+        Grab a screen region and save it as PNG (any thread - no widget access)
+
+        Returns:
+            Path to saved screenshot, or None if capture failed
+        """
+        try:
+            # Import PIL ImageGrab
+            from PIL import ImageGrab
 
             # Capture screenshot of widget area
-            bbox = (x, y, x + width, y + height)
             screenshot = ImageGrab.grab(bbox)
 
             # Generate output path if not provided
@@ -424,7 +488,7 @@ class ErrorReporter:
 
             # Save screenshot
             screenshot.save(output_path, 'PNG')
-            print(f"✓ Widget screenshot saved: {output_path} ({width}x{height})")
+            print(f"✓ Widget screenshot saved: {output_path} ({bbox[2] - bbox[0]}x{bbox[3] - bbox[1]})")
             return output_path
 
         except ImportError:
@@ -436,9 +500,24 @@ class ErrorReporter:
             traceback.print_exc()
             return None
 
+    @staticmethod
+    def capture_widget_screenshot(widget, output_path: str = None) -> Optional[str]:
+        """
+        Capture a screenshot of a CustomTkinter widget and save as PNG
+
+        Args:
+            widget: The CustomTkinter widget to capture
+            output_path: Optional path to save screenshot. If None, generates temp path.
+
+        Returns:
+            Path to saved screenshot, or None if capture failed
+        """
+        bbox = ErrorReporter.widget_bbox(widget)
+        return ErrorReporter.grab_bbox(bbox, output_path) if bbox else None
+
 
 def send_error_report(report_data: dict, screenshot_path: str = None, answer_screenshot_path: str = None) -> bool:
-    """Send error report to slckr backend API"""
+    """Queue error report for the slckr backend API (v1.0.69: delivered by the outbox sender, never blocks)"""
     if not ERROR_REPORTING_ENABLED:
         print("⚠️ Error reporting disabled")
         return False
@@ -472,7 +551,8 @@ def send_error_report(report_data: dict, screenshot_path: str = None, answer_scr
             ai_response_json=ai_response_json,
             system_info_json=system_info_json,
             question_screenshot_path=screenshot_path,
-            answer_screenshot_path=answer_screenshot_path
+            answer_screenshot_path=answer_screenshot_path,
+            traceback_text=report_data.get('traceback')
         )
 
         return report_id is not None
@@ -845,7 +925,11 @@ def get_openrouter_response_streaming(api_key: str, model_name: str, image_base6
         }
         
         print("📡 Sending streaming request...")
-        
+
+        # v1.0.69: Per-request timings, aggregated into lib.metrics histograms by the caller
+        timings = {}
+        request_started = time.perf_counter()
+
         response = requests.post(
             "https://openrouter.ai/api/v1/chat/completions",
             headers=headers,
@@ -917,6 +1001,7 @@ def get_openrouter_response_streaming(api_key: str, model_name: str, image_base6
                             if not first_token_received:
                                 print("⚡ FIRST TOKEN RECEIVED!")
                                 first_token_received = True
+                                timings['ttft_ms'] = (time.perf_counter() - request_started) * 1000
 
                             accumulated_content += content_piece
 
@@ -931,7 +1016,9 @@ def get_openrouter_response_streaming(api_key: str, model_name: str, image_base6
 
                     except json.JSONDecodeError:
                         pass  # Ignore malformed chunks
-        
+
+        timings['stream_ms'] = (time.perf_counter() - request_started) * 1000
+
         # Fetch actual cost from OpenRouter generation metadata API with retry logic
         actual_cost = None
         if generation_id:
@@ -977,7 +1064,9 @@ def get_openrouter_response_streaming(api_key: str, model_name: str, image_base6
         # Parse final accumulated JSON
         print("🔄 Parsing final response...")
         try:
+            parse_started = time.perf_counter()
             parsed_content = json.loads(accumulated_content)
+            timings['parse_ms'] = (time.perf_counter() - parse_started) * 1000
 
             # Normalize response: some models return array directly instead of object
             if isinstance(parsed_content, list):
@@ -999,13 +1088,15 @@ def get_openrouter_response_streaming(api_key: str, model_name: str, image_base6
             # Add metadata
             parsed_content['_usage_data'] = usage_data
             parsed_content['_generation_id'] = generation_id
+            parsed_content['_timings'] = timings
             return parsed_content
         except json.JSONDecodeError as e:
             return {
                 "status": "ERROR_PROCESSING_FAILED",
                 "error_message": f"JSON parsing error: {e}",
                 "_usage_data": usage_data,
-                "_generation_id": generation_id
+                "_generation_id": generation_id,
+                "_timings": timings
             }
     
     except requests.exceptions.Timeout:
@@ -1366,7 +1457,7 @@ class UpdateModal(ctk.CTkToplevel):
         # Use after() to ensure thread safety
         self.after(0, _update)
 
-    def mark_complete(self):
+    def mark_complete(self, message: str = "Update installed successfully!"):
         """Mark update as complete and enable restart button"""
         def _complete():
             self.update_complete = True
@@ -1374,7 +1465,7 @@ class UpdateModal(ctk.CTkToplevel):
             if self.success_icon:
                 self.status_icon_label.configure(image=self.success_icon)
             # Update text
-            self.status_label.configure(text="Update installed successfully!")
+            self.status_label.configure(text=message)
             self.progress_bar.set(1.0)
             self.progress_label.configure(text="100%")
             self.restart_button.configure(state="normal")
@@ -1411,6 +1502,92 @@ class UpdateModal(ctk.CTkToplevel):
             self.parent.restart_application()
 
 
+class AnswerSearchPanel(ctk.CTkToplevel):
+    """Search window for answers saved in the answer store (v1.0.69)"""
+
+    SEARCH_DELAY_MS = 150  # Debounce while typing
+
+    def __init__(self, parent, store, on_use, current_match: Optional[dict] = None):
+        super().__init__(parent)
+
+        self.store = store
+        self.on_use = on_use
+        self.current_match = current_match
+        self._search_job = None
+
+        self.title("Past Answers")
+        self.geometry("640x560")
+        self.transient(parent)
+
+        self.query_var = ctk.StringVar()
+        search_entry = ctk.CTkEntry(self, textvariable=self.query_var, placeholder_text="Search questions, answers and explanations...")
+        search_entry.pack(fill="x", padx=15, pady=(15, 5))
+        search_entry.focus_set()
+        self.query_var.trace_add("write", lambda *args: self._schedule_search())
+
+        self.status_label = ctk.CTkLabel(self, text="", font=("Segoe UI", 10), text_color=("gray50", "gray60"), anchor="w")
+        self.status_label.pack(fill="x", padx=15)
+
+        self.results_frame = ctk.CTkScrollableFrame(self)
+        self.results_frame.pack(fill="both", expand=True, padx=15, pady=(5, 15))
+        self.results_frame.grid_columnconfigure(0, weight=1)
+
+        self._run_search()
+
+    def _schedule_search(self):
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(self.SEARCH_DELAY_MS, self._run_search)
+
+    def _run_search(self):
+        self._search_job = None
+        query = self.query_var.get().strip()
+        started = time.perf_counter()
+        try:
+            results = self.store.search(query)
+        except Exception as e:
+            self.status_label.configure(text=f"Search failed: {e}")
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        for widget in self.results_frame.winfo_children():
+            widget.destroy()
+
+        row = 0
+        if self.current_match and not query:
+            self._add_result(row, self.current_match, highlight=True)
+            row += 1
+        for result in results:
+            if self.current_match and not query and result["id"] == self.current_match["id"]:
+                continue
+            self._add_result(row, result)
+            row += 1
+
+        label = "recent answers" if not query else f"matches for \"{query}\""
+        self.status_label.configure(text=f"{len(results)} {label} ({elapsed_ms:.1f} ms)")
+
+    def _add_result(self, row: int, result: dict, highlight: bool = False):
+        frame = ctk.CTkFrame(self.results_frame, fg_color=("#E8F5E9", "#1a311a") if highlight else ("gray90", "gray20"))
+        frame.grid(row=row, column=0, sticky="ew", pady=4)
+        frame.grid_columnconfigure(0, weight=1)
+
+        title = "Same screenshot answered before" if highlight else (result.get("question") or "(no question text)")
+        ctk.CTkLabel(frame, text=title[:200], font=("Segoe UI", 12, "bold"), anchor="w", justify="left", wraplength=470).grid(row=0, column=0, sticky="w", padx=10, pady=(8, 0))
+
+        detail = result.get("question") if highlight else result.get("snippet")
+        if detail:
+            ctk.CTkLabel(frame, text=str(detail)[:300], font=("Segoe UI", 11), anchor="w", justify="left", wraplength=470).grid(row=1, column=0, sticky="w", padx=10)
+
+        meta = [datetime.fromtimestamp(result["created_at"]).strftime("%Y-%m-%d %H:%M")]
+        if result.get("model"):
+            meta.append(MODEL_DISPLAY_NAMES.get(result["model"], result["model"]))
+        if result.get("used_count"):
+            meta.append(f"reused {result['used_count']}×")
+        ctk.CTkLabel(frame, text=" • ".join(meta), font=("Segoe UI", 9), text_color=("gray50", "gray60"), anchor="w").grid(row=2, column=0, sticky="w", padx=10, pady=(0, 8))
+
+        ctk.CTkButton(frame, text="Use", width=60, height=28, command=lambda answer_id=result["id"]: self.on_use(answer_id)).grid(row=0, column=1, rowspan=3, padx=10)
+
+
 class HomeworkApp(ctk.CTk):
     def __init__(self):
         # Set appearance BEFORE creating window for macOS compatibility
@@ -1425,6 +1602,7 @@ class HomeworkApp(ctk.CTk):
         self.api_key_var = ctk.StringVar(); self.selected_model_var = ctk.StringVar()
         self.visual_enhancement_enabled = ctk.BooleanVar(value=True)  # Toggle for visual enhancement
         self.original_pil_image_for_crop = None; self.displayed_ctk_image_size = None
+        self.crop_stack = None  # v1.0.69: Crop rectangles over original_pil_image_for_crop (never modified)
         self.current_image_path = None; self.current_dropdown_data = []
         self.current_image_base64 = None  # Cached base64 encoding for performance
         self.current_image_base64_path = None  # Track which image the base64 cache is for
@@ -1446,6 +1624,12 @@ class HomeworkApp(ctk.CTk):
         self.console_buffer = []
         self.console_buffer_max_size = 200
 
+        # v1.0.69: Last uncaught exception (Tk callbacks and background threads) - error
+        # reports send its traceback so the server can group them by stack frames
+        self.last_exception = None
+        self._previous_thread_excepthook = threading.excepthook
+        threading.excepthook = self._on_thread_exception
+
         # Capture thread management
         self.capture_thread = None
         self.capture_cancelled = threading.Event()
@@ -1454,6 +1638,26 @@ class HomeworkApp(ctk.CTk):
         self.ai_thread = None
         self.ai_cancelled = threading.Event()
 
+        # v1.0.69: Structural record of the answer display (error reports serialize this
+        # instead of walking the live widget tree)
+        self.render_model = AnswerRenderModel()
+
+        # v1.0.69: Answered questions of this session (back/forward redraws them from memory)
+        self.answer_history = AnswerHistory()
+        self._history_records_pending = 0  # Entries being prepared off the Tk thread
+
+        # v1.0.69: Display-sized screenshots are cached per (image, size, theme) and refined at idle
+        self.display_image_cache = DisplayImageCache(lambda img: ctk.CTkImage(light_image=img, dark_image=img, size=img.size))
+        self._displayed_source = None  # (source PIL image, cache key or None) shown in the screenshot label
+        self._screenshot_refine_job = None
+        self._screenshot_resize_job = None
+
+        # v1.0.69: Answers persist across sessions in a searchable store (opened on first use)
+        self._answer_store = None
+        self._answer_store_failed = False
+        self.stored_answer_match = None  # Stored answer for the current screenshot, if any
+        self.answer_search_panel = None
+
         # Load version synchronously (before any threads that might need it)
         self.current_version = self._load_version()
 
@@ -1570,7 +1774,20 @@ class HomeworkApp(ctk.CTk):
             fg_color="#E74C3C",
             hover_color="#C0392B"
         )
-        self.report_error_button.grid(row=1, column=0, columnspan=2, padx=0, pady=(5, 0), sticky="ew")
+        self.report_error_button.grid(row=1, column=0, padx=(0, 5), pady=(5, 0), sticky="ew")
+
+        # Past Answers button (v1.0.69: search the answer store)
+        self.past_answers_button = ctk.CTkButton(
+            utility_frame,
+            text="Past Answers",
+            command=self.open_answer_search,
+            height=utility_height,
+            font=utility_font,
+            corner_radius=6,
+            fg_color=("#7B68EE", "#5B4BC4"),
+            hover_color=("#6A5ACD", "#483D8B")
+        )
+        self.past_answers_button.grid(row=1, column=1, padx=(5, 0), pady=(5, 0), sticky="ew")
 
         # Re-crop button will be added dynamically to screenshot area (not here)
         settings_outer_frame = ctk.CTkFrame(self.left_panel); settings_outer_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=(10,5)); settings_outer_frame.grid_columnconfigure(0, weight=1)
@@ -1608,27 +1825,6 @@ class HomeworkApp(ctk.CTk):
         
         self.load_config()
 
-        # Send telemetry ping on app startup (non-blocking)
-        if API_CLIENT_AVAILABLE:
-            try:
-                def send_telemetry_async():
-                    try:
-                        api_client = SlckrAPIClient()
-
-                        # Get system info for telemetry
-                        os_name = platform.system()
-                        python_version = sys.version.split()[0]  # Get just version number
-
-                        # Send telemetry with all required parameters (use pre-loaded version)
-                        api_client.send_telemetry(self.current_version, os_name, python_version)
-                    except Exception as e:
-                        print(f"⚠️ Telemetry failed: {e}")
-
-                telemetry_thread = threading.Thread(target=send_telemetry_async, daemon=True)
-                telemetry_thread.start()
-            except Exception as e:
-                print(f"⚠️ Could not start telemetry: {e}")
-
         self.save_settings_button = ctk.CTkButton(settings_outer_frame, text="Save Settings", command=self.save_config, height=30, font=("Segoe UI", 12)); self.save_settings_button.pack(pady=(10,10), padx=10, fill="x")
         
         self.log_label = ctk.CTkLabel(self.left_panel, text="Activity Log", font=ctk.CTkFont(family="Segoe UI", size=12, weight="bold")); self.log_label.grid(row=2, column=0, padx=10, pady=(10,2), sticky="nw")
@@ -1641,12 +1837,6 @@ class HomeworkApp(ctk.CTk):
         )
         self.activity_log.grid(row=3, column=0, sticky="nsew", padx=10, pady=(0,10))
         
-        # Auto-check balance
-        threading.Thread(target=self.refresh_account_balance, daemon=True).start()
-
-        # Auto-check for updates
-        threading.Thread(target=self.check_for_updates_on_startup, daemon=True).start()
-
         # Create right panel
         self.right_panel = ctk.CTkFrame(self, corner_radius=0)
         self.right_panel.grid(row=0, column=1, sticky="nsew", padx=(5,10), pady=10)
@@ -1654,12 +1844,31 @@ class HomeworkApp(ctk.CTk):
         self.screenshot_area_frame = ctk.CTkFrame(self.right_panel, fg_color="transparent"); self.screenshot_area_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=(10,5))
         self.screenshot_area_frame.grid_columnconfigure(0, weight=1); self.screenshot_area_frame.grid_rowconfigure(0, weight=0); self.screenshot_area_frame.grid_rowconfigure(1, weight=1)
         self.screenshot_label_text = ctk.CTkLabel(self.screenshot_area_frame, text="Captured Screenshot", font=ctk.CTkFont(family="Segoe UI", size=12, weight="bold")); self.screenshot_label_text.grid(row=0, column=0, padx=0, pady=(0,5), sticky="nw")
+        # v1.0.69: Crop controls - crop to the selection, undo/redo back towards the original capture
+        crop_controls_frame = ctk.CTkFrame(self.screenshot_area_frame, fg_color="transparent"); crop_controls_frame.grid(row=0, column=0, padx=0, pady=(0,5), sticky="ne")
+        self.crop_undo_button = ctk.CTkButton(crop_controls_frame, text="↶", width=28, height=24, font=("Segoe UI", 12), command=self.undo_crop, state="disabled"); self.crop_undo_button.pack(side="left")
+        self.crop_redo_button = ctk.CTkButton(crop_controls_frame, text="↷", width=28, height=24, font=("Segoe UI", 12), command=self.redo_crop, state="disabled"); self.crop_redo_button.pack(side="left", padx=(4,0))
+        self.recrop_button = ctk.CTkButton(crop_controls_frame, text="✂ Crop to Selection", height=24, font=("Segoe UI", 10), command=self.trigger_recrop, state="disabled"); self.recrop_button.pack(side="left", padx=(8,0))
         self.screenshot_display_frame = ctk.CTkFrame(self.screenshot_area_frame, fg_color=("gray92", "gray17"), border_width=1, border_color=("gray80", "gray25")); self.screenshot_display_frame.grid(row=1, column=0, sticky="nsew")
         self.screenshot_display_frame.grid_propagate(False); self.screenshot_display_frame.grid_columnconfigure(0, weight=1); self.screenshot_display_frame.grid_rowconfigure(0, weight=1)
         self._create_screenshot_image_label_with_children()
+        self.screenshot_display_frame.bind("<Configure>", self._on_screenshot_area_configure, add="+")
         self.answer_list_frame = ctk.CTkFrame(self.right_panel, fg_color="transparent"); self.answer_list_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=(5,10))
         self.answer_list_frame.grid_columnconfigure(0, weight=1); self.answer_list_frame.grid_rowconfigure(0, weight=0); self.answer_list_frame.grid_rowconfigure(1, weight=1)
         self.answer_list_label = ctk.CTkLabel(self.answer_list_frame, text="AI Generated Answers", font=ctk.CTkFont(family="Segoe UI", size=12, weight="bold")); self.answer_list_label.grid(row=0, column=0, padx=0, pady=(5,5), sticky="nw")
+
+        # v1.0.69: Answer history navigation (also Alt+Left / Alt+Right)
+        history_nav_frame = ctk.CTkFrame(self.answer_list_frame, fg_color="transparent")
+        history_nav_frame.grid(row=0, column=0, padx=0, pady=(5,5), sticky="ne")
+        self.history_back_button = ctk.CTkButton(history_nav_frame, text="◀", width=28, height=24, font=("Segoe UI", 11), command=self.show_previous_answer, state="disabled")
+        self.history_back_button.pack(side="left")
+        self.history_position_label = ctk.CTkLabel(history_nav_frame, text="", width=48, font=("Segoe UI", 10), text_color=("gray50", "gray60"))
+        self.history_position_label.pack(side="left", padx=4)
+        self.history_forward_button = ctk.CTkButton(history_nav_frame, text="▶", width=28, height=24, font=("Segoe UI", 11), command=self.show_next_answer, state="disabled")
+        self.history_forward_button.pack(side="left")
+        self.bind("<Alt-Left>", lambda event: self.show_previous_answer())
+        self.bind("<Alt-Right>", lambda event: self.show_next_answer())
+        self.bind("<Control-Shift-E>", lambda event: self.create_error_report(include_widget_tree=True))
         self.answer_scroll_frame = ctk.CTkScrollableFrame(self.answer_list_frame, border_width=1, border_color=("gray80", "gray25")); self.answer_scroll_frame.grid(row=1, column=0, sticky="nsew"); self.answer_scroll_frame.grid_columnconfigure(0, weight=1)
         self.initial_answer_message = ctk.CTkLabel(self.answer_scroll_frame, text="Answers will appear here.", text_color=("gray60", "gray40")); self.initial_answer_message.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
 
@@ -1675,20 +1884,82 @@ class HomeworkApp(ctk.CTk):
 
         self.update_idletasks()
 
+        # v1.0.69: Background startup work runs through one scheduler after first paint
+        # (balance, update check, temp cleanup, telemetry, EasyOCR warm-up)
+        self.startup_scheduler = StartupScheduler()
+        self._register_startup_tasks()
+        self.startup_scheduler.start_after_first_paint(self)
+
+        # v1.0.69: Performance histograms go out in periodic batches (and once more at exit)
+        self._metrics_client = None
+        if API_CLIENT_AVAILABLE:
+            self.after(METRICS_FLUSH_INTERVAL_MS, self._flush_metrics_periodically)
+            atexit.register(self._flush_metrics_at_exit)
+        atexit.register(self._close_answer_store)
+
+        print("✅ GUI Initialized. Ready to capture.")
+
+    def _register_startup_tasks(self):
+        """Register background startup tasks (run after the window has painted)"""
+        scheduler = self.startup_scheduler
+
+        # User-visible results first: balance label and update prompt
+        scheduler.add("balance", self.refresh_account_balance, priority=10, resource="network")
+        if AUTO_UPDATER_AVAILABLE:
+            scheduler.add("update_check", self.check_for_updates_on_startup, priority=20, resource="network")
+
         # Clean up old temp files from previous sessions
-        self._cleanup_temp_files()
+        scheduler.add("temp_cleanup", self._cleanup_temp_files, priority=30, resource="disk")
+
+        # Telemetry ping waits for the user-visible network requests
+        if API_CLIENT_AVAILABLE:
+            scheduler.add("telemetry", self._send_startup_telemetry, priority=90, resource="network",
+                          depends_on=["balance"])
+
+        # Pre-warm EasyOCR for instant hot spot detection (v1.0.33)
+        # The model loads in the OCR worker process (3-8s) - by the time user clicks "Get AI Answer", OCR will be ready
+        if module_available("easyocr"):
+            def warm_up_ocr():
+                from lib.edmentum import initialize_easyocr
+                initialize_easyocr()
+            scheduler.add("ocr_warmup", warm_up_ocr, priority=50, resource="cpu")
 
-        # Pre-warm EasyOCR in background for instant hot spot detection (v1.0.33)
-        # This runs asynchronously and doesn't block UI - initialization takes 3-8s
-        # By the time user clicks "Get AI Answer", OCR will be ready with zero latency
+        scheduler.on_complete(scheduler.print_timings)
+
+    def _send_startup_telemetry(self):
+        """Send telemetry ping on app startup"""
         try:
-            from lib.edmentum import initialize_easyocr_async
-            initialize_easyocr_async()
-            print("🚀 EasyOCR pre-warming started in background (hot spot detection will be instant)")
+            api_client = SlckrAPIClient()
+
+            # Get system info for telemetry
+            os_name = platform.system()
+            python_version = sys.version.split()[0]  # Get just version number
+
+            # Send telemetry with all required parameters (use pre-loaded version)
+            api_client.send_telemetry(self.current_version, os_name, python_version)
         except Exception as e:
-            print(f"⚠️ Could not start EasyOCR pre-warming: {e}")
+            print(f"⚠️ Telemetry failed: {e}")
 
-        print("✅ GUI Initialized. Ready to capture.")
+    def _flush_metrics(self):
+        """Queue everything lib.metrics recorded since the last flush as one batch"""
+        batch = get_metrics().drain()
+        if not batch:
+            return
+        try:
+            if self._metrics_client is None:
+                self._metrics_client = SlckrAPIClient()
+            self._metrics_client.send_metrics(batch, self.current_version, platform.system())
+        except Exception as e:
+            print(f"⚠️ Could not queue metrics: {e}")
+
+    def _flush_metrics_periodically(self):
+        threading.Thread(target=self._flush_metrics, name="metrics-flush", daemon=True).start()
+        self.after(METRICS_FLUSH_INTERVAL_MS, self._flush_metrics_periodically)
+
+    def _flush_metrics_at_exit(self):
+        # The activity log widget is gone by now - print to the console instead
+        sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+        self._flush_metrics()
 
     def _load_version(self) -> str:
         """
@@ -1733,6 +2004,8 @@ class HomeworkApp(ctk.CTk):
                 # Silently ignore cleanup errors (file might be in use)
                 pass
 
+        cleaned_count += cleanup_crop_files()
+
         if cleaned_count > 0:
             print(f"🧹 Cleaned up {cleaned_count} temp screenshot file(s)")
 
@@ -1794,7 +2067,7 @@ class HomeworkApp(ctk.CTk):
             with open(CONFIG_FILE, 'w') as f: json.dump(config, f, indent=4)
             print("✅ Configuration saved."); self.save_settings_button.configure(text="Settings Saved!", fg_color="green")
             self.after(2000, lambda: self.save_settings_button.configure(text="Save Settings", fg_color=ctk.ThemeManager.theme["CTkButton"]["fg_color"]))
-            threading.Thread(target=self.refresh_account_balance, daemon=True).start()
+            self.startup_scheduler.run("balance", self.refresh_account_balance, resource="network")
         except Exception as e: print(f"Error saving config: {e}"); self.save_settings_button.configure(text="Save Failed!", fg_color="red"); self.after(2000, lambda: self.save_settings_button.configure(text="Save Settings", fg_color=ctk.ThemeManager.theme["CTkButton"]["fg_color"]))
     
     def refresh_account_balance(self):
@@ -1833,21 +2106,21 @@ class HomeworkApp(ctk.CTk):
             print(f"Balance check error: {e}")
 
     def check_for_updates_on_startup(self):
-        """Check for application updates on startup"""
+        """Check for application updates on startup and stage them in the background"""
         if not AUTO_UPDATER_AVAILABLE:
             return
 
         try:
-            # Small delay to let the UI load first
-            time.sleep(2)
-
-            update_available, new_version, changelog = check_for_updates_silent()
+            # v1.0.69: Download + verify only - the launcher swaps the files in on next start
+            staged, new_version, changelog = stage_update_silent()
 
-            if update_available:
-                print(f"🎉 Update available: v{new_version}")
+            if staged:
+                print(f"🎉 Update v{new_version} downloaded - it will be installed on next start")
 
                 # Show update modal on main thread
                 self.after(0, lambda: self._show_update_modal(new_version, changelog))
+            elif new_version:
+                print(f"⚠️ Update v{new_version} download failed. Will retry next start.")
             else:
                 print("✅ Application is up to date")
 
@@ -1855,45 +2128,30 @@ class HomeworkApp(ctk.CTk):
             print(f"⚠️ Update check failed: {e}")
 
     def _show_update_modal(self, version: str, changelog: list):
-        """Show update modal and handle update process"""
+        """Show the update modal for a staged update (restart to install)"""
         try:
-            # Create modal
             modal = UpdateModal(self, version, changelog)
 
             # Force modal to render and become visible
             modal.update_idletasks()
             modal.focus_force()
 
-            # Start update in background thread with delay
-            def perform_update():
-                try:
-                    # Wait for modal to fully render and become visible (critical!)
-                    time.sleep(1.0)
-
-                    # Progress callback
-                    def on_progress(current, total, filename, percentage):
-                        modal.update_progress(current, total, filename, percentage)
-
-                    # Apply update with progress callback
-                    success = apply_update_silent(progress_callback=on_progress)
-
-                    if success:
-                        modal.mark_complete()
-                        print("✅ Update installed! Click 'Restart Now' to use the new version.")
-                    else:
-                        modal.mark_failed("Update download failed")
-                        print("⚠️ Update download failed. You can try again later.")
-
-                except Exception as e:
-                    modal.mark_failed(f"Error: {str(e)}")
-                    print(f"❌ Update error: {e}")
-
-            # Start update thread after modal is fully rendered
-            threading.Thread(target=perform_update, daemon=True).start()
+            modal.mark_complete("Update ready - restart to install")
 
         except Exception as e:
             print(f"❌ Failed to show update modal: {e}")
 
+    def report_callback_exception(self, exc, val, tb):
+        """Uncaught exception in a Tk callback: keep it for error reports, then print it as Tk does"""
+        self.last_exception = val
+        super().report_callback_exception(exc, val, tb)
+
+    def _on_thread_exception(self, args):
+        """Uncaught exception in a background thread: keep it for error reports"""
+        if args.exc_value is not None and not isinstance(args.exc_value, SystemExit):
+            self.last_exception = args.exc_value
+        self._previous_thread_excepthook(args)
+
     def restart_application(self):
         """Restart the application after update"""
         try:
@@ -1902,12 +2160,9 @@ class HomeworkApp(ctk.CTk):
             # Save current state if needed
             self.quit()
 
-            # Get the current Python executable and script
-            python = sys.executable
-            script = sys.argv[0]
-
-            # Restart using the same Python executable
-            os.execv(python, [python, script] + sys.argv[1:])
+            # Restart using the same Python executable (Popen + exit on Windows, execv elsewhere)
+            from lib.updater import restart_process
+            restart_process()
 
         except Exception as e:
             print(f"❌ Restart failed: {e}")
@@ -2058,6 +2313,7 @@ class HomeworkApp(ctk.CTk):
             # Update the application state with NEW data
             self.current_image_path = os.path.abspath(file_path)
             self.original_pil_image_for_crop = pil_image.copy()
+            self.crop_stack = CropStack(self.original_pil_image_for_crop, self.current_image_path)
             self.current_dropdown_data = dropdown_data
             
             # Update the display
@@ -2072,13 +2328,51 @@ class HomeworkApp(ctk.CTk):
             traceback.print_exc()
             self._update_screenshot_display(None, error_msg)
             self.current_image_path = None
+            self.crop_stack = None
 
-    def _annotate_screenshot_with_boxes(self, hot_spot_answers: list) -> Optional[str]:
+    def _annotate_hot_spots_in_background(self, hot_spot_answers: list):
+        """
+        Annotate the screenshot with hot spot boxes without blocking the UI
+
+        OCR runs in the worker process; this thread only waits for it and draws
+        the boxes. The display is updated on the main thread when done.
+        """
+        image_path = self.current_image_path
+        # The crop the answer was given for - a recrop/undo/redo meanwhile makes the boxes stale
+        crop_stack = self.crop_stack
+        crop_rect = crop_stack.rect if crop_stack is not None else None
+
+        def worker():
+            processing_path = image_path
+            if crop_stack is not None and crop_stack.cropped:
+                try:
+                    processing_path = crop_stack.materialize(crop_rect)
+                except Exception as e:
+                    print(f"⚠️ Could not prepare the cropped image for hot spot detection: {e}")
+                    processing_path = None
+            annotated_path = self._annotate_screenshot_with_boxes(hot_spot_answers, processing_path) if processing_path else None
+
+            def apply():
+                crop_changed = self.crop_stack is not crop_stack or (crop_stack is not None and crop_stack.rect != crop_rect)
+                if self.current_image_path != image_path or crop_changed:
+                    print("⚠️ Screenshot changed during hot spot detection, skipping annotation")
+                elif annotated_path:
+                    self._update_screenshot_from_path(annotated_path)
+                    print("✅ Hot spot rendering complete with bounding boxes")
+                else:
+                    print("⚠️ Screenshot annotation failed, showing text answers only")
+
+            self.after(0, apply)
+
+        threading.Thread(target=worker, daemon=True, name="HotSpot-Annotate").start()
+
+    def _annotate_screenshot_with_boxes(self, hot_spot_answers: list, image_path: Optional[str] = None) -> Optional[str]:
         """
         Draw bounding boxes on current screenshot for hot spot answers using OCR detection
 
         Args:
             hot_spot_answers: List of answer dicts with content_type='hot_spot' and hotspot_data
+            image_path: Image the AI answered for (the materialized crop); defaults to the current one
 
         Returns:
             Path to annotated screenshot, or None if failed
@@ -2091,8 +2385,9 @@ class HomeworkApp(ctk.CTk):
                 print("⚠️ No screenshot or hot spot answers to annotate")
                 return None
 
-            # Load current screenshot
-            img = Image.open(self.current_image_path)
+            # Load the image the AI saw - OCR and the AI regions are relative to the crop
+            image_path = image_path or self._image_path_for_processing()
+            img = Image.open(image_path)
             original_width, original_height = img.size
             draw = ImageDraw.Draw(img)
 
@@ -2109,10 +2404,16 @@ class HomeworkApp(ctk.CTk):
                 target_labels = [ans.get('text_content', '').strip()
                                 for ans in hot_spot_answers if ans.get('text_content')]
 
-                # Use OCR to find exact locations
+                # AI-estimated regions - OCR only crops around these (v1.0.69)
+                regions = {ans.get('text_content', '').strip(): ans.get('hotspot_data')
+                           for ans in hot_spot_answers
+                           if ans.get('text_content') and ans.get('hotspot_data')}
+
+                # Use OCR to find exact locations (results cached per image hash)
                 detected_boxes = detect_hotspot_locations(
-                    self.current_image_path,
-                    target_labels
+                    image_path,
+                    target_labels,
+                    regions=regions
                 )
 
                 # Draw boxes at OCR-detected locations
@@ -2232,22 +2533,19 @@ class HomeworkApp(ctk.CTk):
             image_path: Path to image file to display
         """
         try:
-            from PIL import Image
-
             if not image_path or not os.path.exists(image_path):
                 print(f"⚠️ Image path does not exist: {image_path}")
                 return
 
-            # Load image
-            pil_image = Image.open(image_path)
-
             # Update screenshot display (doesn't clear answers)
             if hasattr(self, 'screenshot_image_label') and self.screenshot_image_label.winfo_exists():
-                # Convert PIL to CTkImage for display
-                from customtkinter import CTkImage
-                ctk_image = CTkImage(light_image=pil_image, dark_image=pil_image, size=(600, 400))
-                self.screenshot_image_label.configure(image=ctk_image, text="")
-                self.screenshot_image_label.image = ctk_image  # Keep reference
+                # v1.0.69: Fit the screenshot area (was a fixed 600x400) through the display cache;
+                # Image.open only reads the header, JPEGs are then decoded at reduced scale
+                pil_image = Image.open(image_path)
+                size = self._screenshot_fit_size(*pil_image.size)
+                draft_for_display(pil_image, size)
+                self.displayed_ctk_image_size = size
+                self._show_cached_screenshot(pil_image, size, key=f"{image_path}|{os.path.getmtime(image_path)}")
                 print(f"📸 Updated screenshot display from: {os.path.basename(image_path)}")
 
             # Update current_image_path
@@ -2258,22 +2556,46 @@ class HomeworkApp(ctk.CTk):
             import traceback
             traceback.print_exc()
 
-    def create_error_report(self):
-        """Generate and send error report automatically"""
+    def create_error_report(self, include_widget_tree: bool = False):
+        """Generate and send error report automatically (Ctrl+Shift+E: with the live widget tree)"""
         try:
-            print("📤 Sending error report to developer...")
+            print("📤 Sending error report to developer..." if not include_widget_tree
+                  else "📤 Sending error report with the live widget tree to developer...")
 
-            # Create report
-            report = ErrorReporter.create_report(self)
+            # v1.0.69: Only cheap copies on the Tk thread - the report is serialized, the
+            # answer area grabbed and the report queued on a background thread
+            state = ErrorReporter.snapshot_state(self, include_widget_tree=include_widget_tree)
 
             # Capture question screenshot (if available)
             screenshot_path = self.current_image_path if hasattr(self, 'current_image_path') else None
 
-            # Capture answer screenshot (AI Generated Answers container)
-            answer_screenshot_path = None
+            # Answer screenshot region (AI Generated Answers container)
+            answer_bbox = None
             if hasattr(self, 'answer_scroll_frame') and self.answer_scroll_frame.winfo_exists():
+                answer_bbox = ErrorReporter.widget_bbox(self.answer_scroll_frame)
+
+            threading.Thread(
+                target=self._send_error_report_in_background,
+                args=(state, screenshot_path, answer_bbox),
+                name="error-report",
+                daemon=True
+            ).start()
+
+        except Exception as e:
+            print(f"❌ Error reporting failed: {e}")
+            import traceback
+            traceback.print_exc()
+
+    def _send_error_report_in_background(self, state: dict, screenshot_path: Optional[str],
+                                         answer_bbox: Optional[Tuple[int, int, int, int]]):
+        """Build, screenshot and queue an error report (background thread)"""
+        try:
+            report = ErrorReporter.build_report(state)
+
+            answer_screenshot_path = None
+            if answer_bbox:
                 print("📸 Capturing answer container screenshot...")
-                answer_screenshot_path = ErrorReporter.capture_widget_screenshot(self.answer_scroll_frame)
+                answer_screenshot_path = ErrorReporter.grab_bbox(answer_bbox)
                 if answer_screenshot_path:
                     print(f"✓ Answer screenshot captured: {answer_screenshot_path}")
                 else:
@@ -2283,9 +2605,9 @@ class HomeworkApp(ctk.CTk):
             success = send_error_report(report, screenshot_path, answer_screenshot_path)
 
             if success:
-                print("✅ Error report sent automatically!")
+                print("✅ Error report queued - it will be sent in the background")
             else:
-                print("❌ Could not send report - check network connection")
+                print("❌ Could not queue error report")
 
         except Exception as e:
             print(f"❌ Error reporting failed: {e}")
@@ -2424,21 +2746,54 @@ class HomeworkApp(ctk.CTk):
         self.active_drag_mode = None; self.drag_start_mouse_pos_relative_to_image = None; self.drag_start_selection_coords = None; self.drag_start_mouse_root_pos = None
 
     def trigger_recrop(self):
-        if not self.original_pil_image_for_crop or not self.crop_selection_coords or not self.displayed_ctk_image_size: print("ERROR: Missing data for re-crop."); return
-        sel_x1,sel_y1,sel_x2,sel_y2 = self.crop_selection_coords
-        orig_w,orig_h=self.original_pil_image_for_crop.size; disp_w,disp_h=self.displayed_ctk_image_size
-        if disp_w<=0 or disp_h<=0: print("ERROR: Displayed image has zero dimension."); return
-        sc_x=orig_w/disp_w; sc_y=orig_h/disp_h; cx1,cy1=int(sel_x1*sc_x),int(sel_y1*sc_y); cx2,cy2=int(sel_x2*sc_x),int(sel_y2*sc_y)
-        final_cx1=max(0,min(cx1,orig_w)); final_cy1=max(0,min(cy1,orig_h)); final_cx2=max(0,min(cx2,orig_w)); final_cy2=max(0,min(cy2,orig_h))
-        if final_cx1 >= final_cx2 or final_cy1 >= final_cy2: print(f"ERROR: Invalid Pillow crop dims: ({final_cx1},{final_cy1},{final_cx2},{final_cy2})"); return
+        """Crop to the selection - v1.0.69: pushes a rectangle on the crop stack; the capture is not modified and nothing is encoded here"""
+        if not self.crop_stack or not self.crop_selection_coords or not self.displayed_ctk_image_size: print("ERROR: Missing data for re-crop."); return
+        if self._crop_change_blocked(): return
+        if self.crop_stack.push_selection(self.crop_selection_coords, self.displayed_ctk_image_size) is None: print(f"ERROR: Invalid crop selection: {self.crop_selection_coords}"); return
+        self._show_crop_view("Re-cropped")
+
+    def undo_crop(self):
+        if not self.crop_stack or not self.crop_stack.can_undo() or self._crop_change_blocked(): return
+        self.crop_stack.undo(); self._show_crop_view("Crop undone")
+
+    def redo_crop(self):
+        if not self.crop_stack or not self.crop_stack.can_redo() or self._crop_change_blocked(): return
+        self.crop_stack.redo(); self._show_crop_view("Crop redone")
+
+    def _crop_change_blocked(self) -> bool:
+        """A running capture/AI request owns the screenshot - the crop cannot change under it"""
+        if self._history_navigation_blocked():
+            print("⏳ Wait for the current capture or AI request to finish before changing the crop")
+            return True
+        return False
+
+    def _show_crop_view(self, action: str):
+        """Display the crop stack's current view (cropped pixels come from the in-memory original)"""
         try:
-            cropped_img=self.original_pil_image_for_crop.crop((final_cx1,final_cy1,final_cx2,final_cy2)); self.original_pil_image_for_crop=cropped_img.copy()
-            if self.current_image_path and "_recropped_temp" not in self.current_image_path and "_capture" not in self.current_image_path: base, ext = os.path.splitext(self.current_image_path); self.current_image_path = f"{base}_recropped_temp{ext}"
-            elif not self.current_image_path : self.current_image_path = "recropped_image_from_unknown_source.png"
-            self.original_pil_image_for_crop.save(self.current_image_path); print(f"Re-cropped: {self.current_image_path}, New Size: {self.original_pil_image_for_crop.size}");
-            self._update_screenshot_display(self.original_pil_image_for_crop); self._update_answer_textbox(f"Re-cropped. New dims: {self.original_pil_image_for_crop.size}",False)
+            view = self.crop_stack.view(); x1, y1, x2, y2 = self.crop_stack.rect
+            print(f"✂️ {action}: {x2 - x1}x{y2 - y1} at ({x1}, {y1}) of the original (crop depth {self.crop_stack.depth})")
+            self._update_screenshot_display(view); self._update_answer_textbox(f"{action}. New dims: {view.size}", False)
         except Exception as e: print(f"Error re-crop/display: {e}"); traceback.print_exc(); self._update_answer_textbox(f"Error during re-crop: {e}",False)
 
+    def _update_crop_buttons(self):
+        """Enable undo/redo when the crop stack allows it and an image is shown"""
+        if not hasattr(self, 'crop_undo_button'): return
+        shown = self.crop_stack is not None and self._displayed_source is not None
+        self.crop_undo_button.configure(state="normal" if shown and self.crop_stack.can_undo() else "disabled")
+        self.crop_redo_button.configure(state="normal" if shown and self.crop_stack.can_redo() else "disabled")
+
+    def _processed_image_path(self) -> Optional[str]:
+        """File of the image as sent to the AI, if it exists yet (never encodes - safe on the Tk thread)"""
+        if self.crop_stack is not None and self.crop_stack.cropped:
+            return self.crop_stack.materialized_path()
+        return self.current_image_path
+
+    def _image_path_for_processing(self) -> Optional[str]:
+        """File of the image as the AI/OCR should see it; encodes the current crop on first use (worker threads only)"""
+        if self.crop_stack is not None and self.crop_stack.cropped:
+            return self.crop_stack.materialize()
+        return self.current_image_path
+
     def start_capture_thread(self):
         # Clear cancellation flag
         self.capture_cancelled.clear()
@@ -2500,7 +2855,8 @@ class HomeworkApp(ctk.CTk):
                 print("🛑 Capture cancelled before execution")
                 return
 
-            capture_result_data = task_function()
+            with get_metrics().timer("capture_ms"):
+                capture_result_data = task_function()
 
             # Check for cancellation after task completes
             if self.capture_cancelled.is_set():
@@ -2510,7 +2866,7 @@ class HomeworkApp(ctk.CTk):
             screenshot_path = None; error_from_capture = None
             if isinstance(capture_result_data, dict): screenshot_path = capture_result_data.get("screenshot_path"); error_from_capture = capture_result_data.get("error")
             if screenshot_path and os.path.exists(screenshot_path):
-                pil_image_result = Image.open(screenshot_path); self.current_image_path = os.path.abspath(screenshot_path); self.original_pil_image_for_crop = pil_image_result.copy()
+                pil_image_result = Image.open(screenshot_path); self.current_image_path = os.path.abspath(screenshot_path); self.original_pil_image_for_crop = pil_image_result.copy(); self.crop_stack = CropStack(self.original_pil_image_for_crop, self.current_image_path)
                 self.current_dropdown_data = capture_result_data.get("dropdowns_data", []); self.after(0, self._update_screenshot_display, pil_image_result)
                 self.after(0, self._update_answer_textbox, f"Screenshot: {os.path.basename(screenshot_path)}", False)
                 if self.current_dropdown_data: print(f"Extracted {len(self.current_dropdown_data)} dropdowns.")
@@ -2522,8 +2878,8 @@ class HomeworkApp(ctk.CTk):
                 elif isinstance(capture_result_data, dict) and not screenshot_path: final_error_message += " (No screenshot path returned)."
                 elif screenshot_path and not os.path.exists(screenshot_path): final_error_message += f" (Path '{screenshot_path}' does not exist)."
                 else: final_error_message += " (Task returned unexpected data or None)."
-                self.after(0, self._update_screenshot_display, None, final_error_message); self.current_image_path=None; self.original_pil_image_for_crop=None; self.current_dropdown_data=[]
-        except Exception as e: print(f"Error in capture task thread: {e}\n"); traceback.print_exc(); self.after(0, self._update_screenshot_display, None, f"Capture error: {e}"); self.current_image_path=None; self.original_pil_image_for_crop=None; self.current_dropdown_data=[]
+                self.after(0, self._update_screenshot_display, None, final_error_message); self.current_image_path=None; self.original_pil_image_for_crop=None; self.crop_stack=None; self.current_dropdown_data=[]
+        except Exception as e: print(f"Error in capture task thread: {e}\n"); traceback.print_exc(); self.after(0, self._update_screenshot_display, None, f"Capture error: {e}"); self.current_image_path=None; self.original_pil_image_for_crop=None; self.crop_stack=None; self.current_dropdown_data=[]
         finally:
             # Transform Cancel button back to Capture button
             def cleanup_ui():
@@ -2546,23 +2902,101 @@ class HomeworkApp(ctk.CTk):
             self.current_image_base64_path = None
             print("🔄 New screenshot loaded - previous answers and cached data cleared")
 
+            # v1.0.69: The answered question stays in the history; this is a new live view
+            self.answer_history.leave()
+            self._update_history_nav()
+            self.stored_answer_match = None
+        except tkinter.TclError as tcl_err: print(f"TCL Error: {tcl_err}\n"); traceback.print_exc();
+        except Exception as e: print(f"General Error in _update_screenshot_display: {e}\n"); traceback.print_exc();
+
+        self._render_screenshot_image(pil_image_to_display, message)
+        # After rendering: the image is loaded, so the lookup thread only reads pixels
+        if pil_image_to_display is not None and not message:
+            # A crop has no file until it is sent - fingerprint its pixels instead
+            cropped = self.crop_stack is not None and self.crop_stack.cropped
+            self._lookup_stored_answer_in_background(None if cropped else self.current_image_path, pil_image_to_display)
+        self._update_crop_buttons()
+
+    def _render_screenshot_image(self, pil_image_to_display: Image.Image = None, message: str = None): # type: ignore
+        """Show an image (or a status message) in the screenshot area, leaving answers alone"""
+        try:
+            self._displayed_source = None
             self._create_screenshot_image_label_with_children()
             if message: self.screenshot_image_label.configure(text=message, image=None); self.screenshot_image_label.image = None; self.displayed_ctk_image_size = None; self._hide_crop_visuals(); self.ai_button.configure(state="disabled"); return # type: ignore
             if pil_image_to_display is None: self.screenshot_image_label.configure(text="Processing...", image=None); self.screenshot_image_label.image = None; self.displayed_ctk_image_size = None; self._hide_crop_visuals(); self.ai_button.configure(state="disabled"); return # type: ignore
-            self.screenshot_display_frame.update_idletasks(); container_width = self.screenshot_display_frame.winfo_width(); container_height = self.screenshot_display_frame.winfo_height()
-            if container_width <= 10: container_width = 600
-            if container_height <= 10: container_height = 450
+            self.screenshot_display_frame.update_idletasks()
             img_w, img_h = pil_image_to_display.size
             if img_w == 0 or img_h == 0: self.screenshot_image_label.configure(text="Invalid image (0 size)", image=None); self.screenshot_image_label.image = None; self.displayed_ctk_image_size = None; self._hide_crop_visuals(); self.ai_button.configure(state="disabled"); return # type: ignore
-            aspect = img_w / img_h; disp_w = container_width; disp_h = int(disp_w / aspect)
-            if disp_h > container_height: disp_h = container_height; disp_w = int(disp_h * aspect)
-            disp_w, disp_h = max(1, int(disp_w)), max(1, int(disp_h)); self.displayed_ctk_image_size = (disp_w, disp_h)
-            resized_img = pil_image_to_display.resize(self.displayed_ctk_image_size, Image.Resampling.LANCZOS); new_ctk_image = ctk.CTkImage(light_image=resized_img, dark_image=resized_img, size=self.displayed_ctk_image_size)
-            self.screenshot_image_label.configure(image=new_ctk_image, text=""); self.screenshot_image_label.image = new_ctk_image; self._hide_crop_visuals() # type: ignore
+            self.displayed_ctk_image_size = self._screenshot_fit_size(img_w, img_h)
+            self._show_cached_screenshot(pil_image_to_display, self.displayed_ctk_image_size); self._hide_crop_visuals()
             if self.current_image_path and os.path.exists(self.current_image_path) and self.screenshot_image_label.image is not None: self.ai_button.configure(state="normal"); self.progress_dots.set_step(1) # type: ignore
             else: self.ai_button.configure(state="disabled")
         except tkinter.TclError as tcl_err: print(f"TCL Error: {tcl_err}\n"); traceback.print_exc();
-        except Exception as e: print(f"General Error in _update_screenshot_display: {e}\n"); traceback.print_exc();
+        except Exception as e: print(f"General Error in _render_screenshot_image: {e}\n"); traceback.print_exc();
+
+    def _screenshot_fit_size(self, img_w: int, img_h: int) -> Tuple[int, int]:
+        """Largest size with the image's aspect ratio that fits the screenshot area"""
+        container_width = self.screenshot_display_frame.winfo_width(); container_height = self.screenshot_display_frame.winfo_height()
+        if container_width <= 10: container_width = 600
+        if container_height <= 10: container_height = 450
+        aspect = img_w / img_h; disp_w = container_width; disp_h = int(disp_w / aspect)
+        if disp_h > container_height: disp_h = container_height; disp_w = int(disp_h * aspect)
+        return max(1, int(disp_w)), max(1, int(disp_h))
+
+    def _show_cached_screenshot(self, source_image, size: Tuple[int, int], key: Optional[str] = None):
+        """Show source_image at size from the display cache; a fast downscale is refined at idle"""
+        theme = ctk.get_appearance_mode()
+        ctk_image, refined = self.display_image_cache.get(source_image, size, theme, key)
+        self.screenshot_image_label.configure(image=ctk_image, text=""); self.screenshot_image_label.image = ctk_image # type: ignore
+        self._displayed_source = (source_image, key)
+
+        if self._screenshot_refine_job is not None:
+            self.after_cancel(self._screenshot_refine_job)
+            self._screenshot_refine_job = None
+        if not refined:
+            self._screenshot_refine_job = self.after(
+                SCREENSHOT_REFINE_DELAY_MS, lambda: self._refine_screenshot_in_background(source_image, size, theme, key))
+
+    def _refine_screenshot_in_background(self, source_image, size: Tuple[int, int], theme: str, key: Optional[str]):
+        """LANCZOS-resize the shown screenshot off the Tk thread, then swap it in if still shown"""
+        self._screenshot_refine_job = None
+
+        def worker():
+            try:
+                sharp = DisplayImageCache.render_refined(source_image, size)
+            except Exception as e:
+                print(f"⚠️ Screenshot refinement failed: {e}")
+                return
+
+            def apply():
+                ctk_image = self.display_image_cache.put_refined(source_image, size, theme, sharp, key)
+                still_shown = (self._displayed_source is not None and self._displayed_source[0] is source_image
+                               and self.displayed_ctk_image_size == tuple(size))
+                if still_shown and self.screenshot_image_label.winfo_exists():
+                    self.screenshot_image_label.configure(image=ctk_image); self.screenshot_image_label.image = ctk_image # type: ignore
+
+            self.after(0, apply)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_screenshot_area_configure(self, event=None):
+        """Screenshot area resized: refit the image once resizing settles"""
+        if self._screenshot_resize_job is not None:
+            self.after_cancel(self._screenshot_resize_job)
+        self._screenshot_resize_job = self.after(SCREENSHOT_RESIZE_DEBOUNCE_MS, self._refit_screenshot)
+
+    def _refit_screenshot(self):
+        self._screenshot_resize_job = None
+        if self._displayed_source is None or self.displayed_ctk_image_size is None:
+            return
+        source_image, key = self._displayed_source
+        size = self._screenshot_fit_size(*source_image.size)
+        if size == self.displayed_ctk_image_size:
+            return
+        # Crop selections are in display coordinates - drop any selection at the old size
+        self._hide_crop_visuals()
+        self.displayed_ctk_image_size = size
+        self._show_cached_screenshot(source_image, size, key)
 
     def _clear_answers(self):
         """Clear ALL answer display state including progressive containers"""
@@ -2582,6 +3016,7 @@ class HomeworkApp(ctk.CTk):
         if hasattr(self, 'skeleton_frames'):
             self.skeleton_frames.clear()
         self.progressive_boxes_rendered = 0
+        self.render_model.reset()
         
         # Reset streaming state
         self.streaming_active = False
@@ -2589,6 +3024,238 @@ class HomeworkApp(ctk.CTk):
         
         print("🧹 Answer display and state cleared")
 
+    def _record_answer_history(self, processed_data: dict, save_to_store: bool = False):
+        """Keep the answered question (thumbnail, validated response, render model) in the session history
+
+        Call after the answer is fully rendered. The thumbnail and the copies are made
+        off the Tk thread; the entry is recorded (and, with save_to_store, the answer
+        queued for the answer store) back on the Tk thread when they are ready.
+        """
+        try:
+            # v1.0.69: The answered image is the current crop; its file exists since the AI thread materialized it
+            crop_stack = self.crop_stack
+            source_image = crop_stack.view() if crop_stack is not None else self.original_pil_image_for_crop
+            crop_rect = crop_stack.rect if crop_stack is not None else None
+            shown_path = self.current_image_path
+            store_path = self._processed_image_path()
+            image_path = store_path or shown_path
+            snapshot = self.render_model.snapshot()
+            dropdown_data = self.current_dropdown_data
+        except Exception as e:
+            # History is a convenience - never let it break answer display
+            print(f"⚠️ Could not add answer to history: {e}")
+            return
+
+        def worker():
+            try:
+                thumbnail = None
+                thumbnail_bytes = 0
+                if source_image is not None:
+                    scale = min(1.0, HISTORY_THUMBNAIL_SIZE[0] / source_image.width, HISTORY_THUMBNAIL_SIZE[1] / source_image.height)
+                    thumb_size = (max(1, int(source_image.width * scale)), max(1, int(source_image.height * scale)))
+                    thumbnail = source_image.resize(thumb_size, Image.Resampling.BILINEAR, reducing_gap=2.0) if scale < 1.0 else source_image.copy()
+                    thumbnail_bytes = thumbnail.width * thumbnail.height * len(thumbnail.getbands())
+                response = copy.deepcopy(processed_data)
+                dropdowns = copy.deepcopy(dropdown_data)
+            except Exception as e:
+                print(f"⚠️ Could not add answer to history: {e}")
+                self.after(0, apply, None)
+                return
+            self.after(0, apply, (thumbnail, thumbnail_bytes, response, dropdowns))
+
+        def apply(prepared):
+            self._history_records_pending -= 1
+            if prepared is None:
+                return
+            thumbnail, thumbnail_bytes, response, dropdowns = prepared
+            try:
+                image_size = f"{source_image.width}x{source_image.height}" if source_image is not None else ""
+                self.answer_history.record(
+                    image_key=f"{image_path}|{image_size}",
+                    thumbnail=thumbnail,
+                    thumbnail_bytes=thumbnail_bytes,
+                    response=response,
+                    render_snapshot=snapshot,
+                    image_path=image_path,
+                    dropdown_data=dropdowns,
+                    model_name=snapshot.get("model"),
+                )
+                still_shown = (self.crop_stack is crop_stack and self.current_image_path == shown_path
+                               and (crop_stack is None or crop_stack.rect == crop_rect))
+                if not still_shown:
+                    self.answer_history.leave()  # Another screenshot (or crop) is the live view by now
+                self._update_history_nav()
+            except Exception as e:
+                print(f"⚠️ Could not add answer to history: {e}")
+            if save_to_store:
+                self._save_answer_to_store(response, thumbnail, store_path, snapshot.get("model"))
+
+        self._history_records_pending += 1
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _history_navigation_blocked(self) -> bool:
+        """True while a capture, AI request or history record would race with redrawing a history entry"""
+        return bool((self.ai_thread and self.ai_thread.is_alive()) or (self.capture_thread and self.capture_thread.is_alive())
+                    or self._history_records_pending)
+
+    def _update_history_nav(self):
+        """Sync the back/forward buttons and position label with the answer history"""
+        index, count = self.answer_history.position()
+        self.history_back_button.configure(state="normal" if self.answer_history.can_go_back() else "disabled")
+        self.history_forward_button.configure(state="normal" if self.answer_history.can_go_forward() else "disabled")
+        if not count:
+            self.history_position_label.configure(text="")
+        else:
+            self.history_position_label.configure(text=f"{index}/{count}" if index else f"–/{count}")
+
+    def show_previous_answer(self):
+        """Redraw the previous question from the answer history"""
+        if self._history_navigation_blocked():
+            print("⏳ Wait for the current capture/answer to finish before browsing history")
+            return
+        entry = self.answer_history.back()
+        if entry is not None:
+            self._restore_history_entry(entry)
+
+    def show_next_answer(self):
+        """Redraw the next question from the answer history"""
+        if self._history_navigation_blocked():
+            print("⏳ Wait for the current capture/answer to finish before browsing history")
+            return
+        entry = self.answer_history.forward()
+        if entry is not None:
+            self._restore_history_entry(entry)
+
+    def _restore_history_entry(self, entry):
+        """Redraw a history entry from memory (no API call, no full-size image decode)"""
+        started = time.perf_counter()
+
+        has_original = bool(entry.image_path) and os.path.exists(entry.image_path)
+        self.current_image_path = entry.image_path if has_original else None
+        self.current_image_base64 = None
+        self.current_image_base64_path = None
+        self.current_dropdown_data = copy.deepcopy(entry.dropdown_data)
+        self.stored_answer_match = None
+        # The full-size original is only decoded if the user re-crops this question
+        self.original_pil_image_for_crop = Image.open(entry.image_path) if has_original else entry.thumbnail
+        # The entry's image (a materialized crop, if it was cropped) is the new base for cropping
+        self.crop_stack = CropStack(self.original_pil_image_for_crop, self.current_image_path) if self.original_pil_image_for_crop is not None else None
+
+        if entry.thumbnail is not None:
+            self._render_screenshot_image(entry.thumbnail)
+        else:
+            self._render_screenshot_image(None, "Screenshot not kept in history")
+
+        self._render_saved_response(copy.deepcopy(entry.response))
+        self.render_model.restore(entry.render_snapshot)
+        self._update_history_nav()
+        self._update_crop_buttons()
+
+        index, count = self.answer_history.position()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"⏪ Showing question {index}/{count} from history ({elapsed_ms:.0f} ms)")
+
+    def _render_saved_response(self, response: dict):
+        """Draw a complete, already validated response (history or answer store) without streaming"""
+        analysis = response.get('initial_analysis') or {}
+        rendering_strategy = analysis.get('rendering_strategy', 'standard_fallback')
+        rendered = False
+        if EDMENTUM_RENDERER_AVAILABLE and rendering_strategy != 'standard_fallback':
+            # Same containers as a streamed answer, so the Edmentum renderer draws it the same way
+            self._clear_answers()
+            for stale_attr in ('edmentum_component', 'answer_index_map'):
+                if hasattr(self, stale_attr):
+                    delattr(self, stale_attr)
+            self.streaming_container = ctk.CTkFrame(self.answer_scroll_frame, fg_color="transparent")
+            self.streaming_container.pack(fill="both", expand=True, padx=5, pady=5)
+            self.progressive_answers_container = ctk.CTkFrame(self.streaming_container, fg_color="transparent")
+            self.progressive_answers_container.pack(fill="both", expand=True)
+            rendered = self._render_edmentum_question(analysis, response)
+        if not rendered:
+            self.display_ai_answers(response)
+
+    def _get_answer_store(self):
+        """Answer store, opened on first use (None if it can't be opened)"""
+        if self._answer_store is None and not self._answer_store_failed:
+            try:
+                self._answer_store = get_answer_store()
+            except Exception as e:
+                self._answer_store_failed = True
+                print(f"⚠️ Answer store unavailable: {e}")
+        return self._answer_store
+
+    def _save_answer_to_store(self, response: dict, thumbnail=None, image_path: Optional[str] = None,
+                              model: Optional[str] = None):
+        """Queue a successful answer (a private copy - the writer reads it off the Tk thread) for the persistent store"""
+        if str(response.get("status", "SUCCESS")).startswith("ERROR") or not response.get("answers"):
+            return
+        store = self._get_answer_store()
+        if store is None:
+            return
+        store.save_async(response, image_path=image_path, image=thumbnail, model=model)
+
+    def _lookup_stored_answer_in_background(self, image_path: Optional[str], pil_image):
+        """Check whether a new screenshot (or crop, with no file) was answered before (hashing runs off the Tk thread)"""
+        store = self._get_answer_store()
+        if store is None or not (image_path or pil_image is not None):
+            return
+        shown_path = self.current_image_path
+
+        def worker():
+            try:
+                match = store.find_image(*image_fingerprint(image_path, pil_image))
+            except Exception as e:
+                print(f"⚠️ Answer store lookup failed: {e}")
+                return
+
+            def apply():
+                if self.current_image_path != shown_path or self._displayed_source is None or self._displayed_source[0] is not pil_image:
+                    return  # Another screenshot (or crop) replaced this one meanwhile
+                self.stored_answer_match = match
+                if match:
+                    when = datetime.fromtimestamp(match["created_at"]).strftime("%Y-%m-%d %H:%M")
+                    print(f"💾 This question was answered before ({when}) - open Past Answers to reuse it")
+
+            self.after(0, apply)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def open_answer_search(self):
+        """Open (or focus) the Past Answers search window"""
+        store = self._get_answer_store()
+        if store is None:
+            self._update_answer_textbox("Answer store unavailable - see Activity Log.", False)
+            return
+        if self.answer_search_panel is not None and self.answer_search_panel.winfo_exists():
+            self.answer_search_panel.current_match = self.stored_answer_match
+            self.answer_search_panel._run_search()
+            self.answer_search_panel.lift()
+            return
+        self.answer_search_panel = AnswerSearchPanel(self, store, self.reuse_stored_answer, self.stored_answer_match)
+
+    def reuse_stored_answer(self, answer_id: int):
+        """Show a stored answer for the current question without calling the model"""
+        if self._history_navigation_blocked():
+            print("⏳ Wait for the current capture/answer to finish before reusing an answer")
+            return
+        store = self._get_answer_store()
+        response = store.get_response(answer_id) if store is not None else None
+        if response is None:
+            print(f"⚠️ Stored answer {answer_id} not found")
+            return
+
+        started = time.perf_counter()
+        self._render_saved_response(response)
+        self.render_model.finish(response, via="store")
+        self._record_answer_history(response)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"💾 Reused stored answer #{answer_id} ({elapsed_ms:.0f} ms, no model call)")
+
+    def _close_answer_store(self):
+        """Write queued answers before the app exits"""
+        if self._answer_store is not None:
+            self._answer_store.close()
+
     def _auto_scroll_to_answers(self):
         """Auto-scroll to TOP of answers container to show newly streamed AI answers"""
         try:
@@ -2725,6 +3392,7 @@ class HomeworkApp(ctk.CTk):
 
     def display_ai_answers(self, response_data):
         self._clear_answers()
+        self.render_model.finish(response_data, via="standard")
         self.answer_scroll_frame.update_idletasks()
         equation_rendered_specially = False # Flag to track if special equation rendering happened
         
@@ -2754,7 +3422,7 @@ class HomeworkApp(ctk.CTk):
                 if visual_term_count >= 3:
                     print(f"✅ Confirmed drag-to-image: {visual_term_count}/6 visual terms found")
                     try:
-                        renderer = DragToImageRenderer(self.answer_scroll_frame, self.current_image_path)
+                        renderer = DragToImageRenderer(self.answer_scroll_frame, self._processed_image_path() or self.current_image_path)
                         visual_display = renderer.create_visual_matching_display(matching_pairs)
                         visual_display.pack(fill="both", expand=True)
                         return
@@ -3291,6 +3959,7 @@ class HomeworkApp(ctk.CTk):
 
         # Skeleton tracking for progressive loading
         self.skeleton_frames = {}  # Maps answer_id to skeleton frame widget
+        self.render_model.begin(selected_model)
 
         # Reset analysis display flag for new request
         if hasattr(self, 'analysis_displayed'):
@@ -3931,9 +4600,11 @@ If any part of the question or an answer involves a numeric value that you canno
                 options_str_list = [f"'{opt.get('text','N/A')}' (value: '{opt.get('value','N/A')}')" for opt in dropdown.get('options', [])]; options_str = ", ".join(options_str_list)
                 dropdown_info_text += f"- ID '{dropdown.get('id', 'Unknown Dropdown')}': [{options_str}]\n"
             final_prompt += dropdown_info_text; print(f"📋 Appending {len(self.current_dropdown_data)} dropdown(s) to prompt")
-        threading.Thread(target=self._call_ai_api_thread_target, args=(api_key, selected_model, self.current_image_path, final_prompt),daemon=True).start()
+        self.ai_thread = threading.Thread(target=self._call_ai_api_thread_target, args=(api_key, selected_model, self.current_image_path, final_prompt),
+                                          kwargs={"crop_stack": self.crop_stack, "crop_rect": self.crop_stack.rect if self.crop_stack and self.crop_stack.cropped else None}, daemon=True)
+        self.ai_thread.start()
 
-    def _call_ai_api_thread_target(self, api_key, model_name, image_path, prompt):
+    def _call_ai_api_thread_target(self, api_key, model_name, image_path, prompt, crop_stack=None, crop_rect=None):
         start_time = time.time()
         print(f"🤖 Starting AI analysis...")
 
@@ -3949,6 +4620,24 @@ If any part of the question or an answer involves a numeric value that you canno
             ))
             return
 
+        # v1.0.69: A crop is only cut out and encoded now, on this thread (cached per crop rectangle)
+        if crop_stack is not None and crop_rect is not None:
+            try:
+                materialize_start = time.time()
+                image_path = crop_stack.materialize(crop_rect)
+                print(f"✂️ Crop ready for upload: {os.path.basename(image_path)} ({(time.time() - materialize_start) * 1000:.0f}ms)")
+            except Exception as e:
+                print(f"❌ Could not prepare the cropped image: {e}")
+                traceback.print_exc()
+                self.after(0, lambda: self.ai_button.configure(
+                    text="Get AI Answer",
+                    fg_color="#2ECC71",
+                    hover_color="#27AE60",
+                    command=self.start_ai_thread,
+                    state="normal"
+                ))
+                return
+
         # Pre-encode image with cache validation
         # CRITICAL: Validate cache is for the CORRECT image to prevent answer contamination
         if self.current_image_base64 and self.current_image_base64_path == image_path:
@@ -3958,8 +4647,7 @@ If any part of the question or an answer involves a numeric value that you canno
                 print(f"⚠️ Cache invalidated: was for '{os.path.basename(self.current_image_base64_path)}', need '{os.path.basename(image_path)}'")
             encode_start = time.time()
             print(f"🔄 Encoding image: {os.path.basename(image_path)}")
-            with open(image_path, "rb") as f:
-                self.current_image_base64 = base64.b64encode(f.read()).decode('utf-8')
+            self.current_image_base64 = encode_image_base64(image_path)
             self.current_image_base64_path = image_path  # Track which image this cache is for
 
         self.streaming_active = True
@@ -3967,6 +4655,7 @@ If any part of the question or an answer involves a numeric value that you canno
         first_render_time = None
         last_ui_update_time = [0]  # Use list for mutable reference
         pending_data = [None]  # Store pending render data
+        progressive_parse_ms = [0.0]  # Time spent in the progressive parser (parse_ms metric)
 
         # v1.0.63: Reset manual scroll state for new AI request
         self._user_manually_scrolled = False
@@ -3991,7 +4680,9 @@ If any part of the question or an answer involves a numeric value that you canno
             if PROGRESSIVE_PARSER_AVAILABLE and hasattr(self, 'progressive_parser'):
                 # Check if parser still exists (not cleared by user clicking capture during streaming)
                 if self.progressive_parser is not None:
+                    parse_started = time.perf_counter()
                     has_new, new_data = self.progressive_parser.add_chunk(chunk_text)
+                    progressive_parse_ms[0] += (time.perf_counter() - parse_started) * 1000
                     if has_new:
                         # Batch render updates - only render if enough time has passed
                         if time_since_last_update >= 0.15:  # 150ms debounce for renders
@@ -4032,9 +4723,33 @@ If any part of the question or an answer involves a numeric value that you canno
         usage_data = raw_ai_response_data.get('_usage_data', {})
         if usage_data:
             self.after(0, lambda: self.update_session_usage(usage_data))
-        
-        # PHASE 3: Finalize display
-        self.after(0, lambda: self._finalize_stream_display(raw_ai_response_data))
+
+        self._record_ai_metrics(model_name, raw_ai_response_data, progressive_parse_ms[0])
+
+        # PHASE 3: Finalize display (timed as render_ms)
+        def finalize():
+            with get_metrics().timer("render_ms"):
+                self._finalize_stream_display(raw_ai_response_data)
+        self.after(0, finalize)
+
+    def _record_ai_metrics(self, model_name: str, response_data: dict, progressive_parse_ms: float):
+        """Add one AI request's timings and outcome to the local performance histograms"""
+        metrics = get_metrics()
+        metrics.increment("ai_request", model_name)
+
+        status = response_data.get('status', '')
+        if status == "CANCELLED":
+            metrics.increment("ai_cancelled", model_name)
+            return
+        if status.startswith("ERROR_"):
+            # e.g. model_error.rate_limited, model_error.processing_failed
+            metrics.increment(f"model_error.{status[len('ERROR_'):].lower()}", model_name)
+
+        timings = response_data.get('_timings', {})
+        metrics.observe("ttft_ms", timings.get('ttft_ms'), model_name)
+        metrics.observe("stream_ms", timings.get('stream_ms'), model_name)
+        if progressive_parse_ms or 'parse_ms' in timings:
+            metrics.observe("parse_ms", progressive_parse_ms + timings.get('parse_ms', 0.0), model_name)
 
     def _create_skeleton_for_type(self, answer_type: str, answer_id: str = "", label: str = "") -> ctk.CTkFrame:
         """
@@ -4301,6 +5016,7 @@ If any part of the question or an answer involves a numeric value that you canno
         answer_structure = metadata.get("answer_structure", [])
         if not answer_structure:
             return
+        self.render_model.set_layout(strategy, question_text, answer_structure)
 
         print(f"🎨 Creating Edmentum component with {len(answer_structure)} items (seamless streaming)...")
 
@@ -4578,6 +5294,7 @@ If any part of the question or an answer involves a numeric value that you canno
             # Update status if question identified
             if "identified_question" in new_data:
                 question = new_data["identified_question"]
+                self.render_model.set_question(question)
                 if hasattr(self, 'streaming_status_label') and self.streaming_status_label.winfo_exists():
                     self.streaming_status_label.configure(text=f"📝 {question[:80]}...")
 
@@ -4684,6 +5401,9 @@ If any part of the question or an answer involves a numeric value that you canno
             answer_id: The ID of the answer/skeleton to replace
             answer_item: The complete answer data to render
         """
+        uses_component = hasattr(self, 'edmentum_component') and hasattr(self, 'answer_index_map')
+        self.render_model.set_answer(answer_item, "component" if uses_component else "skeleton")
+
         # NEW APPROACH: Update Edmentum component directly (seamless streaming)
         if hasattr(self, 'edmentum_component') and hasattr(self, 'answer_index_map'):
             # Try exact match first, then case-insensitive
@@ -4948,6 +5668,7 @@ If any part of the question or an answer involves a numeric value that you canno
         confidence = answer_item.get("confidence")
         answer_id = answer_item.get("answer_id", "")
         text_content = answer_item.get("text_content", "")
+        self.render_model.set_answer(answer_item, "direct")
 
         # Debug logging to diagnose streaming issues
         print(f"   🔍 Streaming answer: type={content_type}, id={answer_id}, is_correct={is_correct}, conf={confidence}")
@@ -5304,13 +6025,8 @@ If any part of the question or an answer involves a numeric value that you canno
                     self.hot_spot_answers
                 )
 
-                # Annotate screenshot with bounding boxes
-                annotated_path = self._annotate_screenshot_with_boxes(self.hot_spot_answers)
-                if annotated_path and hasattr(self, '_update_screenshot_from_path'):
-                    self._update_screenshot_from_path(annotated_path)
-                    print("✅ Hot spot rendering complete with bounding boxes")
-                else:
-                    print("⚠️ Screenshot annotation failed, showing text answers only")
+                # Annotate screenshot with bounding boxes (OCR runs off the UI thread)
+                self._annotate_hot_spots_in_background(list(self.hot_spot_answers))
 
             # Clean up
             del self.hot_spot_answers
@@ -5361,6 +6077,7 @@ If any part of the question or an answer involves a numeric value that you canno
         should_use_edmentum = False
         analysis = processed_data.get('initial_analysis', {})
         rendering_strategy = analysis.get('rendering_strategy', 'standard_fallback')
+        self.render_model.finish(processed_data, strategy=rendering_strategy)
 
         if EDMENTUM_RENDERER_AVAILABLE and rendering_strategy != 'standard_fallback':
             print(f"🎨 Attempting Edmentum rendering with strategy: {rendering_strategy}")
@@ -5380,6 +6097,7 @@ If any part of the question or an answer involves a numeric value that you canno
             success = self._render_edmentum_question(analysis, processed_data)
             if success:
                 print("✓ Edmentum rendering successful")
+                self._record_answer_history(processed_data, save_to_store=True)
                 # Transform Cancel button back to Get AI Answer button
                 self.ai_button.configure(
                     text="Get AI Answer",
@@ -5415,6 +6133,8 @@ If any part of the question or an answer involves a numeric value that you canno
             # Standard display (fallback) - only when content NOT already displayed
             print("⚠️ No progressive content found - using standard display")
             self.display_ai_answers(processed_data)
+        # v1.0.69: Recorded once rendering is done, so the snapshot has the final render state
+        self._record_answer_history(processed_data, save_to_store=True)
 
         # Transform Cancel button back to Get AI Answer button
         self.ai_button.configure(